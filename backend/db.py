@@ -0,0 +1,138 @@
+import asyncio
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeVar
+
+
+DB_READERS = max(1, int(os.getenv("AXIMO_DB_READERS", "4")))
+DB_BUSY_TIMEOUT_MS = int(os.getenv("AXIMO_DB_BUSY_TIMEOUT_MS", "5000"))
+DB_CACHE_SIZE_KB = int(os.getenv("AXIMO_DB_CACHE_SIZE_KB", "16384"))
+DB_MMAP_SIZE = int(os.getenv("AXIMO_DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+
+T = TypeVar("T")
+
+
+def open_connection(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=DB_BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA cache_size = -{DB_CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size = {DB_MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+
+class ConnectionPool:
+    """One serialized writer plus a bounded queue of reader connections.
+
+    WAL mode lets readers proceed while the writer holds its transaction, so
+    list/poll handlers never wait behind approve/status/run writes.
+    """
+
+    def __init__(self, path: str, readers: int = DB_READERS) -> None:
+        self.path = path
+        self._writer = open_connection(path)
+        self._writer.execute("PRAGMA journal_mode = WAL")
+        self._writer_lock = threading.RLock()
+        self._writer_depth = 0
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._all_readers: list[sqlite3.Connection] = []
+        for _ in range(readers):
+            conn = open_connection(path)
+            conn.execute("PRAGMA query_only = ON")
+            self._readers.put(conn)
+            self._all_readers.append(conn)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        with self._writer_lock:
+            conn = self._writer
+            depth = self._writer_depth
+            self._writer_depth += 1
+            try:
+                if depth:
+                    # Nested borrow on the same thread: scope it to a savepoint so its exit never
+                    # commits or rolls back the transaction the outer block still owns.
+                    yield from self._savepoint(conn, f"writer_{depth}")
+                    return
+                try:
+                    yield conn
+                except BaseException:
+                    conn.rollback()
+                    raise
+                else:
+                    conn.commit()
+            finally:
+                self._writer_depth -= 1
+
+    @staticmethod
+    def _savepoint(conn: sqlite3.Connection, name: str) -> Iterator[sqlite3.Connection]:
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute(f"ROLLBACK TO {name}")
+            conn.execute(f"RELEASE {name}")
+            raise
+        else:
+            conn.execute(f"RELEASE {name}")
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            # End any implicit read transaction so the next borrower sees fresh data.
+            if conn.in_transaction:
+                conn.rollback()
+            self._readers.put(conn)
+
+    def close(self) -> None:
+        with self._writer_lock:
+            self._writer.close()
+        for conn in self._all_readers:
+            conn.close()
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+# Async handlers hand their SQLite work to these executors instead of the shared request
+# threadpool: writes queue on the single writer thread, reads fan out over one thread per reader.
+_read_executor = ThreadPoolExecutor(max_workers=DB_READERS, thread_name_prefix="aximo-db-read")
+_write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aximo-db-write")
+
+def get_pool(path: str) -> ConnectionPool:
+    global _pool
+    if _pool is None or _pool.path != path:
+        with _pool_lock:
+            if _pool is None or _pool.path != path:
+                if _pool is not None:
+                    _pool.close()
+                _pool = ConnectionPool(path)
+    return _pool
+
+
+def close_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+async def run_read(fn: Callable[..., T], *args) -> T:
+    """Await ``fn(*args)`` on the read executor; ``fn`` borrows its own reader connection."""
+    return await asyncio.get_running_loop().run_in_executor(_read_executor, fn, *args)
+
+
+async def run_write(fn: Callable[..., T], *args) -> T:
+    """Await ``fn(*args)`` on the writer thread; ``fn`` borrows the writer connection itself."""
+    return await asyncio.get_running_loop().run_in_executor(_write_executor, fn, *args)
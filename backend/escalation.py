@@ -0,0 +1,263 @@
+import heapq
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, ContextManager, NamedTuple
+
+from pressure import DUE_SOON_MS, OPEN_STATUSES, parse_due_date
+
+
+ESCALATION_LEVELS = ("due_soon", "overdue")
+ESCALATION_POLL_SECONDS = 5.0
+ESCALATION_CHANGES_BATCH = 1000
+
+
+class Escalation(NamedTuple):
+    task_id: str
+    text: str
+    status: str
+    due_date: str
+    level: str
+
+
+def crossing_times(due_ms: int) -> dict[str, int]:
+    # Same edges as compute_time_score: due-soon once less than 24h remain, overdue once the
+    # due instant has passed. Both are strict comparisons, hence the +1 ms.
+    return {"due_soon": due_ms - DUE_SOON_MS + 1, "overdue": due_ms + 1}
+
+
+def init_task_escalations(conn: sqlite3.Connection) -> None:
+    # The last due_date each crossing was announced for, so restarts never repeat an escalation
+    # and moving a due date re-arms it.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS task_escalations (
+            task_id TEXT NOT NULL,
+            level TEXT NOT NULL,
+            due_date TEXT NOT NULL,
+            fired_at TEXT NOT NULL,
+            PRIMARY KEY (task_id, level)
+        )
+        """
+    )
+    # Crossings that already happened count as announced; otherwise the first start after this
+    # migration would escalate every overdue task at once.
+    now_ms = int(time.time() * 1000)
+    fired_at = datetime.now(timezone.utc).isoformat()
+    rows = conn.execute(
+        "SELECT id, due_date FROM tasks WHERE due_date IS NOT NULL AND due_date != ''"
+    ).fetchall()
+    past = []
+    for row in rows:
+        due = parse_due_date(row["due_date"])
+        if due is None:
+            continue
+        for level, at_ms in crossing_times(int(due.timestamp() * 1000)).items():
+            if at_ms <= now_ms:
+                past.append((row["id"], level, row["due_date"], fired_at))
+    conn.executemany("INSERT OR IGNORE INTO task_escalations VALUES (?, ?, ?, ?)", past)
+
+
+class EscalationScheduler:
+    """Background thread that fires due-soon/overdue escalations when a task crosses the edge.
+
+    Every open task with a due date has one min-heap entry per future crossing, so the
+    thread sleeps exactly until the next one. Changes are picked up from task_changes;
+    re-tracking a task is O(log n) and older heap entries are skipped lazily through a
+    per-task generation number.
+
+    ``on_fire(conn, escalations)`` runs inside the same write transaction that records the
+    crossings, so event rows and outbox messages commit together with them.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], ContextManager[sqlite3.Connection]],
+        read: Callable[[], ContextManager[sqlite3.Connection]],
+        on_fire: Callable[[sqlite3.Connection, list[Escalation]], None],
+        poll_seconds: float = ESCALATION_POLL_SECONDS,
+    ) -> None:
+        self._connect = connect
+        self._read = read
+        self._on_fire = on_fire
+        self._poll_seconds = poll_seconds
+        self._heap: list[tuple[int, str, int, str]] = []
+        self._generation: dict[str, int] = {}
+        self._next_generation = 1
+        self._rev = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="task-escalations", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def __len__(self) -> int:
+        return len(self._generation)
+
+    def _run(self) -> None:
+        loaded = False
+        while not self._stop.is_set():
+            try:
+                if not loaded:
+                    self.load()
+                    loaded = True
+                self.poll_changes()
+                self.fire_due()
+            except Exception as e:
+                print(f"ESCALATION scheduler error: {repr(e)}")
+            self._wake.wait(self._sleep_seconds())
+            self._wake.clear()
+
+    def _sleep_seconds(self) -> float:
+        if not self._heap:
+            return self._poll_seconds
+        wait = (self._heap[0][0] - time.time() * 1000) / 1000
+        return min(self._poll_seconds, max(0.0, wait))
+
+    def load(self) -> None:
+        # Read the revision first: anything written during the scan is replayed by poll_changes.
+        with self._read() as conn:
+            self._rev = conn.execute("SELECT COALESCE(MAX(rev), 0) FROM task_changes").fetchone()[0]
+            rows = conn.execute(
+                f"""
+                SELECT id, status, due_date FROM tasks
+                WHERE status IN ({", ".join("?" * len(OPEN_STATUSES))})
+                  AND due_date IS NOT NULL AND due_date != ''
+                """,
+                OPEN_STATUSES,
+            ).fetchall()
+        self._heap = []
+        self._generation = {}
+        for row in rows:
+            self._push(row["id"], row["status"], row["due_date"], heapify=False)
+        heapq.heapify(self._heap)
+
+    def track(self, task_id: str, status: str | None, due_date: str | None) -> None:
+        """Replace whatever is scheduled for ``task_id``; a None status means the task is gone."""
+        self._generation.pop(task_id, None)
+        if status is not None:
+            self._push(task_id, status, due_date, heapify=True)
+
+    def _push(self, task_id: str, status: str, due_date: str | None, heapify: bool) -> None:
+        if status not in OPEN_STATUSES:
+            return
+        due = parse_due_date(due_date)
+        if due is None:
+            return
+        generation = self._generation[task_id] = self._next_generation
+        self._next_generation += 1
+        for level, at_ms in crossing_times(int(due.timestamp() * 1000)).items():
+            # Past crossings are pushed too; the task_escalations check drops those already sent.
+            entry = (at_ms, task_id, generation, level)
+            if heapify:
+                heapq.heappush(self._heap, entry)
+            else:
+                self._heap.append(entry)
+        if heapify and len(self._heap) > 4 * len(self._generation) + 1024:
+            # Superseded entries are only skipped when popped; drop them once they dominate.
+            self._heap = [entry for entry in self._heap if self._generation.get(entry[1]) == entry[2]]
+            heapq.heapify(self._heap)
+
+    def poll_changes(self) -> int:
+        with self._read() as conn:
+            changed = conn.execute(
+                "SELECT task_id, rev FROM task_changes WHERE rev > ? ORDER BY rev LIMIT ?",
+                (self._rev, ESCALATION_CHANGES_BATCH),
+            ).fetchall()
+            if not changed:
+                return 0
+            ids = [row["task_id"] for row in changed]
+            rows = {
+                row["id"]: row
+                for row in conn.execute(
+                    "SELECT id, status, due_date FROM tasks WHERE id IN (SELECT value FROM json_each(?))",
+                    (json.dumps(ids),),
+                ).fetchall()
+            }
+        for task_id in ids:
+            row = rows.get(task_id)
+            self.track(task_id, row["status"] if row else None, row["due_date"] if row else None)
+        self._rev = changed[-1]["rev"]
+        if len(changed) == ESCALATION_CHANGES_BATCH:
+            self._wake.set()
+        return len(changed)
+
+    def fire_due(self) -> list[Escalation]:
+        now_ms = int(time.time() * 1000)
+        crossed: dict[str, str] = {}
+        popped: list[tuple[int, str, int, str]] = []
+        while self._heap and self._heap[0][0] <= now_ms:
+            entry = heapq.heappop(self._heap)
+            _, task_id, generation, level = entry
+            if self._generation.get(task_id) != generation:
+                continue
+            popped.append(entry)
+            # Entries for one task pop in level order, so this keeps the highest level crossed.
+            crossed[task_id] = level
+            if level == ESCALATION_LEVELS[-1]:
+                del self._generation[task_id]
+        if not crossed:
+            return []
+
+        try:
+            return self._record(crossed, now_ms)
+        except BaseException:
+            # Nothing was committed: put the crossings back so the next pass retries them.
+            for entry in popped:
+                self._generation.setdefault(entry[1], entry[2])
+                heapq.heappush(self._heap, entry)
+            raise
+
+    def _record(self, crossed: dict[str, str], now_ms: int) -> list[Escalation]:
+        fired_at = datetime.now(timezone.utc).isoformat()
+        fired: list[Escalation] = []
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, text, status, due_date FROM tasks WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(list(crossed)),),
+            ).fetchall()
+            for row in rows:
+                if row["status"] not in OPEN_STATUSES:
+                    continue
+                # Re-check against the row as it is now; a change not yet polled re-tracks the task.
+                due = parse_due_date(row["due_date"])
+                if due is None:
+                    continue
+                at = crossing_times(int(due.timestamp() * 1000))
+                reached = [level for level in ESCALATION_LEVELS if at[level] <= now_ms]
+                if not reached:
+                    continue
+                recorded = 0
+                for level in reached:
+                    recorded |= conn.execute(
+                        """
+                        INSERT INTO task_escalations (task_id, level, due_date, fired_at)
+                        VALUES (?, ?, ?, ?)
+                        ON CONFLICT(task_id, level) DO UPDATE
+                        SET due_date = excluded.due_date, fired_at = excluded.fired_at
+                        WHERE task_escalations.due_date != excluded.due_date
+                        """,
+                        (row["id"], level, row["due_date"], fired_at),
+                    ).rowcount
+                # One message per task for the highest level reached, if any level is new.
+                if recorded:
+                    fired.append(Escalation(row["id"], row["text"], row["status"], row["due_date"], reached[-1]))
+            if fired:
+                self._on_fire(conn, fired)
+        return fired
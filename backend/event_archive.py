@@ -0,0 +1,97 @@
+import gzip
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+EVENT_ARCHIVE_DIR = Path(
+    os.getenv("AXIMO_EVENT_ARCHIVE_DIR", str(Path(__file__).resolve().parent / "data" / "event_archive"))
+)
+EVENT_ARCHIVE_KEEP_MONTHS = int(os.getenv("AXIMO_EVENT_ARCHIVE_KEEP_MONTHS", "3"))
+EVENT_COLUMNS = ("id", "task_id", "event_type", "from_status", "to_status", "actor", "reason", "created_at")
+
+
+def archive_path(archive_dir: Path, month: str) -> Path:
+    return archive_dir / f"task_events-{month}.jsonl.gz"
+
+
+def shift_month(month: str, months: int) -> str:
+    index = int(month[:4]) * 12 + int(month[5:7]) - 1 + months
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def archive_cutoff(now: datetime, keep_months: int) -> str:
+    """Oldest month kept in the live table; comparing created_at < it selects everything older."""
+    return shift_month(now.strftime("%Y-%m"), -keep_months)
+
+
+def read_archived_events(archive_dir: Path, month: str, task_id: str | None = None) -> Iterator[dict]:
+    path = archive_path(archive_dir, month)
+    if not path.exists():
+        return
+    seen: set[str] = set()
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            event = json.loads(line)
+            # A run interrupted between writing a file and deleting its rows re-archives them.
+            if event["id"] in seen:
+                continue
+            seen.add(event["id"])
+            if task_id is None or event["task_id"] == task_id:
+                yield event
+
+
+def archive_month(conn: sqlite3.Connection, archive_dir: Path, month: str) -> int:
+    rows = conn.execute(
+        f"""
+        SELECT {", ".join(EVENT_COLUMNS)} FROM task_events
+        WHERE created_at >= ? AND created_at < ?
+        ORDER BY created_at, id
+        """,
+        (month, shift_month(month, 1)),
+    ).fetchall()
+    if not rows:
+        return 0
+    path = archive_path(archive_dir, month)
+    tmp = path.with_suffix(".tmp")
+    # Rewrite the month as one file (earlier runs may have archived part of it), make it
+    # durable, and only then delete the rows it now holds.
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        for event in read_archived_events(archive_dir, month):
+            f.write(json.dumps(event, separators=(",", ":")) + "\n")
+        for row in rows:
+            f.write(json.dumps(dict(zip(EVENT_COLUMNS, row)), separators=(",", ":")) + "\n")
+    with open(tmp, "rb") as f:
+        os.fsync(f.fileno())
+    tmp.replace(path)
+    conn.execute(
+        "DELETE FROM task_events WHERE created_at >= ? AND created_at < ?",
+        (month, shift_month(month, 1)),
+    )
+    conn.commit()
+    return len(rows)
+
+
+def archive_events(
+    conn: sqlite3.Connection,
+    archive_dir: Path = EVENT_ARCHIVE_DIR,
+    keep_months: int = EVENT_ARCHIVE_KEEP_MONTHS,
+    now: datetime | None = None,
+) -> dict[str, int]:
+    """Move task_events older than ``keep_months`` full months into per-month gzip JSONL files.
+
+    Returns the number of events archived per month. The live table keeps only recent
+    months, so its indexes stay small however long the log grows.
+    """
+    cutoff = archive_cutoff(now or datetime.now(timezone.utc), keep_months)
+    months = [
+        row[0]
+        for row in conn.execute(
+            "SELECT DISTINCT substr(created_at, 1, 7) FROM task_events WHERE created_at < ? ORDER BY 1",
+            (cutoff,),
+        ).fetchall()
+    ]
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    return {month: archive_month(conn, archive_dir, month) for month in months}
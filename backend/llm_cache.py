@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+LLM_CACHE_TTL_SECONDS = int(os.getenv("AXIMO_LLM_CACHE_TTL_SECONDS", str(7 * 24 * 60 * 60)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("AXIMO_LLM_CACHE_MAX_ENTRIES", "5000"))
+
+
+def init_llm_cache(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS llm_cache (
+            key TEXT PRIMARY KEY,
+            model TEXT NOT NULL,
+            template_version TEXT NOT NULL,
+            result TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            last_hit_at REAL NOT NULL,
+            hit_count INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_hit_at ON llm_cache(last_hit_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_created_at ON llm_cache(created_at)")
+
+
+def cache_key(model: str, template_version: str, prompt: str) -> str:
+    digest = hashlib.sha256()
+    for part in (model, template_version, prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class LLMResultCache:
+    """Validated model results keyed on hash(model, template version, prompt)."""
+
+    def __init__(self, ttl_seconds: int = LLM_CACHE_TTL_SECONDS, max_entries: int = LLM_CACHE_MAX_ENTRIES) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def _count(self, field: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + amount)
+
+    def get(self, conn: sqlite3.Connection, key: str) -> dict | None:
+        row = conn.execute(
+            "SELECT result, created_at FROM llm_cache WHERE key = ?",
+            (key,),
+        ).fetchone()
+        now = time.time()
+        if row is None or (self.ttl_seconds > 0 and now - row["created_at"] > self.ttl_seconds):
+            self._count("misses")
+            return None
+        conn.execute(
+            "UPDATE llm_cache SET last_hit_at = ?, hit_count = hit_count + 1 WHERE key = ?",
+            (now, key),
+        )
+        self._count("hits")
+        return json.loads(row["result"])
+
+    def put(self, conn: sqlite3.Connection, key: str, model: str, template_version: str, result: dict) -> None:
+        now = time.time()
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO llm_cache (key, model, template_version, result, created_at, last_hit_at, hit_count)
+            VALUES (?, ?, ?, ?, ?, ?, 0)
+            """,
+            (key, model, template_version, json.dumps(result), now, now),
+        )
+        self._count("stores")
+        self.evict(conn, now)
+
+    def evict(self, conn: sqlite3.Connection, now: float | None = None) -> int:
+        now = time.time() if now is None else now
+        removed = 0
+        if self.ttl_seconds > 0:
+            removed += conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            ).rowcount
+        if self.max_entries > 0:
+            # Least recently hit entries go first once the cache is over size.
+            removed += conn.execute(
+                """
+                DELETE FROM llm_cache WHERE key IN (
+                    SELECT key FROM llm_cache ORDER BY last_hit_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            ).rowcount
+        if removed:
+            self._count("evictions", removed)
+        return removed
+
+    def stats(self, conn: sqlite3.Connection) -> dict:
+        entries = conn.execute("SELECT COUNT(*) AS n FROM llm_cache").fetchone()["n"]
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": int(entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "stores": self.stores,
+                "evictions": self.evictions,
+            }
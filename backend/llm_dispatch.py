@@ -0,0 +1,287 @@
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, NoReturn
+
+
+LLM_MAX_IN_FLIGHT = max(1, int(os.getenv("AXIMO_LLM_MAX_IN_FLIGHT", "1")))
+LLM_QUEUE_TIMEOUT_SECONDS = float(os.getenv("AXIMO_LLM_QUEUE_TIMEOUT_SECONDS", "120"))
+
+FieldCallback = Callable[[str, int | None, str], None]
+
+
+class LLMQueueTimeout(TimeoutError):
+    """The caller's deadline passed before a generation slot became free."""
+
+
+class _Flight:
+    def __init__(self) -> None:
+        # True once the leader holds a slot, False if it gave up before that; never an error.
+        self.started: Future[bool] = Future()
+        self.future: Future[str] = Future()
+        self.listeners: list[FieldCallback] = []
+        self.lock = threading.Lock()
+
+    def on_field(self, field: str, index: int | None, value: str) -> None:
+        with self.lock:
+            listeners = list(self.listeners)
+        for listener in listeners:
+            try:
+                listener(field, index, value)
+            except Exception:
+                pass
+
+
+class _Ticket:
+    """A queued caller; admitted by setting ``admitted`` and signalling its waiter."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self.enqueued_at = time.monotonic()
+        self.admitted = False
+        self.loop = loop
+        self.event = threading.Event() if loop is None else None
+        self.waiter: asyncio.Future | None = loop.create_future() if loop is not None else None
+
+    def signal(self) -> None:
+        if self.event is not None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._wake_async)
+
+    def _wake_async(self) -> None:
+        if not self.waiter.done():
+            self.waiter.set_result(None)
+
+
+class LLMDispatcher:
+    """Gate generations behind a max-in-flight limit with FIFO admission.
+
+    Callers that ask for a prompt already queued or generating share that
+    generation instead of starting their own (single-flight). Thread callers use
+    ``generate``; asyncio callers use ``agenerate`` and wait in the same queue
+    without holding a thread.
+
+    ``timeout`` bounds how long one caller waits for its generation to get a slot, whether it
+    queued that generation or joined it; ``math.inf`` waits as long as it takes.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[str, FieldCallback | None, Any], str],
+        agenerate: Callable[[str, FieldCallback | None, Any], Awaitable[str]] | None = None,
+        max_in_flight: int = LLM_MAX_IN_FLIGHT,
+        queue_timeout: float = LLM_QUEUE_TIMEOUT_SECONDS,
+    ) -> None:
+        self._generate = generate
+        self._agenerate = agenerate
+        self.max_in_flight = max_in_flight
+        self.queue_timeout = queue_timeout
+        self._lock = threading.Lock()
+        self._waiting: deque[_Ticket] = deque()
+        self._in_flight = 0
+        self._flights: dict[tuple[Any, str], _Flight] = {}
+        self._wait_samples: deque[float] = deque(maxlen=512)
+        self.started = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        self.failures = 0
+
+    def _join(self, key: tuple[Any, str], on_field: FieldCallback | None) -> tuple[_Flight, bool]:
+        # target (e.g. the chosen model route) is part of the coalescing key, so the same
+        # prompt sent to two different models is not merged.
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                self.coalesced += 1
+        if on_field is not None:
+            with flight.lock:
+                flight.listeners.append(on_field)
+        return flight, leader
+
+    def generate(
+        self,
+        prompt: str,
+        on_field: FieldCallback | None = None,
+        timeout: float | None = None,
+        target: Any = None,
+    ) -> str:
+        key = (target, prompt)
+        deadline = self._deadline(timeout)
+        while True:
+            flight, leader = self._join(key, on_field)
+            if leader:
+                break
+            if self._follow(flight, deadline, timeout):
+                return flight.future.result()
+
+        try:
+            ticket = self._enqueue(None)
+            if not ticket.event.wait(self._remaining(deadline)):
+                self._abandon(ticket, timeout)
+        except BaseException as e:
+            self._land(key, flight, error=e)
+            raise
+        flight.started.set_result(True)
+        try:
+            result = self._generate(prompt, flight.on_field, target)
+        except BaseException as e:
+            self._release(failed=True)
+            self._land(key, flight, error=e)
+            raise
+        self._release()
+        self._land(key, flight, result=result)
+        return result
+
+    async def agenerate(
+        self,
+        prompt: str,
+        on_field: FieldCallback | None = None,
+        timeout: float | None = None,
+        target: Any = None,
+    ) -> str:
+        if self._agenerate is None:
+            raise RuntimeError("dispatcher has no async generate function")
+        key = (target, prompt)
+        deadline = self._deadline(timeout)
+        while True:
+            flight, leader = self._join(key, on_field)
+            if leader:
+                break
+            if await self._afollow(flight, deadline, timeout):
+                return await self._ashared(flight.future)
+
+        try:
+            ticket = self._enqueue(asyncio.get_running_loop())
+            try:
+                await asyncio.wait_for(asyncio.shield(ticket.waiter), self._remaining(deadline))
+            except asyncio.TimeoutError:
+                self._abandon(ticket, timeout)
+            except asyncio.CancelledError:
+                self._abandon(ticket, timeout, count_timeout=False)
+                raise
+        except BaseException as e:
+            self._land(key, flight, error=e)
+            raise
+        flight.started.set_result(True)
+        try:
+            result = await self._agenerate(prompt, flight.on_field, target)
+        except BaseException as e:
+            self._release(failed=True)
+            self._land(key, flight, error=e)
+            raise
+        self._release()
+        self._land(key, flight, result=result)
+        return result
+
+    def _timeout(self, timeout: float | None) -> float:
+        return self.queue_timeout if timeout is None else timeout
+
+    def _deadline(self, timeout: float | None) -> float | None:
+        timeout = self._timeout(timeout)
+        return None if math.isinf(timeout) else time.monotonic() + timeout
+
+    @staticmethod
+    def _remaining(deadline: float | None) -> float | None:
+        return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+    def _follow(self, flight: _Flight, deadline: float | None, timeout: float | None) -> bool:
+        """Wait, within this caller's own deadline, for a joined generation to get its slot.
+
+        False means the leader gave up before starting (its own deadline was shorter), so the
+        caller should join again, possibly as the new leader.
+        """
+        try:
+            return flight.started.result(self._remaining(deadline))
+        except FutureTimeoutError:
+            self._timed_out(timeout)
+
+    async def _afollow(self, flight: _Flight, deadline: float | None, timeout: float | None) -> bool:
+        # Shielded so neither a timeout nor cancelling this caller cancels the shared future;
+        # cancellation still propagates to the caller.
+        started = asyncio.wrap_future(flight.started)
+        try:
+            return await asyncio.wait_for(asyncio.shield(started), self._remaining(deadline))
+        except asyncio.TimeoutError:
+            self._timed_out(timeout)
+
+    @staticmethod
+    async def _ashared(future: Future[str]) -> str:
+        # Shielded so cancelling one caller does not cancel the generation others share; the
+        # outcome is retrieved so a failure nobody awaits any more is not logged as unretrieved.
+        shared = asyncio.wrap_future(future)
+        shared.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return await asyncio.shield(shared)
+
+    def _timed_out(self, timeout: float | None) -> NoReturn:
+        with self._lock:
+            self.timeouts += 1
+        raise LLMQueueTimeout(f"no generation slot within {self._timeout(timeout):g}s")
+
+    def _enqueue(self, loop: asyncio.AbstractEventLoop | None) -> _Ticket:
+        ticket = _Ticket(loop)
+        with self._lock:
+            self._waiting.append(ticket)
+            self._admit_locked()
+        return ticket
+
+    def _admit_locked(self) -> None:
+        while self._waiting and self._in_flight < self.max_in_flight:
+            ticket = self._waiting.popleft()
+            ticket.admitted = True
+            self._in_flight += 1
+            self.started += 1
+            self._wait_samples.append(time.monotonic() - ticket.enqueued_at)
+            ticket.signal()
+
+    def _abandon(self, ticket: _Ticket, timeout: float | None, count_timeout: bool = True) -> None:
+        with self._lock:
+            if ticket.admitted:
+                # Admitted in the instant the wait gave up; hand the slot straight on.
+                self._in_flight -= 1
+                self._admit_locked()
+            else:
+                self._waiting.remove(ticket)
+        if count_timeout:
+            self._timed_out(timeout)
+
+    def _release(self, failed: bool = False) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if failed:
+                self.failures += 1
+            self._admit_locked()
+
+    def _land(self, key: tuple[Any, str], flight: _Flight, result: str | None = None, error: BaseException | None = None) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        if not flight.started.done():
+            flight.started.set_result(False)
+        if error is not None:
+            flight.future.set_exception(error)
+        else:
+            flight.future.set_result(result)
+
+    def stats(self) -> dict:
+        with self._lock:
+            samples = sorted(self._wait_samples)
+            return {
+                "max_in_flight": self.max_in_flight,
+                "in_flight": self._in_flight,
+                "queue_depth": len(self._waiting),
+                "started": self.started,
+                "coalesced": self.coalesced,
+                "timeouts": self.timeouts,
+                "failures": self.failures,
+                "wait_seconds_avg": (sum(samples) / len(samples)) if samples else 0.0,
+                "wait_seconds_p95": samples[int(0.95 * (len(samples) - 1))] if samples else 0.0,
+                "wait_seconds_max": samples[-1] if samples else 0.0,
+            }
@@ -0,0 +1,140 @@
+import json
+from typing import Callable, Iterable, Iterator
+
+
+SUMMARY_ARRAY_LIMITS = {"action_items": 3, "questions": 2}
+SUMMARY_MAX_CHARS = 8000
+
+
+class OffSchemaError(ValueError):
+    """Raised as soon as a streamed completion can no longer be a valid summary object."""
+
+
+class IncrementalSummaryParser:
+    """Scan a streamed ``{summary, action_items, questions}`` object one chunk at a time.
+
+    Only new characters are examined on each ``feed``; completed string values are
+    reported through ``on_field`` as ``(field, index, value)`` where ``index`` is
+    ``None`` for ``summary`` and the item position for the two arrays.
+    """
+
+    def __init__(
+        self,
+        array_limits: dict[str, int] | None = None,
+        max_chars: int = SUMMARY_MAX_CHARS,
+        on_field: Callable[[str, int | None, str], None] | None = None,
+    ) -> None:
+        self.array_limits = dict(SUMMARY_ARRAY_LIMITS if array_limits is None else array_limits)
+        self.allowed_keys = {"summary", *self.array_limits}
+        self.max_chars = max_chars
+        self.on_field = on_field
+        self.text = ""
+        self.closed = False
+        self._pos = 0
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._expect_key = False
+        self._key: str | None = None
+        self._item_counts: dict[str, int] = {}
+
+    def feed(self, chunk: str) -> None:
+        self.text += chunk
+        if len(self.text) > self.max_chars:
+            raise OffSchemaError("output too long")
+        text = self.text
+        while self._pos < len(text):
+            ch = text[self._pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._on_string(json.loads(text[self._string_start:self._pos + 1]))
+            else:
+                self._on_char(ch)
+            self._pos += 1
+
+    def _on_char(self, ch: str) -> None:
+        if ch.isspace():
+            return
+        if self.closed:
+            raise OffSchemaError("trailing content after object")
+        depth = len(self._stack)
+        if depth == 0:
+            if ch != "{":
+                raise OffSchemaError("output does not start with a JSON object")
+            self._stack.append("{")
+            self._expect_key = True
+            return
+        if ch == '"':
+            self._in_string = True
+            self._string_start = self._pos
+            return
+        if depth == 1:
+            if ch == ":":
+                self._expect_key = False
+            elif ch == ",":
+                self._expect_key = True
+                self._key = None
+            elif ch == "}":
+                self._stack.pop()
+                self.closed = True
+            elif ch == "[" and self._key in self.array_limits:
+                self._stack.append("[")
+            else:
+                raise OffSchemaError(f"unexpected value for {self._key!r}")
+            return
+        # depth 2: inside action_items / questions, only string items are allowed.
+        if ch == ",":
+            return
+        if ch == "]":
+            self._stack.pop()
+            return
+        raise OffSchemaError(f"non-string item in {self._key!r}")
+
+    def _on_string(self, value: str) -> None:
+        depth = len(self._stack)
+        if depth == 1 and self._expect_key:
+            if value not in self.allowed_keys:
+                raise OffSchemaError(f"unexpected key {value!r}")
+            self._key = value
+            return
+        if depth == 1:
+            if self._key != "summary":
+                raise OffSchemaError(f"{self._key!r} must be an array")
+            if self.on_field is not None:
+                self.on_field("summary", None, value)
+            return
+        key = self._key or ""
+        index = self._item_counts.get(key, 0)
+        if index >= self.array_limits[key]:
+            raise OffSchemaError(f"too many {key}")
+        self._item_counts[key] = index + 1
+        if self.on_field is not None:
+            self.on_field(key, index, value)
+
+
+def parse_ndjson_line(line: bytes | str) -> tuple[str, bool]:
+    """Return ``(response text, done)`` for one Ollama ``/api/generate`` stream line."""
+    line = line.strip()
+    if not line:
+        return "", False
+    payload = json.loads(line)
+    if payload.get("error"):
+        raise ValueError(f"ollama error: {payload['error']}")
+    chunk = payload.get("response")
+    return (chunk if isinstance(chunk, str) else ""), bool(payload.get("done"))
+
+
+def iter_ndjson_responses(lines: Iterable[bytes]) -> Iterator[str]:
+    """Yield the ``response`` text of each Ollama ``/api/generate`` stream line."""
+    for line in lines:
+        chunk, done = parse_ndjson_line(line)
+        if chunk:
+            yield chunk
+        if done:
+            return
@@ -1,18 +1,47 @@
-from datetime import datetime, timezone
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+import http.client
 import json
+import math
 import os
 import sqlite3
-from typing import Literal
+import time
+from typing import AsyncIterator, Callable, Iterable, Iterator, Literal
 import urllib.error
 import urllib.request
 from uuid import uuid4
 
-from fastapi import FastAPI, HTTPException, Request
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
 from starlette.middleware.base import BaseHTTPMiddleware
-from telegram_notify import send_telegram as send_telegram_notify
+from telegram_notify import TelegramOutboxSender, enqueue_telegram
+from escalation import Escalation, EscalationScheduler
+from db import close_pool, get_pool, run_read, run_write
+from task_stream import task_events
+from llm_cache import LLMResultCache, cache_key
+from migrations import apply_migrations
+from output_store import decode_task_output, is_output_digest, load_task_output, store_task_output, write_search_doc
+from llm_stream import IncrementalSummaryParser, iter_ndjson_responses, parse_ndjson_line
+from llm_dispatch import LLMDispatcher, LLMQueueTimeout
+from model_router import ModelRoute, ModelRouter, load_routes_from_env
+from pressure import (
+    OPEN_STATUSES,
+    clamp_weight,
+    next_score_change_ms,
+    normalize_priority,
+    parse_due_date,
+    pressure_due_cutoff,
+    rank_pressure,
+)
+from pressure_batch import load_columns, score_columns, totals_by_status
 
 
 class IntentRequest(BaseModel):
@@ -28,10 +57,22 @@ class TaskCreateRequest(BaseModel):
     weight: float | None = None
 
 
+class TaskBatchCreateRequest(BaseModel):
+    tasks: list[TaskCreateRequest] = Field(min_length=1, max_length=1000)
+
+
 class TaskStatusUpdateRequest(BaseModel):
     status: Literal["pending_approval", "approved", "rejected", "done"]
 
 
+class TaskBulkTransitionRequest(BaseModel):
+    ids: list[str] = Field(min_length=1, max_length=1000)
+    action: Literal["approve", "reject", "status"]
+    # Target for action="status"; ignored otherwise.
+    status: Literal["pending_approval", "approved", "rejected", "done"] | None = None
+    reason: str | None = None
+
+
 class TaskRejectRequest(BaseModel):
     reason: str | None = None
 
@@ -54,6 +95,74 @@ class Task(BaseModel):
     rejected_at: str | None = None
     rejected_by: str | None = None
     reject_reason: str | None = None
+    updated_at: str | None = None
+
+
+class TaskTransitionOutcome(BaseModel):
+    id: str
+    outcome: Literal["updated", "unchanged", "not_found", "conflict"]
+    detail: str | None = None
+    task: Task | None = None
+
+
+class PressureEntry(BaseModel):
+    task_id: str
+    # Omitted with include_tasks=false, for callers that already hold the task rows.
+    task: Task | None = None
+    time_score: int
+    p2: int
+    bucket: Literal["overdue", "due_soon", "upcoming", "no_due"]
+
+
+class PressureRanking(BaseModel):
+    as_of: str
+    top: list[PressureEntry]
+    # Sum of p2 per status over every scoring task.
+    totals: dict[str, int]
+    # Earliest instant a score of a task already in the 72h window can change.
+    next_change_at: str | None = None
+
+
+class PressureForecast(BaseModel):
+    as_of: list[str]
+    # p2 summed per status at each as_of timestamp, plus the overall sum.
+    totals: dict[str, list[int]]
+    total: list[int]
+
+
+class TaskChanges(BaseModel):
+    rev: int
+    changed: list[Task]
+    deleted: list[str]
+    has_more: bool = False
+
+
+class TaskSearchHit(BaseModel):
+    task: Task
+    score: float
+    snippet: str
+
+
+class TaskEvent(BaseModel):
+    id: str
+    task_id: str
+    event_type: str
+    from_status: str | None = None
+    to_status: str | None = None
+    actor: str | None = None
+    reason: str | None = None
+    created_at: str
+
+
+class TaskJob(BaseModel):
+    id: str
+    task_id: str
+    status: Literal["queued", "running", "succeeded", "failed"]
+    error: str | None = None
+    created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    task: Task | None = None
 
 
 class SummaryResult(BaseModel):
@@ -65,6 +174,14 @@ class SummaryResult(BaseModel):
 app = FastAPI()
 AXIMO_API_TOKEN = os.getenv("AXIMO_API_TOKEN", "").strip()
 AXIMO_DEBUG_EVENTS = os.getenv("AXIMO_DEBUG_EVENTS", "").strip() in ("1","true","TRUE","yes","YES")
+AXIMO_OLLAMA_STREAM = os.getenv("AXIMO_OLLAMA_STREAM", "1").strip() not in ("0", "false", "FALSE", "no", "NO")
+# Bump when build_summary_prompt or the REPAIR prompt changes so cached results are not reused.
+SUMMARY_PROMPT_VERSION = "summary-v1"
+AXIMO_LLM_CACHE_ENABLED = os.getenv("AXIMO_LLM_CACHE", "1").strip() not in ("0", "false", "FALSE", "no", "NO")
+# Interactive /intent callers give up on the local model sooner than background run jobs.
+AXIMO_INTENT_QUEUE_TIMEOUT_SECONDS = float(os.getenv("AXIMO_INTENT_QUEUE_TIMEOUT_SECONDS", "30"))
+AXIMO_RUN_WORKERS = max(1, int(os.getenv("AXIMO_RUN_WORKERS", "2")))
+AXIMO_ESCALATION_POLL_SECONDS = float(os.getenv("AXIMO_ESCALATION_POLL_SECONDS", "5"))
 AXIMO_IP_ALLOWLIST = [ip.strip() for ip in os.getenv("AXIMO_IP_ALLOWLIST", "").split(",") if ip.strip()]
 
 
@@ -114,63 +231,49 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Tasks-Rev"],
 )
 
 DB_PATH = "/Users/albertkim/02_PROJECTS/03_aximo/backend/aximo.db"
 TELEGRAM_WEBHOOK_SECRET = os.getenv("TELEGRAM_WEBHOOK_SECRET", "").strip()
 
 
-def get_db_connection() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+def get_db_connection():
+    """Borrow the single pooled writer connection; commits on clean exit, rolls back on error."""
+    return get_pool(DB_PATH).writer()
 
-def insert_task_event(conn, task_id: str, event_type: str, from_status: str | None,
-                      to_status: str | None, actor: str | None, reason: str | None):
-    conn.execute(
-        """
-        INSERT INTO task_events (
-            id, task_id, event_type, from_status, to_status, actor, reason, created_at
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            str(uuid4()),
-            task_id,
-            event_type,
-            from_status,
-            to_status,
-            actor,
-            reason,
-            datetime.now(timezone.utc).isoformat(),
-        ),
-    )
 
+def get_read_connection():
+    """Borrow a pooled read-only connection; WAL lets it run alongside the writer."""
+    return get_pool(DB_PATH).reader()
 
 
-def normalize_priority(priority: str | None) -> Literal["low", "medium", "high"]:
-    if priority in ("low", "medium", "high"):
-        return priority
-    return "medium"
+TASK_EVENT_INSERT_SQL = """
+    INSERT INTO task_events (
+        id, task_id, event_type, from_status, to_status, actor, reason, created_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
 
-def clamp_weight(weight: float | None) -> float:
-    if weight is None:
-        return 1.0
-    try:
-        value = float(weight)
-    except Exception:
-        return 1.0
-    if value < 0.1:
-        return 0.1
-    if value > 10.0:
-        return 10.0
-    return value
+def task_event_values(task_id: str, event_type: str, from_status: str | None,
+                      to_status: str | None, actor: str | None, reason: str | None,
+                      created_at: str | None = None) -> tuple:
+    return (
+        str(uuid4()),
+        task_id,
+        event_type,
+        from_status,
+        to_status,
+        actor,
+        reason,
+        created_at or datetime.now(timezone.utc).isoformat(),
+    )
 
 
 def task_to_db_values(
     task: Task,
-) -> tuple[str, str, str, str, str | None, str, str | None, str | None, str | None, str | None, str, float, str | None, str | None, str | None, str | None, str | None]:
+) -> tuple[str, str, str, str, str | None, str, str | None, str | None, str | None, str | None, str, float, str | None, str | None, str | None, str | None, str | None, str]:
     return (
         task.id,
         task.text,
@@ -189,91 +292,112 @@ def task_to_db_values(
         task.rejected_at,
         task.rejected_by,
         task.reject_reason,
+        task.updated_at or task.created_at,
     )
 
 
-def row_to_task(row: sqlite3.Row) -> Task:
-    output = None
-    if row["output"] is not None:
-        output = json.loads(row["output"])
-    return Task(
-        id=row["id"],
-        text=row["text"],
-        type=row["type"],
-        status=row["status"],
-        parent_id=row["parent_id"],
-        created_at=row["created_at"],
-        output=output,
-        ran_at=row["ran_at"],
-        due_date=row["due_date"],
-        owner=row["owner"] if "owner" in row.keys() else None,
-        priority=normalize_priority(row["priority"] if "priority" in row.keys() else None),
-        weight=clamp_weight(row["weight"] if "weight" in row.keys() else None),
-        approved_at=row["approved_at"] if "approved_at" in row.keys() else None,
-        approved_by=row["approved_by"] if "approved_by" in row.keys() else None,
-        rejected_at=row["rejected_at"] if "rejected_at" in row.keys() else None,
-        rejected_by=row["rejected_by"] if "rejected_by" in row.keys() else None,
-        reject_reason=row["reject_reason"] if "reject_reason" in row.keys() else None,
+TASK_INSERT_SQL = """
+    INSERT INTO tasks (
+        id, text, type, status, parent_id, created_at, output, ran_at,
+        due_date, owner, priority, weight, approved_at, approved_by,
+        rejected_at, rejected_by, reject_reason, updated_at
     )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+TASK_FIELDS = tuple(Task.model_fields)
+# Named explicitly rather than SELECT * so the generated output_* columns are not computed.
+TASK_COLUMNS = ", ".join(TASK_FIELDS)
+TASK_OUTPUT_FIELDS = ("output_summary", "output_action_items_count", "output_questions_count")
+TASK_PROJECTION_FIELDS = TASK_FIELDS + TASK_OUTPUT_FIELDS
+# The generated column reads the inline digest, which clips a large output's summary; the search
+# doc holds the same value for an inline output and the full text for an offloaded one.
+TASK_PROJECTION_SQL = {"output_summary": "d.summary AS output_summary"}
+TASK_PROJECTION_JOIN = "LEFT JOIN task_search_docs d ON d.task_id = tasks.id"
+TASK_JOINED_COLUMNS = ", ".join(f"t.{field}" for field in TASK_FIELDS)
+# Reads that return output join the full copy of an offloaded one, so rows never carry a digest.
+TASK_OUTPUT_BLOB_COLUMNS = "o.codec AS output_codec, o.data AS output_data"
+TASK_OUTPUT_BLOB_JOIN = "LEFT JOIN task_outputs o ON o.task_id = {row}.id"
+
+
+def task_row_reader(keys: Iterable[str], fields: Iterable[str] = TASK_FIELDS) -> Callable[[sqlite3.Row], dict]:
+    """Build a row -> task dict function with column positions resolved once per query.
+
+    Columns missing from an older schema read as None; extra columns (e.g. the change
+    log fields joined in by /tasks/changes) are ignored. ``fields`` narrows the dict to a
+    projection; output is only parsed when it is part of it, and is read from the joined
+    TASK_OUTPUT_BLOB_COLUMNS instead of the inline digest when the output was offloaded.
+    """
+    index: dict[str, int] = {}
+    for position, name in enumerate(keys):
+        index.setdefault(name, position)
+    positions = [(field, index.get(field)) for field in fields]
+    names = {field for field, _ in positions}
+    has_output, has_priority, has_weight = "output" in names, "priority" in names, "weight" in names
+    codec_at, blob_at = index.get("output_codec"), index.get("output_data")
+    has_blob = has_output and codec_at is not None and blob_at is not None
+
+    def read(row: sqlite3.Row) -> dict:
+        data = {field: (row[position] if position is not None else None) for field, position in positions}
+        if has_blob and row[blob_at] is not None:
+            data["output"] = decode_task_output(row[codec_at], row[blob_at])
+        elif has_output and data["output"] is not None:
+            data["output"] = orjson.loads(data["output"])
+        if has_priority:
+            data["priority"] = normalize_priority(data["priority"])
+        if has_weight:
+            data["weight"] = clamp_weight(data["weight"])
+        return data
+
+    return read
+
+
+def rows_to_task_dicts(rows: list[sqlite3.Row]) -> list[dict]:
+    if not rows:
+        return []
+    read = task_row_reader(rows[0].keys())
+    return [read(row) for row in rows]
+
+
+def row_to_task(row: sqlite3.Row) -> Task:
+    return Task(**task_row_reader(row.keys())(row))
+
+
+class FastJSONResponse(Response):
+    """orjson-rendered body for list endpoints that return already-shaped task dicts."""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
 
 
 def get_task_by_id(conn: sqlite3.Connection, task_id: str) -> Task | None:
-    row = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+    row = conn.execute(f"SELECT {TASK_COLUMNS} FROM tasks WHERE id = ?", (task_id,)).fetchone()
     if row is None:
         return None
-    return row_to_task(row)
+    task = row_to_task(row)
+    # tasks.output holds only a digest of a large output; callers always get the full copy.
+    if is_output_digest(task.output):
+        task.output = load_task_output(conn, task_id) or task.output
+    return task
+
+
+def current_task_rev(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT COALESCE(MAX(rev), 0) AS rev FROM task_changes").fetchone()
+    return int(row["rev"])
 
 
 @app.on_event("startup")
 def init_db() -> None:
     with get_db_connection() as conn:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tasks (
-                id TEXT PRIMARY KEY,
-                text TEXT NOT NULL,
-                type TEXT NOT NULL,
-                status TEXT NOT NULL,
-                parent_id TEXT NULL,
-                created_at TEXT NOT NULL,
-                output TEXT NULL,
-                ran_at TEXT NULL,
-                due_date TEXT NULL,
-                owner TEXT NULL,
-                priority TEXT NOT NULL DEFAULT 'medium',
-                weight REAL NOT NULL DEFAULT 1.0,
-                approved_at TEXT NULL,
-                approved_by TEXT NULL,
-                rejected_at TEXT NULL,
-                rejected_by TEXT NULL,
-                reject_reason TEXT NULL
-            )
-            """
-        )
-        columns = {row["name"] for row in conn.execute("PRAGMA table_info(tasks)").fetchall()}
-        if "due_date" not in columns:
-            conn.execute("ALTER TABLE tasks ADD COLUMN due_date TEXT NULL")
-        if "owner" not in columns:
-            conn.execute("ALTER TABLE tasks ADD COLUMN owner TEXT NULL")
-        if "priority" not in columns:
-            conn.execute("ALTER TABLE tasks ADD COLUMN priority TEXT NOT NULL DEFAULT 'medium'")
-        if "weight" not in columns:
-            conn.execute("ALTER TABLE tasks ADD COLUMN weight REAL NOT NULL DEFAULT 1.0")
-        if "approved_at" not in columns:
-            conn.execute("ALTER TABLE tasks ADD COLUMN approved_at TEXT NULL")
-        if "approved_by" not in columns:
-            conn.execute("ALTER TABLE tasks ADD COLUMN approved_by TEXT NULL")
-        if "rejected_at" not in columns:
-            conn.execute("ALTER TABLE tasks ADD COLUMN rejected_at TEXT NULL")
-        if "rejected_by" not in columns:
-            conn.execute("ALTER TABLE tasks ADD COLUMN rejected_by TEXT NULL")
-        if "reject_reason" not in columns:
-            conn.execute("ALTER TABLE tasks ADD COLUMN reject_reason TEXT NULL")
-        conn.execute("UPDATE tasks SET priority = 'medium' WHERE priority IS NULL OR priority NOT IN ('low','medium','high')")
-        conn.execute("UPDATE tasks SET weight = 1.0 WHERE weight IS NULL")
-        conn.execute("UPDATE tasks SET weight = 0.1 WHERE weight < 0.1")
-        conn.execute("UPDATE tasks SET weight = 10.0 WHERE weight > 10.0")
-        conn.commit()
+        applied = apply_migrations(conn)
+    if applied:
+        print(f"DB migrations applied: {', '.join(applied)}", flush=True)
+    resume_run_jobs()
+    telegram_outbox.start()
+    escalations.start()
     print(
         "TELEGRAM env: "
         f"TOKEN_PRESENT={'YES' if bool(os.getenv('TELEGRAM_BOT_TOKEN', '').strip()) else 'NO'} "
@@ -281,11 +405,102 @@ def init_db() -> None:
     )
 
 
+@app.on_event("shutdown")
+async def shutdown_db() -> None:
+    global _async_http
+    # Jobs still queued stay "queued" in task_jobs and are resubmitted on the next startup.
+    run_executor.shutdown(wait=False, cancel_futures=True)
+    escalations.stop()
+    telegram_outbox.stop()
+    if _async_http is not None:
+        await _async_http.aclose()
+        _async_http = None
+    close_pool()
+
+
+_async_http: httpx.AsyncClient | None = None
+_background_tasks: set[asyncio.Task] = set()
+
+
+def get_async_http() -> httpx.AsyncClient:
+    """Shared keep-alive client for Ollama and Telegram calls made from async handlers."""
+    global _async_http
+    if _async_http is None:
+        _async_http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+    return _async_http
+
+
+def publish_task_change(event_type: str, task: Task) -> None:
+    task_events.publish(event_type, {"task": task.model_dump()})
+    escalations.wake()
+
+
+telegram_outbox = TelegramOutboxSender(get_db_connection)
+
+
+def queue_telegram_notify(text: str, chat_id: str | int | None = None, reply_markup: dict | None = None) -> None:
+    # Persisted to telegram_outbox and sent by the background sender, so request latency
+    # never includes a Telegram round trip and pending messages survive restarts.
+    with get_db_connection() as conn:
+        enqueue_telegram(conn, text, chat_id=chat_id, reply_markup=reply_markup)
+    telegram_outbox.wake()
+
+
+async def queue_telegram_notify_async(
+    text: str, chat_id: str | int | None = None, reply_markup: dict | None = None
+) -> None:
+    await run_write(queue_telegram_notify, text, chat_id, reply_markup)
+
+
 def notify_telegram(text: str) -> None:
-    send_telegram_notify(text)
+    queue_telegram_notify(text)
+
+
+class TaskUnitOfWork:
+    """Collects a task state change, its task_events rows and its outbox messages on one connection.
+
+    Use it through ``task_unit_of_work()`` so they commit together. SSE publishes are held
+    until after the commit, so subscribers never see a change that was rolled back.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+        self.published: list[tuple[str, Task]] = []
+        self.queued_messages = 0
+
+    def event(self, task_id: str, event_type: str, from_status: str | None, to_status: str | None,
+              actor: str | None, reason: str | None = None, created_at: str | None = None) -> None:
+        self.conn.execute(
+            TASK_EVENT_INSERT_SQL,
+            task_event_values(task_id, event_type, from_status, to_status, actor, reason, created_at),
+        )
+
+    def events(self, values: list[tuple]) -> None:
+        self.conn.executemany(TASK_EVENT_INSERT_SQL, values)
+
+    def notify(self, text: str, chat_id: str | int | None = None, reply_markup: dict | None = None) -> None:
+        enqueue_telegram(self.conn, text, chat_id=chat_id, reply_markup=reply_markup)
+        self.queued_messages += 1
 
+    def publish(self, event_type: str, task: Task) -> None:
+        self.published.append((event_type, task))
 
-def send_task_created_telegram(task: Task) -> None:
+
+@contextmanager
+def task_unit_of_work() -> Iterator[TaskUnitOfWork]:
+    with get_db_connection() as conn:
+        uow = TaskUnitOfWork(conn)
+        yield uow
+    for event_type, task in uow.published:
+        publish_task_change(event_type, task)
+    if uow.queued_messages:
+        telegram_outbox.wake()
+
+
+def send_task_created_telegram(uow: TaskUnitOfWork, task: Task) -> None:
     chat_id = os.getenv("TELEGRAM_CHAT_ID", "").strip()
     if not chat_id:
         return
@@ -301,7 +516,36 @@ def send_task_created_telegram(task: Task) -> None:
             ]
         ]
     }
-    send_telegram_notify(text, chat_id=chat_id, reply_markup=keyboard)
+    uow.notify(text, chat_id=chat_id, reply_markup=keyboard)
+
+
+ESCALATION_LABELS = {"due_soon": "⏰ Due within 24h", "overdue": "🚨 Overdue"}
+ESCALATION_MESSAGE_LINES = 20
+
+
+def announce_escalations(conn: sqlite3.Connection, fired: list[Escalation]) -> None:
+    # Runs in the scheduler's write transaction: the events and one outbox message per tick
+    # commit together with the crossings they report.
+    conn.executemany(
+        TASK_EVENT_INSERT_SQL,
+        [
+            task_event_values(e.task_id, "escalated", e.status, e.status, "scheduler", e.level)
+            for e in fired
+        ],
+    )
+    lines = [
+        f"{ESCALATION_LABELS[e.level]}: {e.text[:80]} (id:{short_id(e.task_id)})\nDue: {e.due_date}"
+        for e in fired[:ESCALATION_MESSAGE_LINES]
+    ]
+    if len(fired) > ESCALATION_MESSAGE_LINES:
+        lines.append(f"...and {len(fired) - ESCALATION_MESSAGE_LINES} more")
+    enqueue_telegram(conn, "\n\n".join(lines))
+    telegram_outbox.wake()
+
+
+escalations = EscalationScheduler(
+    get_db_connection, get_read_connection, announce_escalations, AXIMO_ESCALATION_POLL_SECONDS
+)
 
 
 def short_id(task_id: str) -> str:
@@ -334,64 +578,90 @@ def validate_and_normalize_result(raw: dict) -> dict:
     return parsed.model_dump()
 
 
-def approve_task_internal(task_id: str, approved_by: str = "admin") -> Task:
-    with get_db_connection() as conn:
-        task = get_task_by_id(conn, task_id)
-        if task is None:
-            raise HTTPException(status_code=404, detail="Task not found")
-        if task.status == "done":
-            raise HTTPException(status_code=409, detail="Task already done")
+APPROVE_TASK_SQL = """
+    UPDATE tasks
+    SET status = 'approved', approved_at = ?, approved_by = ?,
+        rejected_at = NULL, rejected_by = NULL, reject_reason = NULL,
+        updated_at = ?
+    WHERE id = ?
+"""
+
+REJECT_TASK_SQL = """
+    UPDATE tasks
+    SET status = 'rejected', rejected_at = ?, rejected_by = ?, reject_reason = ?, updated_at = ?
+    WHERE id = ?
+"""
+
+
+def require_open_task(task: Task | None) -> Task:
+    """Guard shared by approve and reject: the task must exist and not be done."""
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if task.status == "done":
+        raise HTTPException(status_code=409, detail="Task already done")
+    return task
+
+
+def approve_task_internal(task_id: str, approved_by: str = "admin", chat_id: str | int | None = None) -> Task:
+    """Approve, record the event and queue the confirmation (to ``chat_id`` or the default chat)."""
+    with task_unit_of_work() as uow:
+        task = require_open_task(get_task_by_id(uow.conn, task_id))
         if task.status == "approved":
+            uow.notify(f"✅ Approved: {task_title(task)} (id:{short_id(task.id)})", chat_id=chat_id)
             return task
         approved_at = datetime.now(timezone.utc).isoformat()
-        conn.execute(
-            """
-            UPDATE tasks
-            SET status = ?, approved_at = ?, approved_by = ?,
-                rejected_at = NULL, rejected_by = NULL, reject_reason = NULL
-            WHERE id = ?
-            """,
-            ("approved", approved_at, approved_by, task_id),
-        )
-        conn.commit()
-        updated = get_task_by_id(conn, task_id)
-    if updated is None:
-        raise HTTPException(status_code=404, detail="Task not found")
+        uow.conn.execute(APPROVE_TASK_SQL, (approved_at, approved_by, approved_at, task_id))
+        uow.event(task_id, "approved", task.status, "approved", approved_by, None, approved_at)
+        updated = get_task_by_id(uow.conn, task_id)
+        uow.publish("approved", updated)
+        uow.notify(f"✅ Approved: {task_title(updated)} (id:{short_id(updated.id)})", chat_id=chat_id)
     return updated
 
 
-def reject_task_internal(task_id: str, reason: str | None, rejected_by: str = "admin") -> Task:
-    with get_db_connection() as conn:
-        task = get_task_by_id(conn, task_id)
-        if task is None:
-            raise HTTPException(status_code=404, detail="Task not found")
-        if task.status == "done":
-            raise HTTPException(status_code=409, detail="Task already done")
+def reject_task_internal(
+    task_id: str, reason: str | None, rejected_by: str = "admin", chat_id: str | int | None = None
+) -> Task:
+    """Reject and record the event; a confirmation is queued only when replying to ``chat_id``."""
+    with task_unit_of_work() as uow:
+        task = require_open_task(get_task_by_id(uow.conn, task_id))
         rejected_at = datetime.now(timezone.utc).isoformat()
         reject_reason = (reason or "")[:500] or None
-        conn.execute(
-            """
-            UPDATE tasks
-            SET status = ?, rejected_at = ?, rejected_by = ?, reject_reason = ?
-            WHERE id = ?
-            """,
-            ("rejected", rejected_at, rejected_by, reject_reason, task_id),
-        )
-        conn.commit()
-        updated = get_task_by_id(conn, task_id)
-    if updated is None:
-        raise HTTPException(status_code=404, detail="Task not found")
+        uow.conn.execute(REJECT_TASK_SQL, (rejected_at, rejected_by, reject_reason, rejected_at, task_id))
+        uow.event(task_id, "rejected", task.status, "rejected", rejected_by, reject_reason, rejected_at)
+        updated = get_task_by_id(uow.conn, task_id)
+        uow.publish("rejected", updated)
+        if chat_id is not None:
+            uow.notify(f"❌ Rejected: {task_title(updated)} (id:{short_id(updated.id)})", chat_id=chat_id)
     return updated
 
 
-def _ollama_generate_response(prompt: str) -> str:
+async def approve_task_internal_async(
+    task_id: str, approved_by: str = "admin", chat_id: str | int | None = None
+) -> Task:
+    return await run_write(approve_task_internal, task_id, approved_by, chat_id)
+
+
+async def reject_task_internal_async(
+    task_id: str, reason: str | None, rejected_by: str = "admin", chat_id: str | int | None = None
+) -> Task:
+    return await run_write(reject_task_internal, task_id, reason, rejected_by, chat_id)
+
+
+def _ollama_generate_response(
+    prompt: str,
+    on_field: Callable[[str, int | None, str], None] | None = None,
+    route: ModelRoute | None = None,
+) -> str:
+    route = route or model_router.routes[-1]
+    if AXIMO_OLLAMA_STREAM or on_field is not None:
+        return _ollama_generate_stream(prompt, on_field, route)
     body = {
-        "model": "qwen2.5:7b-instruct",
+        "model": route.name,
         "prompt": prompt,
         "stream": False,
     }
     req = urllib.request.Request(
-        "http://localhost:11434/api/generate",
+        route.url,
         data=json.dumps(body).encode("utf-8"),
         headers={"Content-Type": "application/json"},
         method="POST",
@@ -405,44 +675,249 @@ def _ollama_generate_response(prompt: str) -> str:
     return raw
 
 
-def call_ollama_structured(prompt: str) -> dict:
-    fallback = {
-        "summary": "(Fallback) Unable to generate structured output reliably.",
-        "action_items": [
-            "(Fallback) Review meeting notes",
-            "(Fallback) Assign owners",
-            "(Fallback) Confirm deadlines",
-        ],
-        "questions": [
-            "(Fallback) What is the top priority?",
-            "(Fallback) What is the deadline?",
-        ],
+def _ollama_generate_stream(
+    prompt: str,
+    on_field: Callable[[str, int | None, str], None] | None,
+    route: ModelRoute,
+) -> str:
+    body = {
+        "model": route.name,
+        "prompt": prompt,
+        "stream": True,
+    }
+    req = urllib.request.Request(
+        route.url,
+        data=json.dumps(body).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+
+    parser = IncrementalSummaryParser(on_field=on_field)
+    # An OffSchemaError from feed() leaves the with-block, closing the connection so Ollama
+    # stops generating and the REPAIR attempt starts without waiting for the full completion.
+    with urllib.request.urlopen(req, timeout=60) as resp:
+        for chunk in iter_ndjson_responses(resp):
+            parser.feed(chunk)
+    return parser.text
+
+
+async def _ollama_generate_response_async(
+    prompt: str,
+    on_field: Callable[[str, int | None, str], None] | None = None,
+    route: ModelRoute | None = None,
+) -> str:
+    route = route or model_router.routes[-1]
+    client = get_async_http()
+    stream = AXIMO_OLLAMA_STREAM or on_field is not None
+    body = {
+        "model": route.name,
+        "prompt": prompt,
+        "stream": stream,
     }
+    if not stream:
+        resp = await client.post(route.url, json=body, timeout=60)
+        resp.raise_for_status()
+        raw = resp.json().get("response")
+        if not isinstance(raw, str):
+            raise ValueError("missing response")
+        return raw
+
+    parser = IncrementalSummaryParser(on_field=on_field)
+    # Leaving the stream context on OffSchemaError closes the response, as in the sync path.
+    async with client.stream("POST", route.url, json=body, timeout=60) as resp:
+        resp.raise_for_status()
+        async for line in resp.aiter_lines():
+            chunk, done = parse_ndjson_line(line)
+            if chunk:
+                parser.feed(chunk)
+            if done:
+                break
+    return parser.text
+
+
+llm_cache = LLMResultCache()
+model_router = ModelRouter(load_routes_from_env())
+
+
+# What httpx.TransportError covers on the async path: connect failures, timeouts, and a stream
+# cut off mid-response (IncompleteRead, ConnectionResetError).
+SYNC_TRANSPORT_ERRORS = (urllib.error.URLError, http.client.HTTPException, ConnectionError, TimeoutError)
+
+
+def _routed_generate(prompt: str, on_field, route: ModelRoute) -> str:
+    started = time.monotonic()
+    try:
+        return _ollama_generate_response(prompt, on_field, route)
+    except SYNC_TRANSPORT_ERRORS:
+        model_router.mark_unavailable(route)
+        raise
+    finally:
+        model_router.record_latency(route, time.monotonic() - started)
+
+
+async def _routed_agenerate(prompt: str, on_field, route: ModelRoute) -> str:
+    started = time.monotonic()
+    try:
+        return await _ollama_generate_response_async(prompt, on_field, route)
+    except (httpx.TransportError, TimeoutError):
+        model_router.mark_unavailable(route)
+        raise
+    finally:
+        model_router.record_latency(route, time.monotonic() - started)
+
 
+llm_dispatcher = LLMDispatcher(_routed_generate, _routed_agenerate)
+
+
+SUMMARY_FALLBACK = {
+    "summary": "(Fallback) Unable to generate structured output reliably.",
+    "action_items": [
+        "(Fallback) Review meeting notes",
+        "(Fallback) Assign owners",
+        "(Fallback) Confirm deadlines",
+    ],
+    "questions": [
+        "(Fallback) What is the top priority?",
+        "(Fallback) What is the deadline?",
+    ],
+}
+
+
+def summary_fallback() -> dict:
+    return json.loads(json.dumps(SUMMARY_FALLBACK))
+
+
+def build_repair_prompt(prompt: str) -> str:
+    return (
+        "REPAIR: Previous output was invalid.\n"
+        "Output ONLY valid JSON. No prose, no markdown, no code fences.\n"
+        "Output language must be English only.\n"
+        "If user input is not English, first translate the content into English before summarizing.\n"
+        "Output exactly one JSON object with keys:\n"
+        "- summary: string\n"
+        "- action_items: array of exactly 3 strings\n"
+        "- questions: array of exactly 2 strings\n\n"
+        f"Original task:\n{prompt}"
+    )
+
+
+def parse_summary_response(raw_response: str) -> dict:
+    raw_json = json.loads(raw_response)
+    if not isinstance(raw_json, dict):
+        raise ValueError("response is not object")
+    return validate_and_normalize_result(raw_json)
+
+
+def partial_field_callback(on_event: Callable[[dict], None] | None):
+    if on_event is None:
+        return None
+
+    def on_field(field: str, index: int | None, value: str) -> None:
+        on_event({"type": "partial", "field": field, "index": index, "value": value})
+
+    return on_field
+
+
+def _cache_get(key: str) -> dict | None:
+    with get_db_connection() as conn:
+        return llm_cache.get(conn, key)
+
+
+def _cache_put(key: str, model: str, result: dict) -> None:
+    with get_db_connection() as conn:
+        llm_cache.put(conn, key, model, SUMMARY_PROMPT_VERSION, result)
+
+
+def call_ollama_structured(
+    prompt: str,
+    on_event: Callable[[dict], None] | None = None,
+    queue_timeout: float | None = None,
+    task_type: str = "summary",
+) -> dict:
+    route = model_router.choose(task_type, len(prompt))
+    key = cache_key(route.name, SUMMARY_PROMPT_VERSION, prompt)
+    if AXIMO_LLM_CACHE_ENABLED:
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+    on_field = partial_field_callback(on_event)
     current_prompt = prompt
     for attempt in range(2):
         try:
-            raw_response = _ollama_generate_response(current_prompt)
-            raw_json = json.loads(raw_response)
-            if not isinstance(raw_json, dict):
-                raise ValueError("response is not object")
-            return validate_and_normalize_result(raw_json)
-        except (urllib.error.URLError, TimeoutError, json.JSONDecodeError, ValueError):
-            if attempt == 0:
-                current_prompt = (
-                    "REPAIR: Previous output was invalid.\n"
-                    "Output ONLY valid JSON. No prose, no markdown, no code fences.\n"
-                    "Output language must be English only.\n"
-                    "If user input is not English, first translate the content into English before summarizing.\n"
-                    "Output exactly one JSON object with keys:\n"
-                    "- summary: string\n"
-                    "- action_items: array of exactly 3 strings\n"
-                    "- questions: array of exactly 2 strings\n\n"
-                    f"Original task:\n{prompt}"
-                )
-                continue
-            return fallback
-    return fallback
+            raw_response = llm_dispatcher.generate(current_prompt, on_field, timeout=queue_timeout, target=route)
+        except LLMQueueTimeout:
+            # Waiting again for a REPAIR slot would only miss the deadline twice.
+            return summary_fallback()
+        except (*SYNC_TRANSPORT_ERRORS, ValueError) as e:
+            # Unreachable or aborted mid-stream: retry, on another model if this one is now in cooldown.
+            failure: Exception = e
+            if isinstance(e, ValueError):
+                model_router.record_validity(route, False)
+            route = model_router.choose(task_type, len(prompt))
+        else:
+            try:
+                result = parse_summary_response(raw_response)
+            except (json.JSONDecodeError, ValueError) as e:
+                failure = e
+                model_router.record_validity(route, False)
+            else:
+                model_router.record_validity(route, True)
+                if AXIMO_LLM_CACHE_ENABLED:
+                    # A retry may have switched models; file the result under the one that produced it.
+                    _cache_put(cache_key(route.name, SUMMARY_PROMPT_VERSION, prompt), route.name, result)
+                return result
+
+        if attempt == 0:
+            if on_event is not None:
+                on_event({"type": "retry", "reason": str(failure)[:200]})
+            current_prompt = build_repair_prompt(prompt)
+    return summary_fallback()
+
+
+async def call_ollama_structured_async(
+    prompt: str,
+    on_event: Callable[[dict], None] | None = None,
+    queue_timeout: float | None = None,
+    task_type: str = "summary",
+) -> dict:
+    """Event-loop twin of call_ollama_structured: the queue wait and the Ollama stream hold no thread."""
+    route = model_router.choose(task_type, len(prompt))
+    key = cache_key(route.name, SUMMARY_PROMPT_VERSION, prompt)
+    if AXIMO_LLM_CACHE_ENABLED:
+        cached = await run_write(_cache_get, key)
+        if cached is not None:
+            return cached
+
+    on_field = partial_field_callback(on_event)
+    current_prompt = prompt
+    for attempt in range(2):
+        try:
+            raw_response = await llm_dispatcher.agenerate(current_prompt, on_field, timeout=queue_timeout, target=route)
+        except LLMQueueTimeout:
+            return summary_fallback()
+        except (httpx.HTTPError, TimeoutError, ValueError) as e:
+            failure: Exception = e
+            if isinstance(e, ValueError):
+                model_router.record_validity(route, False)
+            route = model_router.choose(task_type, len(prompt))
+        else:
+            try:
+                result = parse_summary_response(raw_response)
+            except (json.JSONDecodeError, ValueError) as e:
+                failure = e
+                model_router.record_validity(route, False)
+            else:
+                model_router.record_validity(route, True)
+                if AXIMO_LLM_CACHE_ENABLED:
+                    await run_write(_cache_put, cache_key(route.name, SUMMARY_PROMPT_VERSION, prompt), route.name, result)
+                return result
+
+        if attempt == 0:
+            if on_event is not None:
+                on_event({"type": "retry", "reason": str(failure)[:200]})
+            current_prompt = build_repair_prompt(prompt)
+    return summary_fallback()
 
 
 @app.get("/health")
@@ -454,32 +929,48 @@ def health() -> dict:
     }
 
 
+def _llm_cache_stats() -> dict:
+    with get_read_connection() as conn:
+        return llm_cache.stats(conn)
+
+
+@app.get("/llm/stats")
+async def llm_stats() -> dict:
+    cache = await run_read(_llm_cache_stats)
+    return {
+        "routes": model_router.stats(),
+        "cache": {"enabled": AXIMO_LLM_CACHE_ENABLED, **cache},
+        "dispatcher": llm_dispatcher.stats(),
+    }
+
+
 @app.get("/telegram/health")
-def telegram_health() -> dict:
+async def telegram_health() -> dict:
     token = os.getenv("TELEGRAM_BOT_TOKEN", "").strip()
     if not token:
         return {"ok": False, "error_code": 0, "body": "missing TELEGRAM_BOT_TOKEN"}
 
     url = f"https://api.telegram.org/bot{token}/getMe"
-    req = urllib.request.Request(url, method="GET")
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            raw_body = resp.read().decode("utf-8", errors="replace")
-            payload = json.loads(raw_body)
-            username = payload.get("result", {}).get("username", "")
-            if resp.getcode() == 200 and payload.get("ok") is True:
-                return {"ok": True, "username": username}
-            return {"ok": False, "error_code": int(resp.getcode() or 0), "body": raw_body[:200]}
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace")
-        return {"ok": False, "error_code": int(e.code), "body": body[:200]}
+        resp = await get_async_http().get(url, timeout=10)
+        raw_body = resp.text
+        if resp.status_code != 200:
+            return {"ok": False, "error_code": resp.status_code, "body": raw_body[:200]}
+        payload = json.loads(raw_body)
+        username = payload.get("result", {}).get("username", "")
+        if payload.get("ok") is True:
+            return {"ok": True, "username": username}
+        return {"ok": False, "error_code": resp.status_code, "body": raw_body[:200]}
     except Exception as e:
         return {"ok": False, "error_code": 0, "body": repr(e)[:200]}
 
 
 @app.post("/intent")
-def intent(payload: IntentRequest) -> dict:
-    result = call_ollama_structured(build_summary_prompt(payload.text, action_items_count=3, questions_count=2))
+async def intent(payload: IntentRequest) -> dict:
+    result = await call_ollama_structured_async(
+        build_summary_prompt(payload.text, action_items_count=3, questions_count=2),
+        queue_timeout=AXIMO_INTENT_QUEUE_TIMEOUT_SECONDS,
+    )
     return {
         "employee": "Admin Employee",
         "intent": "summarize",
@@ -488,57 +979,473 @@ def intent(payload: IntentRequest) -> dict:
     }
 
 
-@app.post("/tasks")
-def create_task(payload: TaskCreateRequest) -> Task:
-    task = Task(
+@app.post("/intent/stream")
+async def intent_stream(payload: IntentRequest) -> StreamingResponse:
+    # NDJSON lines: "partial" for each completed field as the model writes it, "retry" when the
+    # first attempt goes off-schema, then one final "result" carrying the validated output.
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue[dict | None] = asyncio.Queue()
+
+    def on_event(event: dict) -> None:
+        # Coalesced followers hear partials from whichever caller's generation they joined.
+        loop.call_soon_threadsafe(events.put_nowait, event)
+
+    async def produce() -> None:
+        try:
+            result = await call_ollama_structured_async(
+                build_summary_prompt(payload.text, action_items_count=3, questions_count=2),
+                on_event=on_event,
+                queue_timeout=AXIMO_INTENT_QUEUE_TIMEOUT_SECONDS,
+            )
+            events.put_nowait({"type": "result", "input": payload.text, "result": result})
+        finally:
+            events.put_nowait(None)
+
+    async def body() -> AsyncIterator[str]:
+        # Not cancelled on disconnect: other callers may be coalesced onto this generation,
+        # and the validated result still lands in the cache.
+        producer = asyncio.create_task(produce())
+        _background_tasks.add(producer)
+        producer.add_done_callback(_background_tasks.discard)
+        while True:
+            event = await events.get()
+            if event is None:
+                return
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
+def save_new_task(task: Task) -> None:
+    with task_unit_of_work() as uow:
+        uow.conn.execute(TASK_INSERT_SQL, task_to_db_values(task))
+        uow.publish("created", task)
+        send_task_created_telegram(uow, task)
+        uow.notify(
+            f"🆕 Task Created\nTitle: {task_title(task)}\nStatus: {task.status}\nBoard: https://meeting.aximo.works/kanban"
+        )
+
+
+def save_new_tasks(tasks: list[Task]) -> None:
+    # One summary message for the whole batch instead of two messages per task.
+    lines = [f"• {task_title(task)} (id:{short_id(task.id)})" for task in tasks[:10]]
+    if len(tasks) > 10:
+        lines.append(f"… and {len(tasks) - 10} more")
+    with task_unit_of_work() as uow:
+        uow.conn.executemany(TASK_INSERT_SQL, [task_to_db_values(task) for task in tasks])
+        for task in tasks:
+            uow.publish("created", task)
+        uow.notify(
+            f"🆕 {len(tasks)} Tasks Created\n" + "\n".join(lines) + "\nBoard: https://meeting.aximo.works/kanban"
+        )
+
+
+def new_task(payload: TaskCreateRequest, created_at: str | None = None) -> Task:
+    created_at = created_at or datetime.now(timezone.utc).isoformat()
+    return Task(
         id=str(uuid4()),
         text=payload.text,
         type=payload.type or "internal_generate",
         status="pending_approval",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=created_at,
+        updated_at=created_at,
         due_date=payload.due_date,
         owner=payload.owner,
         priority=normalize_priority(payload.priority),
         weight=clamp_weight(payload.weight),
     )
-    with get_db_connection() as conn:
-        conn.execute(
-            """
-            INSERT INTO tasks (
-                id, text, type, status, parent_id, created_at, output, ran_at,
-                due_date, owner, priority, weight, approved_at, approved_by,
-                rejected_at, rejected_by, reject_reason
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+
+
+@app.post("/tasks")
+async def create_task(payload: TaskCreateRequest) -> Task:
+    task = new_task(payload)
+    await run_write(save_new_task, task)
+    return task
+
+
+@app.post("/tasks:batch")
+async def create_tasks_batch(payload: TaskBatchCreateRequest) -> list[Task]:
+    created_at = datetime.now(timezone.utc).isoformat()
+    tasks = [new_task(item, created_at) for item in payload.tasks]
+    await run_write(save_new_tasks, tasks)
+    return tasks
+
+
+def encode_task_cursor(created_at: str, task_id: str) -> str:
+    raw = json.dumps([created_at, task_id], separators=(",", ":")).encode("utf-8")
+    return urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_task_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, task_id = json.loads(raw)
+        return str(created_at), str(task_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def read_task_rows(sql: str, params: list) -> tuple[int, list[sqlite3.Row]]:
+    with get_read_connection() as conn:
+        # Read the revision first: anything committed after it is re-sent by /tasks/changes.
+        rev = current_task_rev(conn)
+        return rev, conn.execute(sql, params).fetchall()
+
+
+@app.get("/tasks")
+async def list_tasks(
+    status: Literal["pending_approval", "approved", "rejected", "done"] | None = None,
+    owner: str | None = None,
+    parent_id: str | None = None,
+    due_before: str | None = None,
+    updated_since: str | None = None,
+    min_action_items: int | None = Query(default=None, ge=0),
+    fields: str | None = None,
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1, le=500),
+) -> FastJSONResponse:
+    # Without limit the whole filtered set is returned (the kanban board relies on this);
+    # with limit the page is keyed on (created_at, id) and the next cursor goes in X-Next-Cursor.
+    # fields=a,b,... returns only those keys (plus id); output_* fields come from generated
+    # columns and search docs, so a projection without "output" never reads or parses the
+    # output blob, and one with it gets the full output even when it was offloaded.
+    projection = TASK_FIELDS
+    if fields is not None:
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in TASK_PROJECTION_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+        projection = tuple(dict.fromkeys(["id", *requested]))
+    columns = list(projection)
+    if limit is not None and "created_at" not in columns:
+        columns.append("created_at")
+
+    clauses: list[str] = []
+    params: list = []
+    if status is not None:
+        clauses.append("status = ?")
+        params.append(status)
+    if owner is not None:
+        clauses.append("owner = ?")
+        params.append(owner)
+    if parent_id is not None:
+        clauses.append("parent_id = ?")
+        params.append(parent_id)
+    if due_before is not None:
+        clauses.append("due_date IS NOT NULL AND due_date < ?")
+        params.append(due_before)
+    if updated_since is not None:
+        clauses.append("updated_at >= ?")
+        params.append(updated_since)
+    if min_action_items is not None:
+        clauses.append("output_action_items_count >= ?")
+        params.append(min_action_items)
+    if cursor is not None:
+        cursor_created_at, cursor_id = decode_task_cursor(cursor)
+        clauses.append("(created_at < ? OR (created_at = ? AND id < ?))")
+        params.extend([cursor_created_at, cursor_created_at, cursor_id])
+
+    select = [TASK_PROJECTION_SQL.get(column, f"tasks.{column}") for column in columns]
+    joins: list[str] = []
+    if "output_summary" in columns:
+        joins.append(TASK_PROJECTION_JOIN)
+    if "output" in columns:
+        select.append(TASK_OUTPUT_BLOB_COLUMNS)
+        joins.append(TASK_OUTPUT_BLOB_JOIN.format(row="tasks"))
+    sql = f"SELECT {', '.join(select)} FROM tasks"
+    if joins:
+        sql += " " + " ".join(joins)
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY created_at DESC, id DESC"
+    if limit is not None:
+        # Fetch one extra row to know whether another page exists.
+        sql += " LIMIT ?"
+        params.append(limit + 1)
+
+    rev, rows = await run_read(read_task_rows, sql, params)
+    headers = {"X-Tasks-Rev": str(rev)}
+
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        headers["X-Next-Cursor"] = encode_task_cursor(last["created_at"], last["id"])
+    # Rows come straight from the tasks table, which init_db keeps normalized, so they are
+    # shaped into dicts once and rendered by orjson without building or re-validating Task models.
+    read = task_row_reader(rows[0].keys(), projection) if rows else None
+    return FastJSONResponse([read(row) for row in rows], headers=headers)
+
+
+def read_task_changes(since: int, limit: int) -> dict:
+    with get_read_connection() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT c.rev AS change_rev, c.op AS change_op, c.task_id AS change_task_id, {TASK_JOINED_COLUMNS},
+                   {TASK_OUTPUT_BLOB_COLUMNS}
+            FROM task_changes c
+            LEFT JOIN tasks t ON t.id = c.task_id
+            {TASK_OUTPUT_BLOB_JOIN.format(row="t")}
+            WHERE c.rev > ?
+            ORDER BY c.rev
+            LIMIT ?
             """,
-            task_to_db_values(task),
+            (since, limit + 1),
+        ).fetchall()
+        head = current_task_rev(conn) if not rows else None
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    changed: list[dict] = []
+    deleted: list[str] = []
+    read = task_row_reader(rows[0].keys()) if rows else None
+    for row in rows:
+        if row["change_op"] == "delete" or row["id"] is None:
+            deleted.append(row["change_task_id"])
+        else:
+            changed.append(read(row))
+    rev = rows[-1]["change_rev"] if rows else max(since, head or 0)
+    return {"rev": rev, "changed": changed, "deleted": deleted, "has_more": has_more}
+
+
+@app.get("/tasks/changes", response_model=TaskChanges)
+async def list_task_changes(
+    since: int = Query(default=0, ge=0),
+    limit: int = Query(default=1000, ge=1, le=5000),
+) -> FastJSONResponse:
+    return FastJSONResponse(await run_read(read_task_changes, since, limit))
+
+
+def fts_query(q: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, the last one as a prefix.
+
+    Words are quoted so FTS5 operators and punctuation typed by users never raise syntax errors.
+    """
+    terms = ['"' + word.replace('"', '""') + '"' for word in q.split()]
+    if terms:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+def task_search_sql(with_status: bool) -> str:
+    # Rank first, then build snippets and load task rows for the requested page only;
+    # snippet() in the ranking query would run for every match, not just the page. CROSS JOIN
+    # keeps the page as the outer loop so the second MATCH is a rowid lookup, not a rescan.
+    status_join = (
+        " JOIN task_search_docs d ON d.rowid = task_search.rowid JOIN tasks t ON t.id = d.task_id"
+        if with_status else ""
+    )
+    return f"""
+        WITH page AS (
+            SELECT task_search.rowid AS doc_rowid, bm25(task_search, 4.0, 2.0, 1.0) AS score
+            FROM task_search{status_join}
+            WHERE task_search MATCH ?{" AND t.status = ?" if with_status else ""}
+            ORDER BY score
+            LIMIT ? OFFSET ?
         )
-        conn.commit()
-    send_task_created_telegram(task)
-    task_title = getattr(task, "title", task.text)
-    send_telegram_notify(
-        f"🆕 Task Created\nTitle: {task_title}\nStatus: {task.status}\nBoard: https://meeting.aximo.works/kanban"
+        SELECT {TASK_JOINED_COLUMNS}, {TASK_OUTPUT_BLOB_COLUMNS}, page.score AS search_score,
+               snippet(task_search, -1, '[', ']', '…', 12) AS search_snippet
+        FROM page
+        CROSS JOIN task_search ON task_search.rowid = page.doc_rowid
+        JOIN task_search_docs d ON d.rowid = page.doc_rowid
+        JOIN tasks t ON t.id = d.task_id
+        {TASK_OUTPUT_BLOB_JOIN.format(row="t")}
+        WHERE task_search MATCH ?
+        ORDER BY page.score
+    """
+
+
+def read_search_rows(sql: str, params: list) -> list[sqlite3.Row]:
+    with get_read_connection() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+@app.get("/tasks/search", response_model=list[TaskSearchHit])
+async def search_tasks(
+    q: str = Query(min_length=1, max_length=200),
+    status: Literal["pending_approval", "approved", "rejected", "done"] | None = None,
+    offset: int = Query(default=0, ge=0, le=10000),
+    limit: int = Query(default=20, ge=1, le=100),
+) -> FastJSONResponse:
+    # Best match first (bm25 weighs task text over summary over action items). Ranked results
+    # have no stable key to page on, so pages are offset based; X-Next-Offset is set when more exist.
+    match = fts_query(q)
+    if not match:
+        return FastJSONResponse([])
+    params: list = [match] + ([status] if status is not None else []) + [limit + 1, offset, match]
+    sql = task_search_sql(status is not None)
+
+    rows = await run_read(read_search_rows, sql, params)
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Offset"] = str(offset + limit)
+    read = task_row_reader(rows[0].keys()) if rows else None
+    hits = [
+        {"task": read(row), "score": -row["search_score"], "snippet": row["search_snippet"] or ""}
+        for row in rows
+    ]
+    return FastJSONResponse(hits, headers=headers)
+
+
+TASK_EVENT_FIELDS = tuple(TaskEvent.model_fields)
+
+
+def read_event_page(sql: str, params: list, limit: int) -> tuple[list[dict], str | None]:
+    with get_read_connection() as conn:
+        rows = conn.execute(sql, [*params, limit + 1]).fetchall()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_task_cursor(rows[-1]["created_at"], rows[-1]["id"])
+    return [dict(zip(TASK_EVENT_FIELDS, row)) for row in rows], next_cursor
+
+
+def event_page_response(events: list[dict], next_cursor: str | None) -> FastJSONResponse:
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor is not None else None
+    return FastJSONResponse(events, headers=headers)
+
+
+@app.get("/tasks/{task_id}/events", response_model=list[TaskEvent])
+async def list_task_events(
+    task_id: str,
+    cursor: str | None = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+) -> FastJSONResponse:
+    # Newest first, keyed on (created_at, id) like /tasks; events older than the archive
+    # cutoff live in backend/data/event_archive (see scripts/archive_task_events.py).
+    sql = f"SELECT {', '.join(TASK_EVENT_FIELDS)} FROM task_events WHERE task_id = ?"
+    params: list = [task_id]
+    if cursor is not None:
+        cursor_created_at, cursor_id = decode_task_cursor(cursor)
+        sql += " AND (created_at < ? OR (created_at = ? AND id < ?))"
+        params.extend([cursor_created_at, cursor_created_at, cursor_id])
+    sql += " ORDER BY created_at DESC, id DESC LIMIT ?"
+    return event_page_response(*await run_read(read_event_page, sql, params, limit))
+
+
+@app.get("/events", response_model=list[TaskEvent])
+async def list_events(
+    since: str | None = None,
+    cursor: str | None = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+) -> FastJSONResponse:
+    # Oldest first from ``since`` so a consumer can tail the log by following X-Next-Cursor.
+    sql = f"SELECT {', '.join(TASK_EVENT_FIELDS)} FROM task_events"
+    clauses: list[str] = []
+    params: list = []
+    if since is not None:
+        clauses.append("created_at >= ?")
+        params.append(since)
+    if cursor is not None:
+        cursor_created_at, cursor_id = decode_task_cursor(cursor)
+        clauses.append("(created_at > ? OR (created_at = ? AND id > ?))")
+        params.extend([cursor_created_at, cursor_created_at, cursor_id])
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY created_at, id LIMIT ?"
+    return event_page_response(*await run_read(read_event_page, sql, params, limit))
+
+
+def read_pressure_candidates(cutoff: str) -> list[sqlite3.Row]:
+    # Only overdue tasks and tasks due within 72h can score, so the due_date index bounds
+    # the scan to that window instead of every row in the table.
+    with get_read_connection() as conn:
+        return conn.execute(
+            f"""
+            SELECT {TASK_COLUMNS} FROM tasks
+            WHERE due_date IS NOT NULL AND due_date != '' AND due_date < ?
+            ORDER BY created_at DESC
+            """,
+            (cutoff,),
+        ).fetchall()
+
+
+@app.get("/tasks/pressure")
+async def task_pressure(
+    top: int = Query(default=10, ge=1, le=5000),
+    status: list[Literal["pending_approval", "approved", "rejected", "done"]] | None = Query(default=None),
+    as_of: str | None = None,
+    include_tasks: bool = True,
+) -> PressureRanking:
+    now = parse_due_date(as_of) if as_of else datetime.now(timezone.utc)
+    if now is None:
+        raise HTTPException(status_code=400, detail="Invalid as_of")
+    rows = await run_read(read_pressure_candidates, pressure_due_cutoff(now))
+    # Without status= only open tasks are ranked; an old overdue done task would otherwise lead.
+    ranked, totals = rank_pressure(rows, now, top, set(status or OPEN_STATUSES))
+    read = task_row_reader(rows[0].keys()) if rows and include_tasks else None
+    changes = [
+        at for at in (next_score_change_ms(parse_due_date(row["due_date"]), now) for row in rows) if at is not None
+    ]
+    return PressureRanking(
+        as_of=now.isoformat(),
+        top=[
+            PressureEntry(
+                task_id=row["id"],
+                task=Task.model_construct(**read(row)) if read is not None else None,
+                **score,
+            )
+            for row, score in ranked
+        ],
+        totals=totals,
+        next_change_at=(
+            datetime.fromtimestamp(min(changes) / 1000, timezone.utc).isoformat() if changes else None
+        ),
+    )
+
+
+@app.get("/tasks/pressure/forecast")
+async def task_pressure_forecast(
+    hours: int = Query(default=72, ge=1, le=24 * 14),
+    step_minutes: int = Query(default=60, ge=5, le=24 * 60),
+    status: list[Literal["pending_approval", "approved", "rejected", "done"]] | None = Query(default=None),
+) -> PressureForecast:
+    now = datetime.now(timezone.utc)
+    as_of = [now + timedelta(minutes=m) for m in range(0, hours * 60 + 1, step_minutes)]
+    # Anything due past the last timestamp's scoring window is zero at every step.
+    rows = await run_read(read_pressure_candidates, pressure_due_cutoff(as_of[-1]))
+    if status:
+        rows = [row for row in rows if row["status"] in status]
+    columns = load_columns(rows)
+    _, p2 = score_columns(columns, as_of)
+    return PressureForecast(
+        as_of=[ts.isoformat() for ts in as_of],
+        totals=totals_by_status(columns, p2),
+        total=p2.sum(axis=1).tolist(),
+    )
+
+
+@app.get("/tasks/stream")
+async def stream_tasks(request: Request) -> StreamingResponse:
+    return StreamingResponse(
+        task_events.stream(request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
     )
+
+
+def read_task(task_id: str) -> Task:
+    with get_read_connection() as conn:
+        task = get_task_by_id(conn, task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
     return task
 
 
-@app.get("/tasks")
-def list_tasks() -> list[Task]:
-    with get_db_connection() as conn:
-        rows = conn.execute("SELECT * FROM tasks ORDER BY created_at DESC").fetchall()
-    return [row_to_task(row) for row in rows]
+# Declared after the fixed /tasks/... GET routes so it does not capture them.
+@app.get("/tasks/{task_id}")
+async def get_task(task_id: str) -> Task:
+    return await run_read(read_task, task_id)
 
 
 @app.post("/tasks/{task_id}/approve")
-def approve_task(task_id: str) -> Task:
-    task = approve_task_internal(task_id, approved_by="admin")
-    send_telegram_notify(f"✅ Approved: {task_title(task)} (id:{short_id(task.id)})")
-    return task
+async def approve_task(task_id: str) -> Task:
+    return await approve_task_internal_async(task_id, approved_by="admin")
 
 
 @app.post("/tasks/{task_id}/reject")
-def reject_task(task_id: str, payload: TaskRejectRequest) -> Task:
-    updated = reject_task_internal(task_id, payload.reason, rejected_by="admin")
+async def reject_task(task_id: str, payload: TaskRejectRequest) -> Task:
+    updated = await reject_task_internal_async(task_id, payload.reason, rejected_by="admin")
     return updated
 
 
@@ -568,19 +1475,15 @@ async def telegram_webhook(request: Request) -> JSONResponse:
             if data.startswith("APPROVE:"):
                 task_id = data.split(":", 1)[1].strip()
                 try:
-                    updated = approve_task_internal(task_id, approved_by="admin")
-                    with get_db_connection() as evconn:
-                        insert_task_event(evconn, task_id, "approved", "pending_approval", "approved", "admin", None)
-                        evconn.commit()
-                    if chat_id is not None:
-                        send_telegram_notify(f"✅ Approved: {task_title(updated)} (id:{short_id(updated.id)})", chat_id=chat_id)
+                    # Approval, its event and the chat reply commit in one transaction.
+                    await approve_task_internal_async(task_id, approved_by="admin", chat_id=chat_id)
                 except HTTPException as e:
                     if chat_id is not None:
-                        send_telegram_notify(f"Approve failed (id:{short_id(task_id)}): {e.detail}", chat_id=chat_id)
+                        await queue_telegram_notify_async(f"Approve failed (id:{short_id(task_id)}): {e.detail}", chat_id=chat_id)
             elif data.startswith("REJECT:"):
                 task_id = data.split(":", 1)[1].strip()
                 if chat_id is not None:
-                    send_telegram_notify(f"Reply with: REJECT_REASON:{task_id}:<your reason>", chat_id=chat_id)
+                    await queue_telegram_notify_async(f"Reply with: REJECT_REASON:{task_id}:<your reason>", chat_id=chat_id)
 
             return JSONResponse(status_code=200, content={"ok": True})
 
@@ -595,109 +1498,355 @@ async def telegram_webhook(request: Request) -> JSONResponse:
                     task_id = parts[1].strip()
                     reason = parts[2].strip()
                     try:
-                        updated = reject_task_internal(task_id, reason, rejected_by="admin")
-                        with get_db_connection() as evconn:
-                            insert_task_event(evconn, task_id, "rejected", "pending_approval", "rejected", "admin", reason)
-                            evconn.commit()
-                        if chat_id is not None:
-                            send_telegram_notify(f"❌ Rejected: {task_title(updated)} (id:{short_id(updated.id)})", chat_id=chat_id)
+                        await reject_task_internal_async(task_id, reason, rejected_by="admin", chat_id=chat_id)
                     except HTTPException as e:
                         if chat_id is not None:
-                            send_telegram_notify(f"Reject failed (id:{short_id(task_id)}): {e.detail}", chat_id=chat_id)
+                            await queue_telegram_notify_async(f"Reject failed (id:{short_id(task_id)}): {e.detail}", chat_id=chat_id)
                 elif chat_id is not None:
-                    send_telegram_notify("Reply with: REJECT_REASON:<task_id>:<your reason>", chat_id=chat_id)
+                    await queue_telegram_notify_async("Reply with: REJECT_REASON:<task_id>:<your reason>", chat_id=chat_id)
     except Exception:
         pass
 
     return JSONResponse(status_code=200, content={"ok": True})
 
 
-@app.post("/tasks/{task_id}/status")
-def update_task_status(task_id: str, payload: TaskStatusUpdateRequest) -> Task:
-    with get_db_connection() as conn:
-        task = get_task_by_id(conn, task_id)
+def update_task_status_internal(task_id: str, status: str) -> Task:
+    with task_unit_of_work() as uow:
+        task = get_task_by_id(uow.conn, task_id)
         if task is None:
             raise HTTPException(status_code=404, detail="Task not found")
         previous_status = task.status
 
-        conn.execute("UPDATE tasks SET status = ? WHERE id = ?", (payload.status, task_id))
-        updated = get_task_by_id(conn, task_id)
+        updated_at = datetime.now(timezone.utc).isoformat()
+        uow.conn.execute(
+            "UPDATE tasks SET status = ?, updated_at = ? WHERE id = ?",
+            (status, updated_at, task_id),
+        )
+        updated = get_task_by_id(uow.conn, task_id)
         if updated is None:
             raise HTTPException(status_code=404, detail="Task not found")
 
-        if updated.parent_id:
-            child_rows = conn.execute(
-                "SELECT status FROM tasks WHERE parent_id = ?",
-                (updated.parent_id,),
-            ).fetchall()
-            if child_rows and all(row["status"] == "done" for row in child_rows):
-                conn.execute("UPDATE tasks SET status = ? WHERE id = ?", ("done", updated.parent_id))
+        completed_parents: list[Task] = []
+        if updated.parent_id and status == "done":
+            completed = rollup_completed_parents(uow.conn, [updated.parent_id], updated_at)
+            completed_parents = list(fetch_tasks_by_ids(uow.conn, completed).values())
 
-        conn.commit()
+        if previous_status != status:
+            uow.publish("status_changed", updated)
+        for parent in completed_parents:
+            uow.publish("status_changed", parent)
 
-    if previous_status != payload.status:
-        with get_db_connection() as evconn:
+        if previous_status != status:
             if AXIMO_DEBUG_EVENTS:
-                print(f"EVENTLOG status_changed {task_id} {previous_status}->{payload.status}", flush=True)
-            insert_task_event(evconn, task_id, "status_changed", previous_status, payload.status, "admin", None)
-            evconn.commit()
-        send_telegram_notify(f"🔄 Status: {task_title(updated)} → {payload.status} (id:{short_id(updated.id)})")
-        if payload.status == "done":
-            send_telegram_notify(f"🎉 Done: {task_title(updated)} (id:{short_id(updated.id)})")
+                print(f"EVENTLOG status_changed {task_id} {previous_status}->{status}", flush=True)
+            uow.event(task_id, "status_changed", previous_status, status, "admin", None, updated_at)
+            uow.notify(f"🔄 Status: {task_title(updated)} → {status} (id:{short_id(updated.id)})")
+            if status == "done":
+                uow.notify(f"🎉 Done: {task_title(updated)} (id:{short_id(updated.id)})")
     return updated
 
 
-@app.post("/tasks/{task_id}/run")
-def run_task(task_id: str) -> Task:
+@app.post("/tasks/{task_id}/status")
+async def update_task_status(task_id: str, payload: TaskStatusUpdateRequest) -> Task:
+    return await run_write(update_task_status_internal, task_id, payload.status)
+
+
+def fetch_tasks_by_ids(conn: sqlite3.Connection, task_ids: list[str]) -> dict[str, Task]:
+    # json_each keeps this one statement with one bound parameter however many ids there are.
+    rows = conn.execute(
+        f"SELECT {TASK_COLUMNS} FROM tasks WHERE id IN (SELECT value FROM json_each(?))",
+        (json.dumps(task_ids),),
+    ).fetchall()
+    read = task_row_reader(rows[0].keys()) if rows else None
+    return {row["id"]: Task.model_construct(**read(row)) for row in rows}
+
+
+def rollup_completed_parents(conn: sqlite3.Connection, parent_ids: list[str], updated_at: str) -> list[str]:
+    """Mark parents done once all their children are, walking up the parent_id chain.
+
+    Reads the trigger-maintained task_child_counts row for each level, so the cost is
+    O(depth) per changed child rather than a scan of its siblings. Returns the ids
+    marked done, nearest first.
+    """
+    completed: list[str] = []
+    pending = list(dict.fromkeys(parent_ids))
+    while pending:
+        parent_id = pending.pop(0)
+        row = conn.execute(
+            """
+            SELECT t.status, t.parent_id, c.total, c.done
+            FROM tasks t JOIN task_child_counts c ON c.parent_id = t.id
+            WHERE t.id = ?
+            """,
+            (parent_id,),
+        ).fetchone()
+        if row is None or row["status"] == "done" or row["total"] == 0 or row["done"] < row["total"]:
+            continue
+        # The child-count trigger bumps the grandparent's done counter as part of this update.
+        conn.execute(
+            "UPDATE tasks SET status = 'done', updated_at = ? WHERE id = ?",
+            (updated_at, parent_id),
+        )
+        completed.append(parent_id)
+        if row["parent_id"] and row["parent_id"] not in pending:
+            pending.append(row["parent_id"])
+    return completed
+
+
+def bulk_transition_tasks(
+    task_ids: list[str],
+    action: str,
+    status: str | None = None,
+    reason: str | None = None,
+    actor: str = "admin",
+) -> list[TaskTransitionOutcome]:
+    """Apply one transition to many tasks in a single writer transaction.
+
+    Guards match approve_task_internal / reject_task_internal; a task failing them is
+    reported in its outcome and does not abort the rest of the batch.
+    """
+    task_ids = list(dict.fromkeys(task_ids))
+    now = datetime.now(timezone.utc).isoformat()
+    reject_reason = (reason or "")[:500] or None
+    event_type = {"approve": "approved", "reject": "rejected", "status": "status_changed"}[action]
+    target = {"approve": "approved", "reject": "rejected"}.get(action, status)
+
+    outcomes: dict[str, TaskTransitionOutcome] = {}
+    updates: list[tuple] = []
+    events: list[tuple] = []
+    with task_unit_of_work() as uow:
+        conn = uow.conn
+        current = fetch_tasks_by_ids(conn, task_ids)
+        for task_id in task_ids:
+            task = current.get(task_id)
+            try:
+                if action == "status":
+                    if task is None:
+                        raise HTTPException(status_code=404, detail="Task not found")
+                else:
+                    require_open_task(task)
+            except HTTPException as e:
+                outcome = "not_found" if e.status_code == 404 else "conflict"
+                outcomes[task_id] = TaskTransitionOutcome(id=task_id, outcome=outcome, detail=e.detail)
+                continue
+            if task.status == target and action != "reject":
+                outcomes[task_id] = TaskTransitionOutcome(id=task_id, outcome="unchanged", task=task)
+                continue
+            if action == "approve":
+                updates.append((now, actor, now, task_id))
+            elif action == "reject":
+                updates.append((now, actor, reject_reason, now, task_id))
+            else:
+                updates.append((target, now, task_id))
+            events.append(task_event_values(task_id, event_type, task.status, target, actor,
+                                            reject_reason if action == "reject" else None, now))
+
+        if updates:
+            sql = {
+                "approve": APPROVE_TASK_SQL,
+                "reject": REJECT_TASK_SQL,
+                "status": "UPDATE tasks SET status = ?, updated_at = ? WHERE id = ?",
+            }[action]
+            conn.executemany(sql, updates)
+            uow.events(events)
+
+        changed_ids = [values[-1] for values in updates]
+        completed_parents: list[str] = []
+        if action == "status" and target == "done" and changed_ids:
+            parent_ids = [current[task_id].parent_id for task_id in changed_ids if current[task_id].parent_id]
+            completed_parents = rollup_completed_parents(conn, parent_ids, now)
+        refreshed = fetch_tasks_by_ids(conn, changed_ids + completed_parents)
+
+        for task_id in changed_ids:
+            outcomes[task_id] = TaskTransitionOutcome(id=task_id, outcome="updated", task=refreshed.get(task_id))
+            if task_id in refreshed:
+                uow.publish("status_changed" if action == "status" else event_type, refreshed[task_id])
+        for parent_id in completed_parents:
+            if parent_id in refreshed:
+                uow.publish("status_changed", refreshed[parent_id])
+
+        if changed_ids:
+            label = {"approve": "✅ Approved", "reject": "❌ Rejected"}.get(action, f"🔄 Status → {target}")
+            lines = [f"• {task_title(refreshed[task_id])} (id:{short_id(task_id)})" for task_id in changed_ids[:10] if task_id in refreshed]
+            if len(changed_ids) > 10:
+                lines.append(f"… and {len(changed_ids) - 10} more")
+            uow.notify(f"{label}: {len(changed_ids)} tasks\n" + "\n".join(lines))
+    return [outcomes[task_id] for task_id in task_ids]
+
+
+@app.post("/tasks:transition")
+async def bulk_transition(payload: TaskBulkTransitionRequest) -> list[TaskTransitionOutcome]:
+    if payload.action == "status" and payload.status is None:
+        raise HTTPException(status_code=422, detail="status is required for action=status")
+    return await run_write(bulk_transition_tasks, payload.ids, payload.action, payload.status, payload.reason)
+
+
+run_executor = ThreadPoolExecutor(max_workers=AXIMO_RUN_WORKERS, thread_name_prefix="aximo-run")
+
+
+def row_to_job(row: sqlite3.Row, task: Task | None = None) -> TaskJob:
+    return TaskJob(
+        id=row["id"],
+        task_id=row["task_id"],
+        status=row["status"],
+        error=row["error"],
+        created_at=row["created_at"],
+        started_at=row["started_at"],
+        finished_at=row["finished_at"],
+        task=task,
+    )
+
+
+def finish_run_job(job_id: str, status: str, error: str | None = None) -> None:
     with get_db_connection() as conn:
-        task = get_task_by_id(conn, task_id)
-        if task is None:
-            raise HTTPException(status_code=404, detail="Task not found")
+        conn.execute(
+            "UPDATE task_jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+            (status, error, datetime.now(timezone.utc).isoformat(), job_id),
+        )
+
+
+def resume_run_jobs() -> None:
+    with get_db_connection() as conn:
+        # A job that was mid-generation when the process died cannot be resumed safely.
+        conn.execute(
+            "UPDATE task_jobs SET status = 'failed', error = ?, finished_at = ? WHERE status = 'running'",
+            ("interrupted by restart", datetime.now(timezone.utc).isoformat()),
+        )
+        queued = conn.execute(
+            "SELECT id, task_id FROM task_jobs WHERE status = 'queued' ORDER BY created_at"
+        ).fetchall()
+    for row in queued:
+        run_executor.submit(execute_run_job, row["id"], row["task_id"])
+
+
+class RunConflict(Exception):
+    pass
+
+
+def run_conflict(task_type: str, status: str) -> str | None:
+    if task_type == "external_execute" and status != "approved":
+        return "Task must be approved before run"
+    return None
 
-        if task.type == "external_execute" and task.status != "approved":
-            raise HTTPException(status_code=409, detail="Task must be approved before run")
 
+def execute_run_job(job_id: str, task_id: str) -> None:
+    try:
+        with get_db_connection() as conn:
+            conn.execute(
+                "UPDATE task_jobs SET status = 'running', started_at = ? WHERE id = ?",
+                (datetime.now(timezone.utc).isoformat(), job_id),
+            )
+            task = get_task_by_id(conn, task_id)
+        # The job may have waited in the queue; re-check what enqueue_run_job checked.
+        if task is None:
+            finish_run_job(job_id, "failed", "Task not found")
+            return
+        conflict = run_conflict(task.type, task.status)
+        if conflict is not None:
+            finish_run_job(job_id, "failed", f"conflict: {conflict}")
+            return
+
+        # The model call holds no connection; only the short result write below takes the writer.
+        # No queue deadline: a busy queue must delay the job, never turn it into fallback tasks.
         result = call_ollama_structured(
-            build_summary_prompt(task.text, action_items_count=3, questions_count=2)
+            build_summary_prompt(task.text, action_items_count=3, questions_count=2),
+            queue_timeout=math.inf,
         )
         ran_at = datetime.now(timezone.utc).isoformat()
         next_status: Literal["pending_approval", "approved", "rejected", "done"] = (
             "approved" if task.type == "internal_generate" else "done"
         )
 
+        children: list[Task] = []
+        with task_unit_of_work() as uow:
+            conn = uow.conn
+            # The task may have been rejected, deleted or retyped during generation; raising
+            # here rolls back before the output or any child task is written.
+            current = conn.execute("SELECT type, status FROM tasks WHERE id = ?", (task_id,)).fetchone()
+            if current is None:
+                raise RunConflict("Task not found")
+            if (current["type"], current["status"]) != (task.type, task.status):
+                raise RunConflict(f"Task changed while running (now {current['type']}/{current['status']})")
+            conn.execute(
+                "UPDATE tasks SET status = ?, output = ?, ran_at = ?, updated_at = ? WHERE id = ?",
+                (next_status, store_task_output(conn, task_id, result), ran_at, ran_at, task_id),
+            )
+            write_search_doc(conn, task_id, result)
+            if task.type == "internal_generate":
+                for item in result.get("action_items", []):
+                    child = Task(
+                        id=str(uuid4()),
+                        text=str(item),
+                        type="internal_generate",
+                        status="pending_approval",
+                        parent_id=task.id,
+                        created_at=ran_at,
+                    )
+                    conn.execute(TASK_INSERT_SQL, task_to_db_values(child))
+                    children.append(child)
+            conn.execute(
+                "UPDATE task_jobs SET status = 'succeeded', finished_at = ? WHERE id = ?",
+                (ran_at, job_id),
+            )
+            updated = get_task_by_id(conn, task_id)
+            if updated is not None:
+                uow.event(task_id, "run", task.status, next_status, "runner", None, ran_at)
+                uow.publish("run", updated)
+                for child in children:
+                    uow.publish("created", child)
+                uow.notify(f"▶️ Running: {task_title(updated)} (id:{short_id(updated.id)})")
+    except RunConflict as e:
+        finish_run_job(job_id, "failed", f"conflict: {e}")
+    except Exception as e:
+        print(f"RUN job failed job={job_id} task={task_id}: {e!r}", flush=True)
+        finish_run_job(job_id, "failed", repr(e)[:500])
+
+
+def enqueue_run_job(task_id: str) -> TaskJob:
+    with get_db_connection() as conn:
+        task = get_task_by_id(conn, task_id)
+        if task is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+
+        conflict = run_conflict(task.type, task.status)
+        if conflict is not None:
+            raise HTTPException(status_code=409, detail=conflict)
+
+        # Repeated clicks while a run is pending attach to the same job instead of generating twice.
+        existing = conn.execute(
+            "SELECT * FROM task_jobs WHERE task_id = ? AND status IN ('queued', 'running') ORDER BY created_at DESC LIMIT 1",
+            (task_id,),
+        ).fetchone()
+        if existing is not None:
+            return row_to_job(existing)
+
+        job_id = str(uuid4())
         conn.execute(
-            "UPDATE tasks SET status = ?, output = ?, ran_at = ? WHERE id = ?",
-            (next_status, json.dumps(result), ran_at, task_id),
+            "INSERT INTO task_jobs (id, task_id, status, created_at) VALUES (?, ?, 'queued', ?)",
+            (job_id, task_id, datetime.now(timezone.utc).isoformat()),
         )
+        row = conn.execute("SELECT * FROM task_jobs WHERE id = ?", (job_id,)).fetchone()
 
-        if task.type == "internal_generate":
-            for item in result.get("action_items", []):
-                child = Task(
-                    id=str(uuid4()),
-                    text=str(item),
-                    type="internal_generate",
-                    status="pending_approval",
-                    parent_id=task.id,
-                    created_at=ran_at,
-                )
-                conn.execute(
-                    """
-                    INSERT INTO tasks (
-                        id, text, type, status, parent_id, created_at, output, ran_at,
-                        due_date, owner, priority, weight, approved_at, approved_by,
-                        rejected_at, rejected_by, reject_reason
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    task_to_db_values(child),
-                )
+    run_executor.submit(execute_run_job, job_id, task_id)
+    return row_to_job(row)
 
-        conn.commit()
-        updated = get_task_by_id(conn, task_id)
 
-    if updated is None:
-        raise HTTPException(status_code=404, detail="Task not found")
+@app.post("/tasks/{task_id}/run", status_code=202)
+async def run_task(task_id: str, response: Response) -> TaskJob:
+    job = await run_write(enqueue_run_job, task_id)
+    response.headers["Location"] = f"/jobs/{job.id}"
+    return job
 
-    send_telegram_notify(f"▶️ Running: {task_title(updated)} (id:{short_id(updated.id)})")
 
-    return updated
+def read_job(job_id: str) -> TaskJob:
+    with get_read_connection() as conn:
+        row = conn.execute("SELECT * FROM task_jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        task = get_task_by_id(conn, row["task_id"]) if row["status"] == "succeeded" else None
+    return row_to_job(row, task)
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str) -> TaskJob:
+    return await run_read(read_job, job_id)
@@ -0,0 +1,457 @@
+import sqlite3
+from datetime import datetime, timezone
+from typing import Callable, NamedTuple
+
+from escalation import init_task_escalations
+from llm_cache import init_llm_cache
+from output_store import init_task_outputs, load_task_output, write_search_doc
+from telegram_notify import init_outbox
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    apply: Callable[[sqlite3.Connection], None]
+
+
+TASK_COLUMNS_ADDED_LATER = {
+    "due_date": "TEXT NULL",
+    "owner": "TEXT NULL",
+    "priority": "TEXT NOT NULL DEFAULT 'medium'",
+    "weight": "REAL NOT NULL DEFAULT 1.0",
+    "approved_at": "TEXT NULL",
+    "approved_by": "TEXT NULL",
+    "rejected_at": "TEXT NULL",
+    "rejected_by": "TEXT NULL",
+    "reject_reason": "TEXT NULL",
+    "updated_at": "TEXT NULL",
+}
+
+
+def create_tasks_table(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id TEXT PRIMARY KEY,
+            text TEXT NOT NULL,
+            type TEXT NOT NULL,
+            status TEXT NOT NULL,
+            parent_id TEXT NULL,
+            created_at TEXT NOT NULL,
+            output TEXT NULL,
+            ran_at TEXT NULL,
+            due_date TEXT NULL,
+            owner TEXT NULL,
+            priority TEXT NOT NULL DEFAULT 'medium',
+            weight REAL NOT NULL DEFAULT 1.0,
+            approved_at TEXT NULL,
+            approved_by TEXT NULL,
+            rejected_at TEXT NULL,
+            rejected_by TEXT NULL,
+            reject_reason TEXT NULL,
+            updated_at TEXT NULL
+        )
+        """
+    )
+    # Databases created before schema_version existed may predate some of these columns.
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(tasks)").fetchall()}
+    for name, ddl in TASK_COLUMNS_ADDED_LATER.items():
+        if name not in columns:
+            conn.execute(f"ALTER TABLE tasks ADD COLUMN {name} {ddl}")
+
+
+def normalize_tasks(conn: sqlite3.Connection) -> None:
+    conn.execute("UPDATE tasks SET priority = 'medium' WHERE priority IS NULL OR priority NOT IN ('low','medium','high')")
+    conn.execute("UPDATE tasks SET weight = 1.0 WHERE weight IS NULL")
+    conn.execute("UPDATE tasks SET weight = 0.1 WHERE weight < 0.1")
+    conn.execute("UPDATE tasks SET weight = 10.0 WHERE weight > 10.0")
+    conn.execute("UPDATE tasks SET updated_at = COALESCE(ran_at, created_at) WHERE updated_at IS NULL")
+
+
+def create_task_indexes(conn: sqlite3.Connection) -> None:
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_created_at_id ON tasks(created_at, id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_created_at ON tasks(status, created_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_parent_id ON tasks(parent_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks(due_date)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON tasks(updated_at)")
+
+
+TASK_CHANGE_TRIGGERS = {
+    "trg_tasks_change_insert": ("AFTER INSERT", "NEW.id", "upsert"),
+    "trg_tasks_change_update": ("AFTER UPDATE", "NEW.id", "upsert"),
+    "trg_tasks_change_delete": ("AFTER DELETE", "OLD.id", "delete"),
+}
+
+
+def init_task_changes(conn: sqlite3.Connection) -> None:
+    # One row per task holding the revision of its latest change. Triggers keep it current for
+    # every writer, including scripts that touch the database directly.
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'task_changes'"
+    ).fetchone()
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS task_changes (
+            task_id TEXT PRIMARY KEY,
+            rev INTEGER NOT NULL,
+            op TEXT NOT NULL,
+            changed_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_task_changes_rev ON task_changes(rev)")
+    for name, (timing, id_ref, op) in TASK_CHANGE_TRIGGERS.items():
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {name} {timing} ON tasks
+            BEGIN
+                INSERT OR REPLACE INTO task_changes (task_id, rev, op, changed_at)
+                VALUES (
+                    {id_ref},
+                    (SELECT COALESCE(MAX(rev), 0) + 1 FROM task_changes),
+                    '{op}',
+                    strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+                );
+            END
+            """
+        )
+    if not exists:
+        conn.execute(
+            """
+            INSERT INTO task_changes (task_id, rev, op, changed_at)
+            SELECT id, ROW_NUMBER() OVER (ORDER BY created_at, id), 'upsert', COALESCE(updated_at, created_at)
+            FROM tasks
+            """
+        )
+
+
+def create_task_jobs(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS task_jobs (
+            id TEXT PRIMARY KEY,
+            task_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            error TEXT NULL,
+            created_at TEXT NOT NULL,
+            started_at TEXT NULL,
+            finished_at TEXT NULL
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_task_jobs_task_status ON task_jobs(task_id, status)")
+
+
+def create_task_events(conn: sqlite3.Connection) -> None:
+    # insert_task_event has always written here; nothing created the table until now.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS task_events (
+            id TEXT PRIMARY KEY,
+            task_id TEXT NOT NULL,
+            event_type TEXT NOT NULL,
+            from_status TEXT NULL,
+            to_status TEXT NULL,
+            actor TEXT NULL,
+            reason TEXT NULL,
+            created_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_task_events_task_created_at ON task_events(task_id, created_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_task_events_created_at ON task_events(created_at)")
+
+
+def create_task_child_counts(conn: sqlite3.Connection) -> None:
+    # Per-parent (total, done) child counters so completion rollup reads one row per level
+    # instead of rescanning siblings. Triggers keep them exact for every writer.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS task_child_counts (
+            parent_id TEXT PRIMARY KEY,
+            total INTEGER NOT NULL DEFAULT 0,
+            done INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_child_count_insert AFTER INSERT ON tasks
+        WHEN NEW.parent_id IS NOT NULL
+        BEGIN
+            INSERT INTO task_child_counts (parent_id, total, done)
+            VALUES (NEW.parent_id, 1, NEW.status = 'done')
+            ON CONFLICT(parent_id) DO UPDATE SET total = total + 1, done = done + excluded.done;
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_child_count_delete AFTER DELETE ON tasks
+        WHEN OLD.parent_id IS NOT NULL
+        BEGIN
+            UPDATE task_child_counts
+            SET total = total - 1, done = done - (OLD.status = 'done')
+            WHERE parent_id = OLD.parent_id;
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_child_count_update AFTER UPDATE OF status, parent_id ON tasks
+        WHEN OLD.parent_id IS NOT NEW.parent_id OR (OLD.status = 'done') != (NEW.status = 'done')
+        BEGIN
+            UPDATE task_child_counts
+            SET total = total - 1, done = done - (OLD.status = 'done')
+            WHERE parent_id = OLD.parent_id;
+            INSERT INTO task_child_counts (parent_id, total, done)
+            SELECT NEW.parent_id, 1, NEW.status = 'done' WHERE NEW.parent_id IS NOT NULL
+            ON CONFLICT(parent_id) DO UPDATE SET total = total + 1, done = done + excluded.done;
+        END
+        """
+    )
+    conn.execute("DELETE FROM task_child_counts")
+    conn.execute(
+        """
+        INSERT INTO task_child_counts (parent_id, total, done)
+        SELECT parent_id, COUNT(*), SUM(status = 'done') FROM tasks
+        WHERE parent_id IS NOT NULL
+        GROUP BY parent_id
+        """
+    )
+
+
+def create_task_event_keyset_indexes(conn: sqlite3.Connection) -> None:
+    # The event APIs page on (created_at, id); with id in the index a page is one range scan.
+    conn.execute("DROP INDEX IF EXISTS idx_task_events_task_created_at")
+    conn.execute("DROP INDEX IF EXISTS idx_task_events_created_at")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_task_events_task_created_at_id ON task_events(task_id, created_at, id)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_task_events_created_at_id ON task_events(created_at, id)")
+
+
+TASK_SEARCH_DOC_VALUES = """
+    {row}.text,
+    CASE WHEN json_valid({row}.output) THEN json_extract({row}.output, '$.summary') END,
+    CASE WHEN json_valid({row}.output) THEN
+        (SELECT group_concat(value, char(10)) FROM json_each({row}.output, '$.action_items'))
+    END
+"""
+
+
+def create_task_search(conn: sqlite3.Connection) -> None:
+    # task_search_docs holds the searchable text of each task under a stable INTEGER rowid (a
+    # tasks rowid may change on VACUUM); task_search indexes it as an external-content FTS5 table,
+    # so the text is stored once and snippet() reads it from the docs row.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS task_search_docs (
+            rowid INTEGER PRIMARY KEY,
+            task_id TEXT NOT NULL UNIQUE,
+            text TEXT NULL,
+            summary TEXT NULL,
+            action_items TEXT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS task_search USING fts5(
+            text, summary, action_items,
+            content = 'task_search_docs', content_rowid = 'rowid',
+            tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+        )
+        """
+    )
+    conn.execute("DELETE FROM task_search_docs")
+    conn.execute(
+        f"INSERT INTO task_search_docs (task_id, text, summary, action_items) "
+        f"SELECT id, {TASK_SEARCH_DOC_VALUES.format(row='tasks')} FROM tasks"
+    )
+    conn.execute("INSERT INTO task_search (task_search) VALUES ('rebuild')")
+
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_search_insert AFTER INSERT ON tasks
+        BEGIN
+            INSERT INTO task_search_docs (task_id, text, summary, action_items)
+            VALUES (NEW.id, {TASK_SEARCH_DOC_VALUES.format(row='NEW')});
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_search_update AFTER UPDATE OF id, text, output ON tasks
+        BEGIN
+            DELETE FROM task_search_docs WHERE task_id = OLD.id;
+            INSERT INTO task_search_docs (task_id, text, summary, action_items)
+            VALUES (NEW.id, {TASK_SEARCH_DOC_VALUES.format(row='NEW')});
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_search_delete AFTER DELETE ON tasks
+        BEGIN
+            DELETE FROM task_search_docs WHERE task_id = OLD.id;
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_task_search_docs_insert AFTER INSERT ON task_search_docs
+        BEGIN
+            INSERT INTO task_search (rowid, text, summary, action_items)
+            VALUES (NEW.rowid, NEW.text, NEW.summary, NEW.action_items);
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_task_search_docs_delete AFTER DELETE ON task_search_docs
+        BEGIN
+            INSERT INTO task_search (task_search, rowid, text, summary, action_items)
+            VALUES ('delete', OLD.rowid, OLD.text, OLD.summary, OLD.action_items);
+        END
+        """
+    )
+
+
+TASK_OUTPUT_COLUMNS = {
+    "output_summary": "TEXT GENERATED ALWAYS AS "
+    "(CASE WHEN json_valid(output) THEN json_extract(output, '$.summary') END) VIRTUAL",
+    "output_action_items_count": "INTEGER GENERATED ALWAYS AS "
+    "(CASE WHEN json_valid(output) THEN json_array_length(output, '$.action_items') END) VIRTUAL",
+    "output_questions_count": "INTEGER GENERATED ALWAYS AS "
+    "(CASE WHEN json_valid(output) THEN json_array_length(output, '$.questions') END) VIRTUAL",
+}
+
+
+def add_task_output_columns(conn: sqlite3.Connection) -> None:
+    # Virtual columns cost nothing to store and are computed only when a query names them, so
+    # views that need the summary or counts never load and parse the output blob in Python.
+    columns = {row["name"] for row in conn.execute("PRAGMA table_xinfo(tasks)").fetchall()}
+    for name, ddl in TASK_OUTPUT_COLUMNS.items():
+        if name not in columns:
+            conn.execute(f"ALTER TABLE tasks ADD COLUMN {name} {ddl}")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tasks_output_action_items_count ON tasks(output_action_items_count)"
+    )
+
+
+# Same test as trg_tasks_output_inline: does this row hold a digest rather than a full output?
+OUTPUT_IS_DIGEST = (
+    "(CASE WHEN json_valid({row}.output) THEN json_extract({row}.output, '$.truncated') IS 1 ELSE 0 END) = 1"
+)
+
+
+def index_full_task_outputs(conn: sqlite3.Connection) -> None:
+    # A digest clips summary and action items, so the update trigger must not rebuild a digest
+    # row's search doc from tasks.output; it only carries id and text over, and write_search_doc
+    # fills in the rest from the full output. New rows never hold a digest, so the insert
+    # trigger stays. The doc is then the one uncompressed copy of that text, read by search and
+    # output_summary alike.
+    conn.execute("DROP TRIGGER IF EXISTS trg_tasks_search_update")
+    conn.execute(
+        f"""
+        CREATE TRIGGER trg_tasks_search_update AFTER UPDATE OF id, text, output ON tasks
+        WHEN NOT {OUTPUT_IS_DIGEST.format(row='NEW')}
+        BEGIN
+            DELETE FROM task_search_docs WHERE task_id = OLD.id;
+            INSERT INTO task_search_docs (task_id, text, summary, action_items)
+            VALUES (NEW.id, {TASK_SEARCH_DOC_VALUES.format(row='NEW')});
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_search_update_digest AFTER UPDATE OF id, text, output ON tasks
+        WHEN {OUTPUT_IS_DIGEST.format(row='NEW')}
+        BEGIN
+            UPDATE task_search_docs SET task_id = NEW.id, text = NEW.text WHERE task_id = OLD.id;
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_task_search_docs_update AFTER UPDATE ON task_search_docs
+        BEGIN
+            INSERT INTO task_search (task_search, rowid, text, summary, action_items)
+            VALUES ('delete', OLD.rowid, OLD.text, OLD.summary, OLD.action_items);
+            INSERT INTO task_search (rowid, text, summary, action_items)
+            VALUES (NEW.rowid, NEW.text, NEW.summary, NEW.action_items);
+        END
+        """
+    )
+    for row in conn.execute("SELECT task_id FROM task_outputs").fetchall():
+        write_search_doc(conn, row["task_id"], load_task_output(conn, row["task_id"]))
+
+
+# Append only: a released step never changes, a schema change is a new step with the next version.
+# Every step must also be safe on a database that already has its objects, because databases
+# created before schema_version existed start at version 0.
+MIGRATIONS: list[Migration] = [
+    Migration(1, "create_tasks", create_tasks_table),
+    Migration(2, "normalize_tasks", normalize_tasks),
+    Migration(3, "task_indexes", create_task_indexes),
+    Migration(4, "task_changes", init_task_changes),
+    Migration(5, "task_jobs", create_task_jobs),
+    Migration(6, "llm_cache", init_llm_cache),
+    Migration(7, "telegram_outbox", init_outbox),
+    Migration(8, "task_events", create_task_events),
+    Migration(9, "task_child_counts", create_task_child_counts),
+    Migration(10, "task_escalations", init_task_escalations),
+    Migration(11, "task_event_keyset_indexes", create_task_event_keyset_indexes),
+    Migration(12, "task_search", create_task_search),
+    Migration(13, "task_output_columns", add_task_output_columns),
+    Migration(14, "task_outputs", init_task_outputs),
+    Migration(15, "task_output_search_text", index_full_task_outputs),
+]
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT MAX(version) AS version FROM schema_version").fetchone()
+    return int(row["version"] or 0)
+
+
+def apply_migrations(conn: sqlite3.Connection, migrations: list[Migration] = MIGRATIONS) -> list[str]:
+    """Bring the database up to the newest migration; returns the names of the steps applied.
+
+    When the schema is current this is one indexed lookup, so startup cost does not grow
+    with the size of the tasks table.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.commit()
+    latest = migrations[-1].version if migrations else 0
+    if schema_version(conn) >= latest:
+        return []
+
+    applied: list[str] = []
+    for migration in migrations:
+        # Each step commits with its version row, under a write lock taken before re-checking,
+        # so two processes starting together cannot both apply it.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if schema_version(conn) >= migration.version:
+                conn.rollback()
+                continue
+            migration.apply(conn)
+            conn.execute(
+                "INSERT INTO schema_version (version, name, applied_at) VALUES (?, ?, ?)",
+                (migration.version, migration.name, datetime.now(timezone.utc).isoformat()),
+            )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        applied.append(migration.name)
+    return applied
@@ -0,0 +1,152 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+
+DEFAULT_MODEL_ROUTES = [
+    {"name": "qwen2.5:7b-instruct", "url": "http://localhost:11434/api/generate"},
+]
+ROUTER_WINDOW = 200
+ROUTER_MIN_SAMPLES = 10
+ROUTER_MIN_VALIDITY = float(os.getenv("AXIMO_ROUTER_MIN_VALIDITY", "0.6"))
+ROUTER_COOLDOWN_SECONDS = float(os.getenv("AXIMO_ROUTER_COOLDOWN_SECONDS", "30"))
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    name: str
+    url: str
+    task_types: tuple[str, ...] = ("*",)
+    # Longest prompt (in characters) this model should take; None means no limit.
+    max_input_chars: int | None = None
+    # Skip this route while its rolling p95 latency is above the budget.
+    p95_budget_seconds: float | None = None
+
+    def serves(self, task_type: str) -> bool:
+        return "*" in self.task_types or task_type in self.task_types
+
+
+@dataclass
+class _RouteStats:
+    latencies: deque = field(default_factory=lambda: deque(maxlen=ROUTER_WINDOW))
+    validity: deque = field(default_factory=lambda: deque(maxlen=ROUTER_WINDOW))
+    errors: int = 0
+    unavailable_until: float = 0.0
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[int(q * (len(sorted_values) - 1))]
+
+
+def load_routes_from_env() -> list[ModelRoute]:
+    """Read AXIMO_MODEL_ROUTES, a JSON list of route objects, e.g.
+
+    [{"name": "qwen2.5:3b-instruct", "url": "http://localhost:11434/api/generate", "max_input_chars": 4000},
+     {"name": "qwen2.5:7b-instruct", "url": "http://localhost:11434/api/generate"}]
+    """
+    raw = os.getenv("AXIMO_MODEL_ROUTES", "").strip()
+    items = json.loads(raw) if raw else DEFAULT_MODEL_ROUTES
+    routes = []
+    for item in items:
+        routes.append(
+            ModelRoute(
+                name=item["name"],
+                url=item["url"],
+                task_types=tuple(item.get("task_types") or ("*",)),
+                max_input_chars=item.get("max_input_chars"),
+                p95_budget_seconds=item.get("p95_budget_seconds"),
+            )
+        )
+    if not routes:
+        raise ValueError("AXIMO_MODEL_ROUTES must list at least one route")
+    return routes
+
+
+class ModelRouter:
+    """Pick the smallest configured model that fits the input and is currently healthy.
+
+    Candidates for a task type are ordered by ``max_input_chars`` (unbounded last),
+    so short inputs land on the fast model and long threads on the large one. A
+    candidate is passed over while it is in cooldown after a connection failure,
+    while its rolling JSON-validity rate is below ``min_validity`` or while its
+    rolling p95 latency exceeds its budget; the largest candidate is the last resort.
+    """
+
+    def __init__(self, routes: list[ModelRoute], min_validity: float = ROUTER_MIN_VALIDITY) -> None:
+        self.routes = list(routes)
+        self.min_validity = min_validity
+        self._lock = threading.Lock()
+        self._stats: dict[str, _RouteStats] = {route.name: _RouteStats() for route in self.routes}
+
+    def candidates(self, task_type: str, input_chars: int) -> list[ModelRoute]:
+        fitting = [
+            route
+            for route in self.routes
+            if route.serves(task_type) and (route.max_input_chars is None or input_chars <= route.max_input_chars)
+        ]
+        if not fitting:
+            fitting = [route for route in self.routes if route.serves(task_type)] or list(self.routes)
+        return sorted(fitting, key=lambda r: (r.max_input_chars is None, r.max_input_chars or 0))
+
+    def choose(self, task_type: str, input_chars: int) -> ModelRoute:
+        candidates = self.candidates(task_type, input_chars)
+        now = time.monotonic()
+        with self._lock:
+            for route in candidates:
+                if self._healthy(route, now):
+                    return route
+        return candidates[-1]
+
+    def _healthy(self, route: ModelRoute, now: float) -> bool:
+        stats = self._stats[route.name]
+        if stats.unavailable_until > now:
+            return False
+        if len(stats.validity) >= ROUTER_MIN_SAMPLES:
+            if sum(stats.validity) / len(stats.validity) < self.min_validity:
+                return False
+        if route.p95_budget_seconds is not None and len(stats.latencies) >= ROUTER_MIN_SAMPLES:
+            if _percentile(sorted(stats.latencies), 0.95) > route.p95_budget_seconds:
+                return False
+        return True
+
+    def record_latency(self, route: ModelRoute, latency_seconds: float) -> None:
+        with self._lock:
+            self._stats[route.name].latencies.append(latency_seconds)
+
+    def record_validity(self, route: ModelRoute, valid: bool) -> None:
+        with self._lock:
+            self._stats[route.name].validity.append(1 if valid else 0)
+
+    def mark_unavailable(self, route: ModelRoute) -> None:
+        with self._lock:
+            stats = self._stats[route.name]
+            stats.errors += 1
+            stats.unavailable_until = time.monotonic() + ROUTER_COOLDOWN_SECONDS
+
+    def stats(self) -> list[dict]:
+        now = time.monotonic()
+        out = []
+        with self._lock:
+            for route in self.routes:
+                stats = self._stats[route.name]
+                latencies = sorted(stats.latencies)
+                out.append(
+                    {
+                        "name": route.name,
+                        "url": route.url,
+                        "task_types": list(route.task_types),
+                        "max_input_chars": route.max_input_chars,
+                        "samples": len(latencies),
+                        "latency_p50_seconds": _percentile(latencies, 0.5),
+                        "latency_p95_seconds": _percentile(latencies, 0.95),
+                        "validity_rate": (sum(stats.validity) / len(stats.validity)) if stats.validity else None,
+                        "errors": stats.errors,
+                        "available": stats.unavailable_until <= now,
+                    }
+                )
+        return out
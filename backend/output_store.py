@@ -0,0 +1,138 @@
+import json
+import os
+import sqlite3
+import zlib
+
+OUTPUT_INLINE_MAX_BYTES = int(os.getenv("AXIMO_OUTPUT_INLINE_MAX_BYTES", "2048"))
+OUTPUT_DIGEST_TEXT_CHARS = 280
+OUTPUT_DIGEST_ITEM_CHARS = 120
+OUTPUT_CODEC = "zlib"
+
+
+def init_task_outputs(conn: sqlite3.Connection) -> None:
+    # Full copies of outputs too large to keep inline. tasks.output then holds a short digest
+    # marked "truncated" (same keys, clipped strings, every list entry), which keeps the
+    # generated output_*_count columns exact without reading this table.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS task_outputs (
+            task_id TEXT PRIMARY KEY,
+            codec TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            data BLOB NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_output_delete AFTER DELETE ON tasks
+        BEGIN
+            DELETE FROM task_outputs WHERE task_id = OLD.id;
+        END
+        """
+    )
+    # Any writer that puts a full output back inline drops the stored copy with it.
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_output_inline AFTER UPDATE OF output ON tasks
+        WHEN (CASE WHEN json_valid(NEW.output) THEN json_extract(NEW.output, '$.truncated') IS 1 ELSE 0 END) = 0
+        BEGIN
+            DELETE FROM task_outputs WHERE task_id = NEW.id;
+        END
+        """
+    )
+    rows = conn.execute(
+        "SELECT id, output FROM tasks WHERE length(output) > ? AND json_valid(output)",
+        (OUTPUT_INLINE_MAX_BYTES,),
+    ).fetchall()
+    for row in rows:
+        output = json.loads(row["output"])
+        if isinstance(output, dict):
+            encoded = row["output"].encode("utf-8")
+            conn.execute(
+                "INSERT OR REPLACE INTO task_outputs (task_id, codec, size, data) VALUES (?, ?, ?, ?)",
+                (row["id"], OUTPUT_CODEC, len(encoded), zlib.compress(encoded, 6)),
+            )
+            conn.execute("UPDATE tasks SET output = ? WHERE id = ?", (json.dumps(output_digest(output)), row["id"]))
+
+
+def write_search_doc(conn: sqlite3.Connection, task_id: str, output: dict | None) -> None:
+    """Index the full text of an offloaded output; call after the tasks row is written.
+
+    The search triggers index the digest row's text only, and inline outputs need nothing here.
+    """
+    conn.execute(
+        """
+        UPDATE task_search_docs SET summary = ?, action_items = ?
+        WHERE task_id = ? AND EXISTS (SELECT 1 FROM task_outputs WHERE task_id = ?)
+        """,
+        (*output_search_text(output), task_id, task_id),
+    )
+
+
+def clip(value: str, limit: int) -> str:
+    return value if len(value) <= limit else value[: limit - 1] + "…"
+
+
+def output_digest(output: dict) -> dict:
+    digest: dict = {}
+    for key, value in output.items():
+        if isinstance(value, str):
+            digest[key] = clip(value, OUTPUT_DIGEST_TEXT_CHARS)
+        elif isinstance(value, list):
+            # Every entry is kept so json_array_length counts stay exact.
+            digest[key] = [clip(item, OUTPUT_DIGEST_ITEM_CHARS) if isinstance(item, str) else None for item in value]
+        elif value is None or isinstance(value, (bool, int, float)):
+            digest[key] = value
+    digest["truncated"] = True
+    return digest
+
+
+def output_search_text(output: dict | None) -> tuple[str | None, str | None]:
+    """The summary and newline-joined action items, as TASK_SEARCH_DOC_VALUES extracts them."""
+    if not isinstance(output, dict):
+        return None, None
+    summary = output.get("summary")
+    items = output.get("action_items")
+    action_items = None
+    if isinstance(items, list):
+        values = [item if isinstance(item, str) else json.dumps(item) for item in items if item is not None]
+        action_items = "\n".join(values) if values else None
+    return (summary if isinstance(summary, str) else None), action_items
+
+
+def is_output_digest(output: dict | None) -> bool:
+    return isinstance(output, dict) and output.get("truncated") is True
+
+
+def store_task_output(conn: sqlite3.Connection, task_id: str, output: dict | None) -> str | None:
+    """Return the value to write to tasks.output, moving a large output into task_outputs.
+
+    The caller writes the returned text and then calls write_search_doc in the same transaction;
+    small outputs stay inline and the update trigger removes any copy left from an earlier large
+    output.
+    """
+    if output is None:
+        return None
+    raw = json.dumps(output)
+    encoded = raw.encode("utf-8")
+    if len(encoded) <= OUTPUT_INLINE_MAX_BYTES:
+        return raw
+    conn.execute(
+        "INSERT OR REPLACE INTO task_outputs (task_id, codec, size, data) VALUES (?, ?, ?, ?)",
+        (task_id, OUTPUT_CODEC, len(encoded), zlib.compress(encoded, 6)),
+    )
+    return json.dumps(output_digest(output))
+
+
+def decode_task_output(codec: str, data: bytes) -> dict:
+    if codec != OUTPUT_CODEC:
+        raise ValueError(f"unknown output codec {codec!r}")
+    return json.loads(zlib.decompress(data))
+
+
+def load_task_output(conn: sqlite3.Connection, task_id: str) -> dict | None:
+    row = conn.execute("SELECT codec, data FROM task_outputs WHERE task_id = ?", (task_id,)).fetchone()
+    if row is None:
+        return None
+    return decode_task_output(row["codec"], row["data"])
@@ -0,0 +1,155 @@
+import heapq
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Literal, Mapping
+
+
+HOUR_MS = 60 * 60 * 1000
+DUE_SOON_MS = 24 * HOUR_MS
+UPCOMING_MS = 72 * HOUR_MS
+PRIORITY_FACTORS = {"high": 2.0, "medium": 1.0, "low": 0.5}
+# Statuses that still carry pressure worth acting on; done/rejected tasks keep scoring by due date.
+OPEN_STATUSES = ("pending_approval", "approved")
+
+
+def parse_due_date(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    value = value.strip()
+    # A bare YYYY-MM-DD is due at the end of that day (UTC).
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            y, m, d = map(int, value.split("-"))
+            return datetime(y, m, d, 23, 59, 59, 999000, tzinfo=timezone.utc)
+        except Exception:
+            return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
+    except Exception:
+        return None
+
+
+def normalize_priority(priority: str | None) -> Literal["low", "medium", "high"]:
+    if priority in ("low", "medium", "high"):
+        return priority
+    return "medium"
+
+
+def clamp_weight(weight: float | None) -> float:
+    if weight is None:
+        return 1.0
+    try:
+        value = float(weight)
+    except Exception:
+        return 1.0
+    if value < 0.1:
+        return 0.1
+    if value > 10.0:
+        return 10.0
+    return value
+
+
+def compute_time_score(due: datetime | None, now: datetime) -> int:
+    if due is None:
+        return 0
+    now_ms = int(now.timestamp() * 1000)
+    due_ms = int(due.timestamp() * 1000)
+
+    if due_ms < now_ms:
+        return min(999, 100 + ((now_ms - due_ms + HOUR_MS - 1) // HOUR_MS))
+    if now_ms <= due_ms < now_ms + DUE_SOON_MS:
+        return min(999, 50 + ((DUE_SOON_MS - (due_ms - now_ms) + HOUR_MS - 1) // HOUR_MS))
+    if now_ms + DUE_SOON_MS <= due_ms < now_ms + UPCOMING_MS:
+        return min(999, 10 + ((UPCOMING_MS - (due_ms - now_ms) + HOUR_MS - 1) // HOUR_MS))
+    return 0
+
+
+def next_score_change_ms(due: datetime | None, now: datetime) -> int | None:
+    """Earliest epoch ms after ``now`` at which compute_time_score(due, t) can differ.
+
+    Every step of the score (hour ticks and the 0/24h/72h bucket edges alike) happens
+    1 ms after ``now - due`` reaches a whole number of hours. Returns None when the
+    score can never change again: no due date, or overdue and capped at 999.
+    """
+    if due is None:
+        return None
+    now_ms = int(now.timestamp() * 1000)
+    due_ms = int(due.timestamp() * 1000)
+    if due_ms - now_ms >= UPCOMING_MS:
+        return due_ms - UPCOMING_MS + 1
+    if compute_time_score(due, now) >= 999:
+        return None
+    hours = (now_ms - due_ms - 1) // HOUR_MS + 1
+    return due_ms + hours * HOUR_MS + 1
+
+
+def time_bucket(due: datetime | None, now: datetime) -> str:
+    if due is None:
+        return "no_due"
+    remaining_ms = int(due.timestamp() * 1000) - int(now.timestamp() * 1000)
+    if remaining_ms < 0:
+        return "overdue"
+    if remaining_ms < DUE_SOON_MS:
+        return "due_soon"
+    if remaining_ms < UPCOMING_MS:
+        return "upcoming"
+    return "no_due"
+
+
+def compute_p2(priority: str, weight: float, time_score: int) -> int:
+    base = clamp_weight(weight) * PRIORITY_FACTORS.get(priority, 1.0)
+    p2 = int((base * time_score + 0.999999))  # ceil-ish
+    if p2 < 0:
+        return 0
+    if p2 > 999:
+        return 999
+    return p2
+
+
+def pressure_due_cutoff(now: datetime) -> str:
+    """Upper bound for a ``due_date < ?`` prefilter: nothing at or past it can score.
+
+    Only tasks due within 72h (or overdue) have a non-zero time score. Comparing on a
+    date two days past that window keeps the bound safe for any UTC offset stored in
+    due_date while still letting SQLite use the due_date index.
+    """
+    return (now.astimezone(timezone.utc) + timedelta(hours=72) + timedelta(days=2)).strftime("%Y-%m-%d")
+
+
+def score_task(row: Mapping[str, Any], now: datetime) -> dict:
+    due = parse_due_date(row["due_date"])
+    priority = normalize_priority(row["priority"])
+    weight = clamp_weight(row["weight"])
+    time_score = compute_time_score(due, now)
+    return {
+        "time_score": time_score,
+        "p2": compute_p2(priority, weight, time_score),
+        "bucket": time_bucket(due, now),
+    }
+
+
+def rank_pressure(
+    rows: Iterable[Mapping[str, Any]],
+    now: datetime,
+    top: int,
+    statuses: set[str] | None = None,
+) -> tuple[list[tuple[Mapping[str, Any], dict]], dict[str, int]]:
+    """Score rows once; return the ``top`` highest-p2 rows and the p2 total per status.
+
+    Rows with p2 == 0 are dropped; ``statuses`` limits which rows may enter the top list
+    but not the totals. Ties keep the input order, as ``sorted(..., reverse=True)`` would,
+    so callers control tie-breaking through their ORDER BY.
+    """
+    scored = []
+    totals: dict[str, int] = {}
+    for row in rows:
+        score = score_task(row, now)
+        if score["p2"] <= 0:
+            continue
+        status = row["status"]
+        totals[status] = totals.get(status, 0) + score["p2"]
+        if statuses is None or status in statuses:
+            scored.append((row, score))
+    return heapq.nlargest(top, scored, key=lambda item: item[1]["p2"]), totals
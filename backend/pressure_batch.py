@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import Any, Iterable, Mapping, NamedTuple
+
+import numpy as np
+
+from pressure import DUE_SOON_MS, HOUR_MS, PRIORITY_FACTORS, UPCOMING_MS, clamp_weight, normalize_priority, parse_due_date
+
+
+class PressureColumns(NamedTuple):
+    """Task fields as parallel arrays; tasks without a parseable due date have has_due False."""
+
+    ids: list[str]
+    statuses: np.ndarray
+    due_ms: np.ndarray
+    has_due: np.ndarray
+    base: np.ndarray
+
+
+def load_columns(rows: Iterable[Mapping[str, Any]]) -> PressureColumns:
+    # Each row is parsed once here; scoring against any number of timestamps is then array math.
+    ids: list[str] = []
+    statuses: list[str] = []
+    due_ms: list[int] = []
+    has_due: list[bool] = []
+    base: list[float] = []
+    for row in rows:
+        due = parse_due_date(row["due_date"])
+        ids.append(row["id"])
+        statuses.append(row["status"])
+        due_ms.append(int(due.timestamp() * 1000) if due is not None else 0)
+        has_due.append(due is not None)
+        base.append(clamp_weight(row["weight"]) * PRIORITY_FACTORS[normalize_priority(row["priority"])])
+    return PressureColumns(
+        ids=ids,
+        statuses=np.array(statuses, dtype=object),
+        due_ms=np.array(due_ms, dtype=np.int64),
+        has_due=np.array(has_due, dtype=bool),
+        base=np.array(base, dtype=np.float64),
+    )
+
+
+def time_scores(due_ms: np.ndarray, has_due: np.ndarray, now_ms: np.ndarray) -> np.ndarray:
+    """compute_time_score for every (timestamp, task) pair; shape (len(now_ms), len(due_ms))."""
+    now = np.asarray(now_ms, dtype=np.int64)[:, None]
+    due = due_ms[None, :]
+    remaining = due - now
+    overdue = 100 + (now - due + HOUR_MS - 1) // HOUR_MS
+    due_soon = 50 + (DUE_SOON_MS - remaining + HOUR_MS - 1) // HOUR_MS
+    upcoming = 10 + (UPCOMING_MS - remaining + HOUR_MS - 1) // HOUR_MS
+    scores = np.select(
+        [remaining < 0, remaining < DUE_SOON_MS, remaining < UPCOMING_MS],
+        [overdue, due_soon, upcoming],
+        default=0,
+    )
+    return np.where(has_due[None, :], np.minimum(scores, 999), 0)
+
+
+def p2_scores(base: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    """compute_p2 over a score matrix; float64 math and truncation match the scalar version."""
+    return np.clip(np.trunc(base[None, :] * scores + 0.999999), 0, 999).astype(np.int64)
+
+
+def score_columns(columns: PressureColumns, as_of: list[datetime]) -> tuple[np.ndarray, np.ndarray]:
+    now_ms = np.array([int(ts.timestamp() * 1000) for ts in as_of], dtype=np.int64)
+    scores = time_scores(columns.due_ms, columns.has_due, now_ms)
+    return scores, p2_scores(columns.base, scores)
+
+
+def totals_by_status(columns: PressureColumns, p2: np.ndarray) -> dict[str, list[int]]:
+    """Per-status p2 sums for each timestamp row of ``p2``."""
+    return {
+        status: p2[:, columns.statuses == status].sum(axis=1).tolist()
+        for status in dict.fromkeys(columns.statuses.tolist())
+    }
@@ -0,0 +1,75 @@
+import asyncio
+import json
+import threading
+from typing import AsyncIterator
+
+
+STREAM_QUEUE_SIZE = 256
+STREAM_HEARTBEAT_SECONDS = 15.0
+
+
+class _Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        self.dropped = False
+
+    def offer(self, message: str | None) -> None:
+        # Runs on the subscriber's event loop.
+        if self.dropped:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # A client this far behind resyncs through /tasks/changes after reconnecting.
+            self.dropped = True
+            self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class TaskEventBroadcaster:
+    """Fan out task change events from request threads to open SSE streams."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: set[_Subscriber] = set()
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def publish(self, event_type: str, payload: dict) -> None:
+        message = f"event: {event_type}\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n"
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for sub in subscribers:
+            try:
+                sub.loop.call_soon_threadsafe(sub.offer, message)
+            except RuntimeError:
+                # Loop already closed; the stream generator will never unsubscribe itself.
+                with self._lock:
+                    self._subscribers.discard(sub)
+
+    async def stream(self, is_disconnected) -> AsyncIterator[str]:
+        sub = _Subscriber(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.add(sub)
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(sub.queue.get(), timeout=STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await is_disconnected():
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is None:
+                    return
+                yield message
+        finally:
+            with self._lock:
+                self._subscribers.discard(sub)
+
+
+task_events = TaskEventBroadcaster()
@@ -1,7 +1,12 @@
+import http.client
 import json
 import os
+import sqlite3
+import threading
+import time
 import urllib.error
 import urllib.request
+from typing import Callable, ContextManager
 
 
 def send_telegram(text: str, chat_id: str | int | None = None, reply_markup: dict | None = None) -> int | None:
@@ -35,3 +40,220 @@ def send_telegram(text: str, chat_id: str | int | None = None, reply_markup: dic
     except Exception as e:
         print(f"TELEGRAM notify failed: {repr(e)}")
         return None
+
+
+OUTBOX_BATCH_SIZE = 20
+OUTBOX_POLL_SECONDS = 2.0
+OUTBOX_MAX_ATTEMPTS = 8
+OUTBOX_RETENTION_SECONDS = 7 * 24 * 60 * 60
+# Telegram allows roughly one message per second per chat and ~30 per second overall.
+OUTBOX_PER_CHAT_INTERVAL_SECONDS = 1.0
+OUTBOX_GLOBAL_INTERVAL_SECONDS = 1.0 / 25
+
+
+def init_outbox(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS telegram_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            chat_id TEXT NULL,
+            text TEXT NOT NULL,
+            reply_markup TEXT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL,
+            created_at REAL NOT NULL,
+            sent_at REAL NULL,
+            last_error TEXT NULL
+        )
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_telegram_outbox_pending ON telegram_outbox(status, next_attempt_at)"
+    )
+
+
+def enqueue_telegram(
+    conn: sqlite3.Connection,
+    text: str,
+    chat_id: str | int | None = None,
+    reply_markup: dict | None = None,
+) -> None:
+    now = time.time()
+    conn.execute(
+        """
+        INSERT INTO telegram_outbox (chat_id, text, reply_markup, status, next_attempt_at, created_at)
+        VALUES (?, ?, ?, 'pending', ?, ?)
+        """,
+        (
+            str(chat_id).strip() if chat_id is not None else None,
+            text,
+            json.dumps(reply_markup) if reply_markup is not None else None,
+            now,
+            now,
+        ),
+    )
+
+
+class TelegramOutboxSender:
+    """Background thread that drains telegram_outbox over one kept-alive HTTPS connection.
+
+    ``connect`` must return a context manager yielding a sqlite3 connection that
+    commits on exit (the backend passes its pooled writer).
+    """
+
+    def __init__(self, connect: Callable[[], ContextManager[sqlite3.Connection]]) -> None:
+        self._connect = connect
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._http: http.client.HTTPSConnection | None = None
+        self._last_sent_at = 0.0
+        self._chat_last_sent_at: dict[str, float] = {}
+        self._last_prune_at = 0.0
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="telegram-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._close_http()
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                drained = self.drain_once()
+            except Exception as e:
+                print(f"TELEGRAM outbox error: {repr(e)}")
+                drained = 0
+            if drained < OUTBOX_BATCH_SIZE:
+                self._wake.wait(OUTBOX_POLL_SECONDS)
+                self._wake.clear()
+
+    def drain_once(self) -> int:
+        now = time.time()
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, chat_id, text, reply_markup, attempts FROM telegram_outbox
+                WHERE status = 'pending' AND next_attempt_at <= ?
+                ORDER BY id
+                LIMIT ?
+                """,
+                (now, OUTBOX_BATCH_SIZE),
+            ).fetchall()
+            if now - self._last_prune_at > 3600:
+                conn.execute(
+                    "DELETE FROM telegram_outbox WHERE status != 'pending' AND created_at < ?",
+                    (now - OUTBOX_RETENTION_SECONDS,),
+                )
+                self._last_prune_at = now
+
+        token = os.getenv("TELEGRAM_BOT_TOKEN", "").strip()
+        default_chat_id = os.getenv("TELEGRAM_CHAT_ID", "").strip()
+        for row in rows:
+            if self._stop.is_set():
+                break
+            chat_id = row["chat_id"] or default_chat_id
+            if not token or not chat_id:
+                print("TELEGRAM notify skipped: missing TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID")
+                self._finish(row["id"], "skipped", "missing TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID")
+                continue
+            self._pace(chat_id)
+            status, retry_after, error = self._post(token, chat_id, row["text"], row["reply_markup"])
+            self._chat_last_sent_at[chat_id] = self._last_sent_at = time.monotonic()
+            if status == 200:
+                self._finish(row["id"], "sent", None)
+            elif status is not None and 400 <= status < 500 and status != 429:
+                # Bad request / forbidden will not succeed on retry.
+                print(f"TELEGRAM notify failed: status={status} body={error}")
+                self._finish(row["id"], "failed", f"status={status} {error}")
+            else:
+                self._retry(row["id"], row["attempts"] + 1, retry_after, f"status={status} {error}")
+        return len(rows)
+
+    def _pace(self, chat_id: str) -> None:
+        now = time.monotonic()
+        wait = max(
+            self._last_sent_at + OUTBOX_GLOBAL_INTERVAL_SECONDS - now,
+            self._chat_last_sent_at.get(chat_id, 0.0) + OUTBOX_PER_CHAT_INTERVAL_SECONDS - now,
+        )
+        if wait > 0:
+            self._stop.wait(wait)
+
+    def _post(self, token: str, chat_id: str, text: str, reply_markup: str | None) -> tuple[int | None, float | None, str]:
+        payload: dict = {"chat_id": chat_id, "text": text}
+        if reply_markup is not None:
+            payload["reply_markup"] = json.loads(reply_markup)
+        body = json.dumps(payload).encode("utf-8")
+        for attempt in range(2):
+            try:
+                if self._http is None:
+                    self._http = http.client.HTTPSConnection("api.telegram.org", timeout=10)
+                self._http.request(
+                    "POST",
+                    f"/bot{token}/sendMessage",
+                    body=body,
+                    headers={"Content-Type": "application/json"},
+                )
+            except (http.client.HTTPException, OSError) as e:
+                # Failed before the request was fully sent (typically a kept-alive connection
+                # the server already closed), so Telegram cannot have acted on it; reconnect once.
+                self._close_http()
+                if attempt == 0:
+                    continue
+                return None, None, repr(e)[:200]
+            try:
+                resp = self._http.getresponse()
+                raw = resp.read().decode("utf-8", errors="replace")
+            except (http.client.HTTPException, OSError) as e:
+                # The message may have been delivered; leave the retry to the outbox backoff.
+                self._close_http()
+                return None, None, repr(e)[:200]
+            retry_after = None
+            if resp.status == 429:
+                try:
+                    retry_after = float(json.loads(raw).get("parameters", {}).get("retry_after"))
+                except Exception:
+                    retry_after = None
+            return resp.status, retry_after, raw[:200]
+        return None, None, "unreachable"
+
+    def _close_http(self) -> None:
+        if self._http is not None:
+            try:
+                self._http.close()
+            finally:
+                self._http = None
+
+    def _finish(self, outbox_id: int, status: str, error: str | None) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE telegram_outbox SET status = ?, sent_at = ?, last_error = ? WHERE id = ?",
+                (status, time.time() if status == "sent" else None, error, outbox_id),
+            )
+
+    def _retry(self, outbox_id: int, attempts: int, retry_after: float | None, error: str) -> None:
+        if attempts >= OUTBOX_MAX_ATTEMPTS:
+            print(f"TELEGRAM notify gave up after {attempts} attempts: {error}")
+            self._finish(outbox_id, "failed", error)
+            return
+        delay = retry_after if retry_after is not None else min(300.0, 2.0 ** attempts)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE telegram_outbox SET attempts = ?, next_attempt_at = ?, last_error = ?
+                WHERE id = ?
+                """,
+                (attempts, time.time() + delay, error, outbox_id),
+            )
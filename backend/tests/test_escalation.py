@@ -0,0 +1,142 @@
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import escalation
+from escalation import EscalationScheduler
+from migrations import apply_migrations
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "aximo.db"
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    apply_migrations(conn)
+    conn.close()
+    return path
+
+
+def open_db(path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def add_task(path, task_id: str, due_in: timedelta, status: str = "approved") -> None:
+    now = datetime.now(timezone.utc)
+    with open_db(path) as conn:
+        conn.execute(
+            "INSERT INTO tasks (id, text, type, status, created_at, due_date) VALUES (?, ?, 'internal_generate', ?, ?, ?)",
+            (task_id, f"task {task_id}", status, now.isoformat(), (now + due_in).isoformat()),
+        )
+
+
+class Notifier:
+    def __init__(self, fail: int = 0) -> None:
+        self.fail = fail
+        self.fired: list[tuple[str, str]] = []
+
+    def __call__(self, conn, escalations) -> None:
+        if self.fail:
+            self.fail -= 1
+            raise RuntimeError("outbox unavailable")
+        self.fired.extend((item.task_id, item.level) for item in escalations)
+
+
+def scheduler(path, on_fire, connect=None) -> EscalationScheduler:
+    @contextmanager
+    def write():
+        conn = open_db(path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def read():
+        conn = open_db(path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    result = EscalationScheduler(connect or write, read, on_fire)
+    result.load()
+    return result
+
+
+def recorded(path) -> list[tuple[str, str]]:
+    with open_db(path) as conn:
+        return [tuple(row) for row in conn.execute("SELECT task_id, level FROM task_escalations ORDER BY task_id, level")]
+
+
+def test_highest_level_crossed_fires_once(db_path):
+    add_task(db_path, "late", -timedelta(hours=1))
+    add_task(db_path, "soon", timedelta(hours=1))
+    add_task(db_path, "later", timedelta(days=3))
+    add_task(db_path, "closed", -timedelta(hours=1), status="done")
+    notifier = Notifier()
+    first = scheduler(db_path, notifier)
+
+    fired = first.fire_due()
+    assert sorted((item.task_id, item.level) for item in fired) == [("late", "overdue"), ("soon", "due_soon")]
+    assert recorded(db_path) == [("late", "due_soon"), ("late", "overdue"), ("soon", "due_soon")]
+    assert first.fire_due() == []
+
+    # A restart reloads every open task, but what was already announced is not sent again.
+    assert scheduler(db_path, notifier).fire_due() == []
+    assert len(notifier.fired) == 2
+
+
+def test_crossing_fires_when_its_time_comes(db_path, monkeypatch):
+    add_task(db_path, "soon", timedelta(hours=1))
+    notifier = Notifier()
+    runner = scheduler(db_path, notifier)
+    assert [item.level for item in runner.fire_due()] == ["due_soon"]
+
+    later = escalation.time.time() + 2 * 3600
+    monkeypatch.setattr(escalation.time, "time", lambda: later)
+    assert [item.level for item in runner.fire_due()] == ["overdue"]
+    assert notifier.fired == [("soon", "due_soon"), ("soon", "overdue")]
+
+
+def test_failed_notification_is_retried_on_the_next_pass(db_path):
+    add_task(db_path, "late", -timedelta(hours=1))
+    notifier = Notifier(fail=1)
+    runner = scheduler(db_path, notifier)
+
+    with pytest.raises(RuntimeError):
+        runner.fire_due()
+    assert recorded(db_path) == []
+    assert len(runner) == 1
+
+    assert [item.task_id for item in runner.fire_due()] == ["late"]
+    assert notifier.fired == [("late", "overdue")]
+
+
+def test_failed_connection_is_retried_on_the_next_pass(db_path):
+    add_task(db_path, "late", -timedelta(hours=1))
+    notifier = Notifier()
+    attempts = []
+
+    @contextmanager
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        conn = open_db(db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    runner = scheduler(db_path, notifier, connect=flaky)
+    with pytest.raises(sqlite3.OperationalError):
+        runner.fire_due()
+    assert [item.task_id for item in runner.fire_due()] == ["late"]
+    assert notifier.fired == [("late", "overdue")]
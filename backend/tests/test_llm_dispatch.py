@@ -0,0 +1,154 @@
+import asyncio
+import math
+import threading
+import time
+
+import pytest
+
+from llm_dispatch import LLMDispatcher, LLMQueueTimeout, _Flight
+
+
+class Model:
+    """A generate function that blocks until released, recording the prompts it was given."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.prompts: list[str] = []
+
+    def __call__(self, prompt, *_):
+        self.prompts.append(prompt)
+        assert self.release.wait(5)
+        return f"out:{prompt}"
+
+
+def wait_until(check, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not check():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+def in_thread(fn, *args, **kwargs) -> dict:
+    outcome: dict = {}
+
+    def run() -> None:
+        try:
+            outcome["result"] = fn(*args, **kwargs)
+        except BaseException as e:
+            outcome["error"] = e
+
+    outcome["thread"] = threading.Thread(target=run, daemon=True)
+    outcome["thread"].start()
+    return outcome
+
+
+def busy_dispatcher() -> tuple[LLMDispatcher, Model, dict]:
+    # One slot, held by a generation of "busy" until the model is released.
+    model = Model()
+    dispatcher = LLMDispatcher(model, max_in_flight=1, queue_timeout=5)
+    busy = in_thread(dispatcher.generate, "busy")
+    wait_until(lambda: model.prompts == ["busy"])
+    return dispatcher, model, busy
+
+
+def test_callers_of_the_same_prompt_share_one_generation():
+    dispatcher, model, busy = busy_dispatcher()
+    callers = [in_thread(dispatcher.generate, "p") for _ in range(3)]
+    wait_until(lambda: dispatcher.stats()["coalesced"] == 2)
+    model.release.set()
+    for caller in [busy, *callers]:
+        caller["thread"].join(5)
+    assert [caller["result"] for caller in callers] == ["out:p"] * 3
+    assert model.prompts == ["busy", "p"]
+
+
+def test_follower_gives_up_at_its_own_deadline():
+    dispatcher, model, busy = busy_dispatcher()
+    leader = in_thread(dispatcher.generate, "p", timeout=5)
+    wait_until(lambda: dispatcher.stats()["queue_depth"] == 1)
+    with pytest.raises(LLMQueueTimeout):
+        dispatcher.generate("p", timeout=0.05)
+    model.release.set()
+    leader["thread"].join(5)
+    assert leader["result"] == "out:p"
+
+
+def test_follower_takes_over_when_the_leader_gives_up():
+    dispatcher, model, busy = busy_dispatcher()
+    leader = in_thread(dispatcher.generate, "p", timeout=0.1)
+    wait_until(lambda: dispatcher.stats()["queue_depth"] == 1)
+    follower = in_thread(dispatcher.generate, "p", timeout=5)
+    leader["thread"].join(5)
+    assert isinstance(leader["error"], LLMQueueTimeout)
+    wait_until(lambda: dispatcher.stats()["queue_depth"] == 1)
+    model.release.set()
+    follower["thread"].join(5)
+    assert follower["result"] == "out:p"
+    assert model.prompts == ["busy", "p"]
+
+
+def test_infinite_timeout_waits_for_a_slot():
+    dispatcher, model, busy = busy_dispatcher()
+    caller = in_thread(dispatcher.generate, "p", timeout=math.inf)
+    time.sleep(0.2)
+    assert caller["thread"].is_alive()
+    model.release.set()
+    caller["thread"].join(5)
+    assert caller["result"] == "out:p"
+
+
+def test_async_callers_share_one_generation():
+    prompts: list[str] = []
+
+    async def agenerate(prompt, *_):
+        prompts.append(prompt)
+        await asyncio.sleep(0.05)
+        return f"out:{prompt}"
+
+    async def scenario() -> list[str]:
+        dispatcher = LLMDispatcher(lambda *_: "sync", agenerate=agenerate, max_in_flight=1)
+        return await asyncio.gather(*(dispatcher.agenerate("p") for _ in range(3)))
+
+    assert asyncio.run(scenario()) == ["out:p"] * 3
+    assert prompts == ["p"]
+
+
+def test_cancelled_follower_stays_cancelled_when_the_leader_starts():
+    # The leader getting its slot in the same instant must not turn the cancellation into
+    # "leader gave up, join again", which would make a cancelled caller start a generation.
+    async def scenario() -> None:
+        dispatcher = LLMDispatcher(lambda *_: "sync", agenerate=None)
+        flight = _Flight()
+        follower = asyncio.ensure_future(dispatcher._afollow(flight, None, None))
+        await asyncio.sleep(0)
+        follower.cancel()
+        flight.started.set_result(True)
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_follower_leaves_the_generation_running():
+    prompts: list[str] = []
+
+    async def scenario() -> str:
+        gate = asyncio.Event()
+
+        async def agenerate(prompt, *_):
+            prompts.append(prompt)
+            await gate.wait()
+            return f"out:{prompt}"
+
+        dispatcher = LLMDispatcher(lambda *_: "sync", agenerate=agenerate, max_in_flight=1)
+        leader = asyncio.ensure_future(dispatcher.agenerate("p"))
+        follower = asyncio.ensure_future(dispatcher.agenerate("p"))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        gate.set()
+        return await leader
+
+    assert asyncio.run(scenario()) == "out:p"
+    assert prompts == ["p"]
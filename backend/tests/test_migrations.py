@@ -0,0 +1,141 @@
+import json
+import sqlite3
+
+import pytest
+
+from migrations import MIGRATIONS, apply_migrations, schema_version
+from output_store import is_output_digest, load_task_output
+
+# The tasks table as init_db left it before schema_version existed; the first form is from
+# before the ALTER TABLE probes added the planning and approval columns.
+OLDEST_TASKS_TABLE = """
+    CREATE TABLE tasks (
+        id TEXT PRIMARY KEY,
+        text TEXT NOT NULL,
+        type TEXT NOT NULL,
+        status TEXT NOT NULL,
+        parent_id TEXT NULL,
+        created_at TEXT NOT NULL,
+        output TEXT NULL,
+        ran_at TEXT NULL
+    )
+"""
+PRE_SERIES_TASKS_TABLE = """
+    CREATE TABLE tasks (
+        id TEXT PRIMARY KEY,
+        text TEXT NOT NULL,
+        type TEXT NOT NULL,
+        status TEXT NOT NULL,
+        parent_id TEXT NULL,
+        created_at TEXT NOT NULL,
+        output TEXT NULL,
+        ran_at TEXT NULL,
+        due_date TEXT NULL,
+        owner TEXT NULL,
+        priority TEXT NOT NULL DEFAULT 'medium',
+        weight REAL NOT NULL DEFAULT 1.0,
+        approved_at TEXT NULL,
+        approved_by TEXT NULL,
+        rejected_at TEXT NULL,
+        rejected_by TEXT NULL,
+        reject_reason TEXT NULL
+    )
+"""
+OUTPUT = {"summary": "weekly sync", "action_items": ["send notes", "book room"], "questions": []}
+
+
+def connect(path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+@pytest.fixture
+def pre_series_db(tmp_path):
+    conn = connect(tmp_path / "aximo.db")
+    conn.execute(PRE_SERIES_TASKS_TABLE)
+    conn.executemany(
+        """
+        INSERT INTO tasks (id, text, type, status, parent_id, created_at, output, ran_at, priority, weight)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            ("t1", "plan the sync", "internal_generate", "approved", None, "2025-01-01T00:00:00+00:00",
+             json.dumps(OUTPUT), "2025-01-02T00:00:00+00:00", "urgent", 50.0),
+            ("t2", "send notes", "internal_generate", "pending_approval", "t1", "2025-01-02T00:00:00+00:00",
+             None, None, "low", 0.01),
+        ],
+    )
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def test_pre_series_database_migrates_to_latest(pre_series_db):
+    conn = pre_series_db
+    assert apply_migrations(conn) == [migration.name for migration in MIGRATIONS]
+    assert schema_version(conn) == MIGRATIONS[-1].version
+
+    rows = {row["id"]: row for row in conn.execute("SELECT * FROM tasks").fetchall()}
+    assert rows["t1"]["priority"] == "medium" and rows["t1"]["weight"] == 10.0
+    assert rows["t2"]["priority"] == "low" and rows["t2"]["weight"] == 0.1
+    assert rows["t1"]["updated_at"] == "2025-01-02T00:00:00+00:00"
+    assert rows["t2"]["updated_at"] == "2025-01-02T00:00:00+00:00"
+    assert json.loads(rows["t1"]["output"]) == OUTPUT
+
+
+def test_current_database_applies_nothing(pre_series_db):
+    apply_migrations(pre_series_db)
+    assert apply_migrations(pre_series_db) == []
+
+
+def test_partial_chain_resumes_at_the_next_step(pre_series_db):
+    assert apply_migrations(pre_series_db, MIGRATIONS[:3]) == [migration.name for migration in MIGRATIONS[:3]]
+    assert apply_migrations(pre_series_db) == [migration.name for migration in MIGRATIONS[3:]]
+
+
+def test_every_step_is_safe_on_a_database_that_already_has_its_objects(pre_series_db):
+    # A database that got its schema before schema_version existed starts again at version 0.
+    conn = pre_series_db
+    apply_migrations(conn)
+    before = conn.execute("SELECT * FROM tasks ORDER BY id").fetchall()
+    conn.execute("DROP TABLE schema_version")
+    conn.commit()
+    assert apply_migrations(conn) == [migration.name for migration in MIGRATIONS]
+    assert [tuple(row) for row in conn.execute("SELECT * FROM tasks ORDER BY id")] == [tuple(row) for row in before]
+
+
+def test_columns_missing_from_the_oldest_table_are_added(tmp_path):
+    conn = connect(tmp_path / "aximo.db")
+    conn.execute(OLDEST_TASKS_TABLE)
+    conn.execute(
+        "INSERT INTO tasks (id, text, type, status, created_at) VALUES ('t1', 'x', 'internal_generate', 'approved', '2025-01-01')"
+    )
+    conn.commit()
+    apply_migrations(conn)
+    row = conn.execute("SELECT priority, weight, due_date, updated_at FROM tasks").fetchone()
+    assert tuple(row) == ("medium", 1.0, None, "2025-01-01")
+    conn.close()
+
+
+def test_large_outputs_are_offloaded_and_stay_searchable(pre_series_db):
+    conn = pre_series_db
+    big = {"summary": "long " * 1000 + "zebrafish", "action_items": ["short", "pad " * 100 + "quokka"]}
+    conn.execute("UPDATE tasks SET output = ? WHERE id = 't1'", (json.dumps(big),))
+    conn.commit()
+    apply_migrations(conn)
+
+    assert is_output_digest(json.loads(conn.execute("SELECT output FROM tasks WHERE id = 't1'").fetchone()[0]))
+    assert load_task_output(conn, "t1") == big
+    row = conn.execute(
+        "SELECT output_action_items_count, d.summary FROM tasks JOIN task_search_docs d ON d.task_id = tasks.id"
+        " WHERE tasks.id = 't1'"
+    ).fetchone()
+    assert tuple(row) == (2, big["summary"])
+    for word in ("zebrafish", "quokka", "plan"):
+        hits = conn.execute(
+            "SELECT d.task_id FROM task_search JOIN task_search_docs d ON d.rowid = task_search.rowid"
+            " WHERE task_search MATCH ?",
+            (word,),
+        ).fetchall()
+        assert [hit[0] for hit in hits] == ["t1"]
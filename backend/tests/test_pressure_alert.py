@@ -0,0 +1,70 @@
+import importlib.util
+import random
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from migrations import apply_migrations
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "telegram_pressure_alert.py"
+spec = importlib.util.spec_from_file_location("telegram_pressure_alert", SCRIPT)
+alert = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(alert)
+
+START = datetime(2025, 3, 1, 9, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "aximo.db")
+    conn.row_factory = sqlite3.Row
+    apply_migrations(conn)
+    yield conn
+    conn.close()
+
+
+def add_task(conn, task_id: str, due: datetime, priority: str = "medium", weight: float = 1.0, offset: int = 0) -> None:
+    conn.execute(
+        """
+        INSERT INTO tasks (id, text, type, status, created_at, due_date, priority, weight)
+        VALUES (?, ?, 'internal_generate', 'pending_approval', ?, ?, ?, ?)
+        """,
+        (task_id, f"task {task_id}", (START - timedelta(minutes=offset)).isoformat(), due.isoformat(), priority, weight),
+    )
+    conn.commit()
+
+
+def test_incremental_ranking_matches_a_full_rescore(conn):
+    rng = random.Random(3)
+    for i in range(40):
+        due = START + timedelta(hours=rng.randint(-48, 120), minutes=rng.randint(0, 59))
+        add_task(conn, f"t{i}", due, rng.choice(["low", "medium", "high"]), rng.choice([0.5, 1.0, 3.0]), offset=i)
+
+    state = None
+    rankings = set()
+    for hour in range(0, 96, 3):
+        now = START + timedelta(hours=hour)
+        if hour % 12 == 6:
+            conn.execute("UPDATE tasks SET status = 'approved' WHERE id = ?", (f"t{hour % 40}",))
+            conn.execute(
+                "UPDATE tasks SET due_date = ? WHERE id = ?",
+                ((now + timedelta(hours=5)).isoformat(), f"t{(hour + 7) % 40}"),
+            )
+            conn.commit()
+        top, state, _ = alert.incremental_top(conn, now, state, 5)
+        assert top == alert.full_top(conn, now, 5)
+        rankings.add(tuple(state["top"]))
+    assert len(rankings) > 5
+
+
+def test_unchanged_order_is_not_a_new_ranking(conn):
+    add_task(conn, "a", START - timedelta(hours=2), "high", 3.0)
+    add_task(conn, "b", START - timedelta(hours=1), "low", 0.5, offset=1)
+    top, state, _ = alert.incremental_top(conn, START, None, 3)
+    later, new_state, rescored = alert.incremental_top(conn, START + timedelta(hours=5), state, 3)
+
+    assert [p2 for p2, _, _ in later] != [p2 for p2, _, _ in top]
+    assert new_state["top"] == state["top"] == ["a", "b"]
+    assert rescored == 2
@@ -0,0 +1,65 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+os.environ.setdefault("AXIMO_API_TOKEN", "test-token")
+
+import main  # noqa: E402
+
+HEADERS = {"x-aximo-token": os.environ["AXIMO_API_TOKEN"]}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "DB_PATH", str(tmp_path / "aximo.db"))
+    with TestClient(main.app) as client:
+        yield client
+
+
+def create(client, text: str, **fields) -> dict:
+    response = client.post("/tasks", json={"text": text, **fields}, headers=HEADERS)
+    assert response.status_code == 200
+    return response.json()
+
+
+def pages(client, query: str) -> list[list[str]]:
+    result: list[list[str]] = []
+    cursor = None
+    while True:
+        url = f"/tasks?{query}" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url, headers=HEADERS)
+        assert response.status_code == 200
+        result.append([task["id"] for task in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return result
+        # Tasks created while paging are newer than the cursor and must not shift later pages.
+        create(client, "created while paging")
+
+
+def test_cursor_pages_cover_the_list_once_in_order(client):
+    for i in range(7):
+        create(client, f"task {i}", owner="ana" if i % 2 else "ben")
+    everything = [task["id"] for task in client.get("/tasks", headers=HEADERS).json()]
+
+    assert pages(client, "limit=3") == [everything[0:3], everything[3:6], everything[6:7]]
+
+
+def test_cursor_pages_apply_filters(client):
+    for i in range(7):
+        create(client, f"task {i}", owner="ana" if i % 2 else "ben")
+    ana = [task["id"] for task in client.get("/tasks?owner=ana", headers=HEADERS).json()]
+
+    assert len(ana) == 3
+    assert pages(client, "owner=ana&limit=2") == [ana[0:2], ana[2:3]]
+
+
+def test_invalid_cursor_is_rejected(client):
+    assert client.get("/tasks?limit=2&cursor=not-a-cursor", headers=HEADERS).status_code == 400
+
+
+def test_new_task_reports_the_updated_at_it_was_stored_with(client):
+    task = create(client, "fresh")
+    listed = client.get("/tasks", headers=HEADERS).json()[0]
+    assert task["updated_at"] == task["created_at"] == listed["updated_at"]
@@ -33,10 +33,22 @@ async function forward(req: NextRequest, pathParts: string[]) {
     // body only for non-GET/HEAD
     body: method === "GET" || method === "HEAD" ? undefined : await req.text(),
     redirect: "manual",
+    // Abort the upstream request when the browser goes away (matters for event streams)
+    signal: req.signal,
   };
 
   const upstream = await fetch(target, init);
 
+  // Event streams must be piped through as they arrive, not buffered
+  if ((upstream.headers.get("content-type") || "").startsWith("text/event-stream")) {
+    const streamHeaders = new Headers(upstream.headers);
+    streamHeaders.set("Cache-Control", "no-store");
+    return new NextResponse(upstream.body, {
+      status: upstream.status,
+      headers: streamHeaders,
+    });
+  }
+
   // Pass-through status + body
   const respBody = await upstream.arrayBuffer();
   const respHeaders = new Headers(upstream.headers);
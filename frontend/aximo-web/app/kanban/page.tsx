@@ -22,6 +22,31 @@ type Task = {
   reject_reason?: string | null;
 };
 
+// Only the columns the board renders; the backend then skips the LLM output blob entirely.
+const KANBAN_TASK_FIELDS = [
+  "text",
+  "status",
+  "parent_id",
+  "created_at",
+  "updated_at",
+  "due_date",
+  "owner",
+  "priority",
+  "weight",
+  "approved_at",
+  "approved_by",
+  "rejected_at",
+  "rejected_by",
+  "reject_reason",
+].join(",");
+
+type TaskChanges = {
+  rev: number;
+  changed: Task[];
+  deleted: string[];
+  has_more: boolean;
+};
+
 type ProxyHealthResponse = {
   ok: boolean;
   upstream_status?: number | null;
@@ -60,14 +85,33 @@ const formatCreatedAt = (value: string) => {
 };
 
 type DueSeverity = "overdue" | "due_soon" | "upcoming" | "no_due";
-type PressureComputed = {
-  timeScore: number;
-  base: number;
+type PressureScore = {
+  time_score: number;
   p2: number;
   bucket: DueSeverity;
-  dueAt: Date | null;
 };
 
+type PressureRanking = {
+  as_of: string;
+  top: Array<PressureScore & { task_id: string }>;
+  totals: Record<string, number>;
+  next_change_at: string | null;
+};
+
+// Scores come from GET /tasks/pressure; a task it does not list has no pressure.
+const NO_PRESSURE: PressureScore = { time_score: 0, p2: 0, bucket: "no_due" };
+const PRESSURE_QUERY = [
+  "top=5000",
+  "include_tasks=false",
+  "status=pending_approval",
+  "status=approved",
+  "status=rejected",
+  "status=done",
+].join("&");
+// Scores also change when tasks enter the 72h window, which next_change_at does not cover.
+const PRESSURE_MAX_REFRESH_MS = 60 * 60 * 1000;
+const STREAM_RECONNECT_MS = 5_000;
+
 const parseDateSafe = (value?: string | null): Date | null => {
   if (!value) return null;
   if (/^\d{4}-\d{2}-\d{2}$/.test(value)) {
@@ -78,32 +122,9 @@ const parseDateSafe = (value?: string | null): Date | null => {
   return Number.isNaN(dt.getTime()) ? null : dt;
 };
 
-const getDueSeverity = (task: Task): { severity: DueSeverity; rank: number; dueAt: Date | null } => {
-  const computed = computePressure(task, Date.now());
-  const rank = computed.bucket === "overdue" ? 0 : computed.bucket === "due_soon" ? 1 : computed.bucket === "upcoming" ? 2 : 3;
-  return { severity: computed.bucket, rank, dueAt: computed.dueAt };
-};
-
-const getTimeScore = (task: Task, nowMs: number): { timeScore: number; bucket: DueSeverity; dueAt: Date | null } => {
-  const dueString = task.due_date;
-  if (!dueString) return { timeScore: 0, bucket: "no_due", dueAt: null };
-
-  const dueMs = Date.parse(dueString);
-  if (Number.isNaN(dueMs)) return { timeScore: 0, bucket: "no_due", dueAt: null };
-
-  const h24 = 24 * 60 * 60 * 1000;
-  const h72 = 72 * 60 * 60 * 1000;
-  const h = 60 * 60 * 1000;
-  if (dueMs < nowMs) {
-    return { timeScore: Math.min(999, 100 + Math.ceil((nowMs - dueMs) / h)), bucket: "overdue", dueAt: new Date(dueMs) };
-  }
-  if (nowMs <= dueMs && dueMs < nowMs + h24) {
-    return { timeScore: Math.min(999, 50 + Math.ceil((h24 - (dueMs - nowMs)) / h)), bucket: "due_soon", dueAt: new Date(dueMs) };
-  }
-  if (nowMs + h24 <= dueMs && dueMs < nowMs + h72) {
-    return { timeScore: Math.min(999, 10 + Math.ceil((h72 - (dueMs - nowMs)) / h)), bucket: "upcoming", dueAt: new Date(dueMs) };
-  }
-  return { timeScore: 0, bucket: "no_due", dueAt: new Date(dueMs) };
+const getDueSeverity = (task: Task, score: PressureScore): { severity: DueSeverity; rank: number; dueAt: Date | null } => {
+  const rank = score.bucket === "overdue" ? 0 : score.bucket === "due_soon" ? 1 : score.bucket === "upcoming" ? 2 : 3;
+  return { severity: score.bucket, rank, dueAt: parseDateSafe(task.due_date) };
 };
 
 const normalizePriority = (priority?: string | null): "low" | "medium" | "high" => {
@@ -120,15 +141,6 @@ const clampWeight = (weight?: number | null): number => {
   return value;
 };
 
-const computePressure = (task: Task, nowMs: number): PressureComputed => {
-  const { timeScore, bucket, dueAt } = getTimeScore(task, nowMs);
-  const priority = normalizePriority(task.priority);
-  const priorityFactor = priority === "high" ? 2.0 : priority === "low" ? 0.5 : 1.0;
-  const base = clampWeight(task.weight) * priorityFactor;
-  const p2 = Math.min(999, Math.max(0, Math.ceil(base * timeScore)));
-  return { timeScore, base, p2, bucket, dueAt };
-};
-
 const isDoneOlderThan7Days = (task: Task, now = new Date()) => {
   if (task.status !== "done") return false;
   const ref = parseDateSafe(task.updated_at ?? task.created_at ?? task.due_date);
@@ -166,6 +178,10 @@ export default function KanbanPage() {
   const [healthHint, setHealthHint] = useState("");
   const [actionErrors, setActionErrors] = useState<Record<string, string>>({});
   const lastAlertAtRef = useRef(0);
+  const taskRevRef = useRef<number | null>(null);
+  const initialLoadRef = useRef<Promise<void> | null>(null);
+  const [pressureById, setPressureById] = useState<Map<string, PressureScore>>(new Map());
+  const pressureTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const wasBackendOkRef = useRef(true);
 
   useEffect(() => {
@@ -221,7 +237,7 @@ useEffect(() => {
     setLoading(true);
     setError("");
     try {
-      const res = await fetch("/api/proxy/tasks", {
+      const res = await fetch(`/api/proxy/tasks?fields=${KANBAN_TASK_FIELDS}`, {
         method: "GET",
         credentials: "include",
         cache: "no-store",
@@ -230,6 +246,8 @@ useEffect(() => {
         const snippet = await readErrorSnippet(res);
         throw new Error(`HTTP ${res.status}${snippet ? `: ${snippet}` : ""}`);
       }
+      const revHeader = res.headers.get("X-Tasks-Rev");
+      taskRevRef.current = revHeader != null && revHeader !== "" ? Number(revHeader) : null;
       const data: Task[] = await res.json();
       setTasks(data);
     } catch (e) {
@@ -240,8 +258,146 @@ useEffect(() => {
     }
   };
 
+  // Pull only the tasks changed since the last known revision; falls back to a full reload.
+  const syncTasks = async () => {
+    if (taskRevRef.current == null || Number.isNaN(taskRevRef.current)) {
+      await fetchTasks();
+      return;
+    }
+    try {
+      let hasMore = true;
+      while (hasMore) {
+        const res = await fetch(`/api/proxy/tasks/changes?since=${taskRevRef.current}`, {
+          method: "GET",
+          credentials: "include",
+          cache: "no-store",
+        });
+        if (!res.ok) {
+          throw new Error(`HTTP ${res.status}`);
+        }
+        const data: TaskChanges = await res.json();
+        taskRevRef.current = data.rev;
+        hasMore = data.has_more;
+        mergeTasks(data.changed, data.deleted);
+      }
+    } catch {
+      await fetchTasks();
+    }
+  };
+
+  const mergeTasks = (changed: Task[], deleted: string[]) => {
+    if (changed.length === 0 && deleted.length === 0) {
+      return;
+    }
+    const changedById = new Map(changed.map((task) => [task.id, task]));
+    const deletedIds = new Set(deleted);
+    // A stream push can arrive after a newer copy of the same row came from /tasks/changes;
+    // only a copy at least as recent replaces what the board holds.
+    const isNewer = (incoming: Task, current: Task) =>
+      !incoming.updated_at || !current.updated_at || incoming.updated_at >= current.updated_at;
+    setTasks((prev) => {
+      const existingIds = new Set(prev.map((task) => task.id));
+      const added = changed.filter((task) => !existingIds.has(task.id));
+      const kept = prev
+        .filter((task) => !deletedIds.has(task.id))
+        .map((task) => {
+          const incoming = changedById.get(task.id);
+          return incoming && isNewer(incoming, task) ? incoming : task;
+        });
+      return [...added, ...kept];
+    });
+  };
+
   useEffect(() => {
-    void fetchTasks();
+    initialLoadRef.current = fetchTasks();
+  }, []);
+
+  // Scores are refetched whenever the task set changes, and otherwise only when the backend
+  // says the next one moves.
+  const fetchPressure = async () => {
+    try {
+      const res = await fetch(`/api/proxy/tasks/pressure?${PRESSURE_QUERY}`, {
+        method: "GET",
+        credentials: "include",
+        cache: "no-store",
+      });
+      if (!res.ok) {
+        return;
+      }
+      const data: PressureRanking = await res.json();
+      setPressureById(new Map(data.top.map((entry) => [entry.task_id, entry])));
+      const nextMs = data.next_change_at ? Date.parse(data.next_change_at) : NaN;
+      const delay = Number.isNaN(nextMs)
+        ? PRESSURE_MAX_REFRESH_MS
+        : Math.min(PRESSURE_MAX_REFRESH_MS, Math.max(1_000, nextMs - Date.now()));
+      if (pressureTimerRef.current) clearTimeout(pressureTimerRef.current);
+      pressureTimerRef.current = setTimeout(() => void fetchPressure(), delay);
+    } catch {}
+  };
+
+  useEffect(() => {
+    const timer = setTimeout(() => void fetchPressure(), 300);
+    return () => clearTimeout(timer);
+  }, [tasks]);
+
+  useEffect(() => {
+    return () => {
+      if (pressureTimerRef.current) clearTimeout(pressureTimerRef.current);
+    };
+  }, []);
+
+  // Live task pushes, which also stand in for health polling: an open stream means the backend
+  // is up, and a failed one is diagnosed once through the health endpoint.
+  useEffect(() => {
+    if (typeof window === "undefined" || typeof EventSource === "undefined") {
+      void checkProxyHealth();
+      return;
+    }
+    // Asserted rather than annotated so the cleanup below is not narrowed to the initial null.
+    let source = null as EventSource | null;
+    let reconnectTimer = null as ReturnType<typeof setTimeout> | null;
+    let closed = false;
+    const onTask = (event: MessageEvent) => {
+      try {
+        const payload = JSON.parse(event.data) as { task?: Task };
+        if (payload.task) {
+          mergeTasks([payload.task], []);
+        }
+      } catch {}
+    };
+    const eventTypes = ["created", "approved", "rejected", "status_changed", "run"];
+    const connect = () => {
+      const next = new EventSource("/api/proxy/tasks/stream", { withCredentials: true });
+      source = next;
+      eventTypes.forEach((type) => next.addEventListener(type, onTask as EventListener));
+      // On every open, catch up through the delta endpoint on what was pushed while not
+      // listening; the first open waits for the initial load so it syncs from its revision.
+      next.onopen = () => {
+        setBackendOk(true);
+        setHealthHint("");
+        void (async () => {
+          await initialLoadRef.current;
+          await syncTasks();
+        })();
+      };
+      next.onerror = () => {
+        void checkProxyHealth();
+        // The browser retries on its own unless the response was an HTTP error.
+        if (next.readyState === EventSource.CLOSED && !closed) {
+          reconnectTimer = setTimeout(connect, STREAM_RECONNECT_MS);
+        }
+      };
+    };
+    connect();
+    return () => {
+      closed = true;
+      if (reconnectTimer) clearTimeout(reconnectTimer);
+      if (source) {
+        const current = source;
+        eventTypes.forEach((type) => current.removeEventListener(type, onTask as EventListener));
+        current.close();
+      }
+    };
   }, []);
 
   const handleRetry = () => {
@@ -280,14 +436,6 @@ useEffect(() => {
     }
   };
 
-  useEffect(() => {
-    void checkProxyHealth();
-    const timer = setInterval(() => {
-      void checkProxyHealth();
-    }, 30_000);
-    return () => clearInterval(timer);
-  }, []);
-
   useEffect(() => {
     const turnedRed = !backendOk && wasBackendOkRef.current;
     const now = Date.now();
@@ -322,10 +470,12 @@ useEffect(() => {
     });
   }, [tasks, archivedIds, showTestTasks]);
 
+  const pressureOf = (task: Task): PressureScore => pressureById.get(task.id) ?? NO_PRESSURE;
+
   const tasksByStatus = useMemo(() => {
     const sorter = (a: Task, b: Task) => {
-      const sa = getDueSeverity(a);
-      const sb = getDueSeverity(b);
+      const sa = getDueSeverity(a, pressureOf(a));
+      const sb = getDueSeverity(b, pressureOf(b));
       if (sa.rank !== sb.rank) return sa.rank - sb.rank;
       if (sa.dueAt && sb.dueAt) return sa.dueAt.getTime() - sb.dueAt.getTime();
       if (sa.dueAt && !sb.dueAt) return -1;
@@ -340,7 +490,15 @@ useEffect(() => {
       rejected: visibleTasks.filter((t) => t.status === "rejected").sort(sorter),
       done: visibleTasks.filter((t) => t.status === "done").sort(sorter),
     };
-  }, [visibleTasks]);
+  }, [visibleTasks, pressureById]);
+
+  const pressureTotals = useMemo(() => {
+    const totals: Record<TaskStatus, number> = { pending_approval: 0, approved: 0, rejected: 0, done: 0 };
+    for (const task of visibleTasks) {
+      totals[task.status] += pressureOf(task).p2;
+    }
+    return totals;
+  }, [visibleTasks, pressureById]);
 
   const archivedTasks = useMemo(() => {
     return tasks.filter((task) => archivedIds.has(task.id) || isDoneOlderThan7Days(task));
@@ -364,7 +522,7 @@ useEffect(() => {
         const snippet = await readErrorSnippet(res);
         throw new Error(`HTTP ${res.status}${snippet ? `: ${snippet}` : ""}`);
       }
-      await fetchTasks();
+      await syncTasks();
     } catch (e) {
       const message = e instanceof Error ? e.message : "Unknown error";
       setError(`Failed to update status: ${message}`);
@@ -383,7 +541,7 @@ useEffect(() => {
         const snippet = await readErrorSnippet(res);
         throw new Error(`HTTP ${res.status}${snippet ? `: ${snippet}` : ""}`);
       }
-      await fetchTasks();
+      await syncTasks();
     } catch (e) {
       const message = e instanceof Error ? e.message : "Unknown error";
       setActionErrors((prev) => ({ ...prev, [taskId]: `Approve failed: ${message}` }));
@@ -406,7 +564,7 @@ useEffect(() => {
         const snippet = await readErrorSnippet(res);
         throw new Error(`HTTP ${res.status}${snippet ? `: ${snippet}` : ""}`);
       }
-      await fetchTasks();
+      await syncTasks();
     } catch (e) {
       const message = e instanceof Error ? e.message : "Unknown error";
       setActionErrors((prev) => ({ ...prev, [taskId]: `Reject failed: ${message}` }));
@@ -454,10 +612,10 @@ useEffect(() => {
     const isChild = task.parent_id != null;
     const isPendingApproval = task.status === "pending_approval";
     const isApproved = task.status === "approved";
-    const due = getDueSeverity(task);
+    const pressure = pressureOf(task);
+    const due = getDueSeverity(task, pressure);
     const dueClass = dueBadgeClass(due.severity);
     const dueLabel = dueBadgeLabel(due.severity);
-    const pressure = computePressure(task, Date.now());
     const isOverdue = due.severity === "overdue";
     const priority = normalizePriority(task.priority);
     const weight = clampWeight(task.weight);
@@ -532,7 +690,7 @@ useEffect(() => {
               ) : null}
               {task.text.startsWith("[DEMO] Due Soon") ? (
                 <span className="ml-2 text-slate-400">
-                  ts:{pressure.timeScore} base:{pressure.base.toFixed(2)} p2:{pressure.p2}
+                  ts:{pressure.time_score} p2:{pressure.p2}
                 </span>
               ) : null}
             </div>
@@ -747,7 +905,7 @@ useEffect(() => {
           <div className={`grid gap-4 md:grid-cols-4 ${backendOk ? "" : "pointer-events-none opacity-70"}`}>
             {columns.map((column) => {
               const inColumn = tasksByStatus[column.key];
-              const pressureTotal = inColumn.reduce((sum, task) => sum + computePressure(task, Date.now()).p2, 0);
+              const pressureTotal = pressureTotals[column.key];
               const parents = inColumn.filter((task) => task.parent_id == null);
               const orphanChildren = inColumn.filter(
                 (task) => task.parent_id != null && !inColumn.some((candidate) => candidate.id === task.parent_id)
@@ -18,6 +18,16 @@ type Task = {
   ran_at?: string | null;
 };
 
+type RunJob = {
+  id: string;
+  task_id: string;
+  status: "queued" | "running" | "succeeded" | "failed";
+  error?: string | null;
+  task?: Task | null;
+};
+
+const JOB_POLL_INTERVAL_MS = 1000;
+
 export default function Home() {
   const [text, setText] = useState("");
   const [task, setTask] = useState<Task | null>(null);
@@ -88,8 +98,20 @@ export default function Home() {
         throw new Error(`HTTP ${res.status}`);
       }
 
-      const data: Task = await res.json();
-      setTask(data);
+      // Run is queued server-side; poll the job until the model output is committed.
+      let job: RunJob = await res.json();
+      while (job.status === "queued" || job.status === "running") {
+        await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+        const jobRes = await apiFetch(`/jobs/${job.id}`);
+        if (!jobRes.ok) {
+          throw new Error(`HTTP ${jobRes.status}`);
+        }
+        job = await jobRes.json();
+      }
+      if (job.status === "failed" || !job.task) {
+        throw new Error(job.error || "job failed");
+      }
+      setTask(job.task);
     } catch (e) {
       const message = e instanceof Error ? e.message : "Unknown error";
       setError(`Run failed: ${message}`);
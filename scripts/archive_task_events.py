@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from event_archive import (  # noqa: E402
+    EVENT_ARCHIVE_DIR,
+    EVENT_ARCHIVE_KEEP_MONTHS,
+    archive_events,
+    read_archived_events,
+)
+
+
+DB_PATH = "/Users/albertkim/02_PROJECTS/03_aximo/backend/aximo.db"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Roll old task_events into per-month gzip files.")
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--archive-dir", type=Path, default=EVENT_ARCHIVE_DIR)
+    parser.add_argument("--keep-months", type=int, default=EVENT_ARCHIVE_KEEP_MONTHS)
+    parser.add_argument("--read", metavar="YYYY-MM", help="print an archived month as JSON lines instead")
+    parser.add_argument("--task", help="with --read, only events for this task id")
+    args = parser.parse_args()
+
+    if args.read:
+        for event in read_archived_events(args.archive_dir, args.read, args.task):
+            print(json.dumps(event, ensure_ascii=False))
+        return 0
+
+    with sqlite3.connect(args.db, timeout=30) as conn:
+        archived = archive_events(conn, args.archive_dir, args.keep_months)
+    for month, count in archived.items():
+        print(f"{month}: archived {count} events")
+    if not archived:
+        print("nothing to archive")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
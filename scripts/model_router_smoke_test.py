@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+
+# Two stub "models" behind a local HTTP server standing in for Ollama's /api/generate.
+STUB_PORT = int(os.getenv("STUB_OLLAMA_PORT", "18434"))
+STUB_URL = f"http://127.0.0.1:{STUB_PORT}/api/generate"
+VALID = json.dumps(
+    {"summary": "stub summary", "action_items": ["a", "b", "c"], "questions": ["q1", "q2"]}
+)
+
+os.environ["AXIMO_LLM_CACHE"] = "0"
+os.environ["AXIMO_MODEL_ROUTES"] = json.dumps(
+    [
+        {"name": "stub-small", "url": STUB_URL, "max_input_chars": 1000},
+        {"name": "stub-large", "url": STUB_URL},
+    ]
+)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+import main  # noqa: E402
+
+
+class StubState:
+    small_valid = True
+    calls: list[str] = []
+
+
+class StubOllamaHandler(BaseHTTPRequestHandler):
+    def log_message(self, format: str, *args) -> None:
+        return
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+        model = body.get("model")
+        StubState.calls.append(model)
+        if model == "stub-small":
+            time.sleep(0.01)
+            text = VALID if StubState.small_valid else "not json at all"
+        else:
+            time.sleep(0.1)
+            text = VALID
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        try:
+            if body.get("stream"):
+                for i in range(0, len(text), 16):
+                    self.wfile.write((json.dumps({"response": text[i:i + 16], "done": False}) + "\n").encode("utf-8"))
+                self.wfile.write((json.dumps({"response": "", "done": True}) + "\n").encode("utf-8"))
+            else:
+                self.wfile.write(json.dumps({"response": text, "done": True}).encode("utf-8"))
+        except (BrokenPipeError, ConnectionResetError):
+            # The backend hangs up early once streamed output goes off-schema.
+            return
+
+
+def print_routes(label: str) -> None:
+    print(label)
+    for route in main.model_router.stats():
+        print(
+            f"  {route['name']}: samples={route['samples']} "
+            f"p50={route['latency_p50_seconds']:.3f}s p95={route['latency_p95_seconds']:.3f}s "
+            f"validity={route['validity_rate']} available={route['available']}"
+        )
+
+
+def summarize(text: str) -> str:
+    StubState.calls.clear()
+    main.call_ollama_structured(main.build_summary_prompt(text, action_items_count=3, questions_count=2))
+    return ",".join(StubState.calls)
+
+
+def main_() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", STUB_PORT), StubOllamaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        print("=== SHORT INPUT ===")
+        print(f"models={summarize('short note')}")
+        print("=== LONG INPUT ===")
+        print(f"models={summarize('long thread ' * 200)}")
+
+        print("=== SMALL MODEL EMITS INVALID JSON ===")
+        StubState.small_valid = False
+        for _ in range(6):
+            summarize("short note")
+        print(f"next short input models={summarize('short note')}")
+        print_routes("routes:")
+
+        print("=== SMALL MODEL ENDPOINT DOWN ===")
+        StubState.small_valid = True
+        main.model_router = main.ModelRouter(
+            [
+                main.ModelRoute(name="stub-small", url="http://127.0.0.1:9/api/generate", max_input_chars=1000),
+                main.ModelRoute(name="stub-large", url=STUB_URL),
+            ]
+        )
+        print(f"models={summarize('another short note')}")
+        print_routes("routes:")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main_()
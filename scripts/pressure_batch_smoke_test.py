@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import random
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from pressure import score_task  # noqa: E402
+from pressure_batch import load_columns, score_columns  # noqa: E402
+
+TASKS = 2000
+STEP_MINUTES = 30
+
+
+def random_rows(now: datetime) -> list[dict]:
+    rng = random.Random(7)
+    rows = []
+    for i in range(TASKS):
+        due = now + timedelta(milliseconds=rng.randint(-10**9, 10**9))
+        rows.append(
+            {
+                "id": f"t{i}",
+                "status": rng.choice(["pending_approval", "approved", "done"]),
+                "due_date": rng.choice(
+                    [
+                        due.isoformat(),
+                        due.strftime("%Y-%m-%d"),
+                        due.astimezone(timezone(timedelta(hours=-7))).isoformat(),
+                        None,
+                        "not a date",
+                    ]
+                ),
+                "priority": rng.choice(["low", "medium", "high", None]),
+                "weight": rng.choice([None, 0.05, 1.0, 2.7, 3.3333, 12.0]),
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    now = datetime.now(timezone.utc)
+    rows = random_rows(now)
+    as_of = [now + timedelta(minutes=m) for m in range(0, 72 * 60 + 1, STEP_MINUTES)]
+
+    started = time.perf_counter()
+    scores, p2 = score_columns(load_columns(rows), as_of)
+    batch_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    mismatches = 0
+    for i, ts in enumerate(as_of):
+        for j, row in enumerate(rows):
+            expected = score_task(row, ts)
+            if expected["time_score"] != scores[i, j] or expected["p2"] != p2[i, j]:
+                mismatches += 1
+    scalar_seconds = time.perf_counter() - started
+
+    print(f"{TASKS} tasks x {len(as_of)} timestamps")
+    print(f"batch  {batch_seconds * 1000:8.1f} ms")
+    print(f"scalar {scalar_seconds * 1000:8.1f} ms")
+    if mismatches:
+        raise SystemExit(f"FAIL: {mismatches} scores differ from compute_time_score/compute_p2")
+    print("OK: batch scores match the scalar functions exactly")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ import re
 import urllib.request
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
 
 BASE = "http://127.0.0.1:8000"
 
@@ -24,7 +25,7 @@ def read_aximo_token() -> str:
     return token
 
 
-def post_json(path: str, payload: dict, token: str) -> tuple[int, dict]:
+def post_json(path: str, payload: dict, token: str) -> tuple[int, Any]:
     req = urllib.request.Request(
         f"{BASE}{path}",
         data=json.dumps(payload).encode("utf-8"),
@@ -55,13 +56,19 @@ def main() -> None:
         ("[DEMO] Done old (10d ago)", iso(now - timedelta(days=10)), True),
     ]
 
-    for title, due_date, mark_done in seed_defs:
-        create_status, created = post_json(
-            "/tasks",
-            {"text": title, "type": "internal_generate", "due_date": due_date},
-            token,
-        )
-        task_id = str(created.get("id", ""))
+    create_status, created = post_json(
+        "/tasks:batch",
+        {
+            "tasks": [
+                {"text": title, "type": "internal_generate", "due_date": due_date}
+                for title, due_date, _ in seed_defs
+            ]
+        },
+        token,
+    )
+
+    for (title, _, mark_done), task in zip(seed_defs, created):
+        task_id = str(task.get("id", ""))
         print(f"create status={create_status} id={task_id[:8]} title={title}")
 
         if mark_done and task_id:
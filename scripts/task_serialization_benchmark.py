@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import sqlite3
+import sys
+import time
+
+os.environ.setdefault("AXIMO_API_TOKEN", "benchmark")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from pydantic import TypeAdapter  # noqa: E402
+
+import main  # noqa: E402
+from main import Task, clamp_weight, normalize_priority  # noqa: E402
+
+ROWS = int(os.getenv("BENCH_ROWS", "5000"))
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "5"))
+TASK_LIST = TypeAdapter(list[Task])
+
+
+def legacy_row_to_task(row: sqlite3.Row) -> Task:
+    # row_to_task as it was before the column-index reader.
+    output = None
+    if row["output"] is not None:
+        output = json.loads(row["output"])
+    return Task(
+        id=row["id"],
+        text=row["text"],
+        type=row["type"],
+        status=row["status"],
+        parent_id=row["parent_id"],
+        created_at=row["created_at"],
+        output=output,
+        ran_at=row["ran_at"],
+        due_date=row["due_date"],
+        owner=row["owner"] if "owner" in row.keys() else None,
+        priority=normalize_priority(row["priority"] if "priority" in row.keys() else None),
+        weight=clamp_weight(row["weight"] if "weight" in row.keys() else None),
+        approved_at=row["approved_at"] if "approved_at" in row.keys() else None,
+        approved_by=row["approved_by"] if "approved_by" in row.keys() else None,
+        rejected_at=row["rejected_at"] if "rejected_at" in row.keys() else None,
+        rejected_by=row["rejected_by"] if "rejected_by" in row.keys() else None,
+        reject_reason=row["reject_reason"] if "reject_reason" in row.keys() else None,
+        updated_at=row["updated_at"] if "updated_at" in row.keys() else None,
+    )
+
+
+def legacy_body(rows: list[sqlite3.Row]) -> bytes:
+    # Build Task models, then let the response model re-validate and serialize them.
+    tasks = [legacy_row_to_task(row) for row in rows]
+    return TASK_LIST.dump_json(TASK_LIST.validate_python(tasks))
+
+
+def fast_body(rows: list[sqlite3.Row]) -> bytes:
+    return main.FastJSONResponse(main.rows_to_task_dicts(rows)).body
+
+
+def seed(conn: sqlite3.Connection) -> None:
+    conn.execute(f"CREATE TABLE tasks ({', '.join(main.TASK_FIELDS)})")
+    for i in range(ROWS):
+        task = Task(
+            id=f"task-{i:06d}",
+            text=f"Follow up on meeting item {i}",
+            type="internal_generate",
+            status="approved" if i % 3 else "pending_approval",
+            created_at=f"2026-01-01T00:00:{i % 60:02d}+00:00",
+            output={"summary": "s", "action_items": ["a", "b", "c"], "questions": ["q1", "q2"]} if i % 2 else None,
+            owner="admin",
+            priority="high" if i % 5 == 0 else "medium",
+            weight=1.5,
+        )
+        conn.execute(main.TASK_INSERT_SQL, main.task_to_db_values(task))
+
+
+def measure(label: str, fn, rows: list[sqlite3.Row]) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - started)
+    per_row_us = best / len(rows) * 1e6
+    print(f"{label:<8} {best * 1000:8.1f} ms total  {per_row_us:6.2f} us/row")
+    return per_row_us
+
+
+def run() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    seed(conn)
+    rows = conn.execute("SELECT * FROM tasks ORDER BY created_at DESC, id DESC").fetchall()
+
+    if json.loads(legacy_body(rows)) != json.loads(fast_body(rows)):
+        raise SystemExit("fast path output differs from the validated path")
+
+    print(f"{len(rows)} rows, best of {ROUNDS}")
+    before = measure("before", legacy_body, rows)
+    after = measure("after", fast_body, rows)
+    print(f"speedup  {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    run()
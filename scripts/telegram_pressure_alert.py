@@ -1,82 +1,28 @@
 #!/usr/bin/env python3
+import argparse
+import heapq
 import os
 import json
 import sqlite3
+import sys
 from datetime import datetime, timezone
-from typing import Optional, Tuple
+from pathlib import Path
 
 import urllib.request
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
 
-DB_PATH = "/Users/albertkim/02_PROJECTS/03_aximo/backend/aximo.db"
-
+from pressure import (  # noqa: E402
+    next_score_change_ms,
+    parse_due_date,
+    pressure_due_cutoff,
+    rank_pressure,
+    score_task,
+)
 
-def parse_due_date(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    value = value.strip()
-    # Accept YYYY-MM-DD as end-of-day local-ish (match frontend behavior roughly)
-    if len(value) == 10 and value[4] == "-" and value[7] == "-":
-        try:
-            y, m, d = map(int, value.split("-"))
-            return datetime(y, m, d, 23, 59, 59, 999000, tzinfo=timezone.utc)
-        except Exception:
-            return None
-    try:
-        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
-    except Exception:
-        return None
-
-
-def clamp_weight(w: Optional[float]) -> float:
-    try:
-        v = float(w if w is not None else 1.0)
-    except Exception:
-        v = 1.0
-    if v < 0.1:
-        return 0.1
-    if v > 10.0:
-        return 10.0
-    return v
-
-
-def normalize_priority(p: Optional[str]) -> str:
-    if p in ("low", "medium", "high"):
-        return p
-    return "medium"
-
-
-def compute_time_score(due: Optional[datetime], now: datetime) -> int:
-    if due is None:
-        return 0
-    now_ms = int(now.timestamp() * 1000)
-    due_ms = int(due.timestamp() * 1000)
-
-    h = 60 * 60 * 1000
-    h24 = 24 * h
-    h72 = 72 * h
-
-    if due_ms < now_ms:
-        return min(999, 100 + ((now_ms - due_ms + h - 1) // h))
-    if now_ms <= due_ms < now_ms + h24:
-        return min(999, 50 + ((h24 - (due_ms - now_ms) + h - 1) // h))
-    if now_ms + h24 <= due_ms < now_ms + h72:
-        return min(999, 10 + ((h72 - (due_ms - now_ms) + h - 1) // h))
-    return 0
 
-
-def compute_p2(priority: str, weight: float, time_score: int) -> int:
-    priority_factor = 2.0 if priority == "high" else 0.5 if priority == "low" else 1.0
-    base = clamp_weight(weight) * priority_factor
-    p2 = int((base * time_score + 0.999999))  # ceil-ish
-    if p2 < 0:
-        return 0
-    if p2 > 999:
-        return 999
-    return p2
+DB_PATH = "/Users/albertkim/02_PROJECTS/03_aximo/backend/aximo.db"
+STATE_PATH = Path(__file__).resolve().parents[1] / "backend" / "data" / "pressure_alert_state.json"
 
 
 def send_telegram(text: str) -> None:
@@ -100,51 +46,154 @@ def send_telegram(text: str) -> None:
             raise RuntimeError(f"Telegram send failed: status={resp.getcode()} body={body[:200]}")
 
 
-def main() -> int:
-    now = datetime.now(timezone.utc)
+PENDING_COLUMNS = "id, text, status, due_date, priority, weight, created_at"
 
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.row_factory = sqlite3.Row
+
+def full_top(conn: sqlite3.Connection, now: datetime, top_n: int) -> list[tuple[int, str, str]]:
+    # Same prefilter as GET /tasks/pressure: only tasks due inside the scoring window.
+    rows = conn.execute(
+        f"""
+        SELECT {PENDING_COLUMNS}
+        FROM tasks
+        WHERE status = 'pending_approval'
+          AND due_date IS NOT NULL AND due_date != '' AND due_date < ?
+        ORDER BY created_at DESC
+        """,
+        (pressure_due_cutoff(now),),
+    ).fetchall()
+    ranked, _ = rank_pressure(rows, now, top_n)
+    return [(score["p2"], r["id"], r["text"]) for r, score in ranked]
+
+
+def load_state(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+
+def save_state(path: Path, state: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state), encoding="utf-8")
+    tmp.replace(path)
+
+
+def tracked_entry(row: sqlite3.Row, now: datetime) -> dict:
+    return {
+        "p2": score_task(row, now)["p2"],
+        "text": row["text"],
+        "created_at": row["created_at"] or "",
+        "next_change_ms": next_score_change_ms(parse_due_date(row["due_date"]), now),
+    }
+
+
+def incremental_top(
+    conn: sqlite3.Connection, now: datetime, state: dict | None, top_n: int
+) -> tuple[list[tuple[int, str, str]], dict, int]:
+    """Update the saved snapshot and return (top, new state, rows re-scored).
+
+    Only three kinds of task are re-read: rows changed since the saved task_changes
+    revision, tracked tasks whose time score has reached its next step, and tasks
+    newly inside the due_date window.
+    """
+    head = conn.execute("SELECT COALESCE(MAX(rev), 0) FROM task_changes").fetchone()[0]
+    cutoff = pressure_due_cutoff(now)
+    window = "status = 'pending_approval' AND due_date IS NOT NULL AND due_date != '' AND due_date < ?"
+
+    if state is None or state.get("rev", 0) > head:
+        # First run, or the database was replaced: take a full snapshot.
+        tasks: dict[str, dict] = {}
+        rows = conn.execute(f"SELECT {PENDING_COLUMNS} FROM tasks WHERE {window}", (cutoff,)).fetchall()
+    else:
+        tasks = state["tasks"]
+        now_ms = int(now.timestamp() * 1000)
+        changed = [
+            row[0]
+            for row in conn.execute(
+                "SELECT task_id FROM task_changes WHERE rev > ? AND rev <= ?", (state["rev"], head)
+            ).fetchall()
+        ]
+        stepped = [
+            task_id
+            for task_id, entry in tasks.items()
+            if entry["next_change_ms"] is not None and entry["next_change_ms"] <= now_ms
+        ]
+        for task_id in changed + stepped:
+            tasks.pop(task_id, None)
         rows = conn.execute(
-            """
-            SELECT id, text, status, due_date, priority, weight
-            FROM tasks
-            WHERE status = 'pending_approval'
-            ORDER BY created_at DESC
-            """
+            f"""
+            SELECT {PENDING_COLUMNS} FROM tasks
+            WHERE id IN (SELECT value FROM json_each(?)) AND {window}
+            UNION
+            SELECT {PENDING_COLUMNS} FROM tasks
+            WHERE {window} AND due_date >= ?
+            """,
+            (json.dumps(changed + stepped), cutoff, cutoff, state["cutoff"]),
         ).fetchall()
 
-    scored = []
-    for r in rows:
-        due = parse_due_date(r["due_date"])
-        time_score = compute_time_score(due, now)
-        prio = normalize_priority(r["priority"])
-        w = float(r["weight"]) if r["weight"] is not None else 1.0
-        p2 = compute_p2(prio, w, time_score)
-        if p2 <= 0:
-            continue
-        scored.append((p2, r["id"], r["text"]))
-
-    scored.sort(key=lambda x: x[0], reverse=True)
-    top = scored[:3]
-
-    # Compose message
+    for row in rows:
+        tasks[row["id"]] = tracked_entry(row, now)
+
+    ranked = heapq.nlargest(
+        top_n,
+        ((entry["p2"], entry["created_at"], task_id) for task_id, entry in tasks.items() if entry["p2"] > 0),
+    )
+    top = [(p2, task_id, tasks[task_id]["text"]) for p2, _, task_id in ranked]
+    new_state = {
+        "rev": head,
+        "cutoff": cutoff,
+        "tasks": tasks,
+        # Only the order of ids: every score in the window steps up hourly, so comparing scores
+        # would resend an unchanged ranking several times an hour.
+        "top": [task_id for _, task_id, _ in top],
+    }
+    return top, new_state, len(rows)
+
+
+def compose_message(top: list[tuple[int, str, str]]) -> str:
     stamp = datetime.now().strftime("%H:%M")
     if not top:
-        msg = f"Execution Pressure Alert ({stamp})\n\nNo pending approvals with pressure."
+        return f"Execution Pressure Alert ({stamp})\n\nNo pending approvals with pressure."
+    lines = [f"🔥 Execution Pressure Alert ({stamp})", ""]
+    for i, (p2, tid, text) in enumerate(top, start=1):
+        short = tid[:8]
+        title = (text or "").strip().replace("\n", " ")
+        if len(title) > 80:
+            title = title[:77] + "..."
+        lines.append(f"{i}) P:{p2}  {title}  (id:{short})")
+    lines.append("")
+    lines.append("Approve or reject to reduce pressure.")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top", type=int, default=3)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="re-score only changed tasks and send only when the top-N ranking changes",
+    )
+    parser.add_argument("--state-path", type=Path, default=STATE_PATH)
+    args = parser.parse_args()
+    now = datetime.now(timezone.utc)
+
+    with sqlite3.connect(DB_PATH) as conn:
+        conn.row_factory = sqlite3.Row
+        if not args.incremental:
+            send_telegram(compose_message(full_top(conn, now, args.top)))
+            return 0
+        state = load_state(args.state_path)
+        top, new_state, rescored = incremental_top(conn, now, state, args.top)
+
+    if state is not None and new_state["top"] == state.get("top"):
+        print(f"rescored={rescored} ranking unchanged, not sending")
     else:
-        lines = [f"🔥 Execution Pressure Alert ({stamp})", ""]
-        for i, (p2, tid, text) in enumerate(top, start=1):
-            short = tid[:8]
-            title = (text or "").strip().replace("\n", " ")
-            if len(title) > 80:
-                title = title[:77] + "..."
-            lines.append(f"{i}) P:{p2}  {title}  (id:{short})")
-        lines.append("")
-        lines.append("Approve or reject to reduce pressure.")
-        msg = "\n".join(lines)
-
-    send_telegram(msg)
+        send_telegram(compose_message(top))
+        print(f"rescored={rescored} ranking changed, sent")
+    # Saved only after a successful send, so a failed send is retried on the next run.
+    save_state(args.state_path, new_state)
     return 0
 
 